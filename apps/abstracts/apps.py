@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class AbstractsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.abstracts'
+
+    def ready(self) -> None:
+        """Connect the app's signal receivers."""
+        from apps.abstracts.sqlite import apply_sqlite_pragmas
+
+        connection_created.connect(apply_sqlite_pragmas, dispatch_uid="apply_sqlite_pragmas")
@@ -0,0 +1,130 @@
+# Python modules
+from typing import Any, Optional
+from inspect import isawaitable
+
+# Django modules
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, HttpResponse
+
+# Django REST Framework modules
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.permissions import BasePermission
+from rest_framework.request import Request as DRFRequest
+from rest_framework.response import Response as DRFResponse
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView whose handlers are coroutines, dispatched on the event loop.
+
+    Under ASGI Django calls it without the sync_to_async thread hop of
+    regular DRF views. Authentication and permission classes may provide
+    coroutine counterparts, "aauthenticate", "ahas_permission" and
+    "ahas_object_permission", which are awaited; otherwise their sync
+    methods are called directly and must not do any I/O. Authentication
+    classes without "aauthenticate" run in a thread. The response is
+    rendered in dispatch and returned as a plain HttpResponse, which
+    Django does not hand to a thread to render.
+    """
+
+    async def dispatch(self, request: HttpRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> HttpResponse:
+        """Async counterpart of APIView.dispatch."""
+        self.args = args
+        self.kwargs = kwargs
+        drf_request: DRFRequest = self.initialize_request(request, *args, **kwargs)
+        self.request = drf_request
+        self.headers = self.default_response_headers
+
+        try:
+            await self.ainitial(drf_request, *args, **kwargs)
+
+            handler: Any = getattr(self, drf_request.method.lower(), None)
+            if drf_request.method.lower() not in self.http_method_names or handler is None:
+                handler = self.http_method_not_allowed
+            response: Any = handler(drf_request, *args, **kwargs)
+            if isawaitable(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(drf_request, response, *args, **kwargs)
+        return self.render_response(self.response)
+
+    def render_response(self, response: HttpResponse) -> HttpResponse:
+        """Render a DRF response into a plain HttpResponse with the same headers."""
+        if not isinstance(response, DRFResponse):
+            return response
+
+        response.render()
+        rendered: HttpResponse = HttpResponse(
+            content=response.content,
+            status=response.status_code,
+        )
+        header: str
+        value: str
+        for header, value in response.items():
+            rendered[header] = value
+        return rendered
+
+    async def ainitial(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        """Async counterpart of APIView.initial."""
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+
+        request.accepted_renderer, request.accepted_media_type = self.perform_content_negotiation(request)
+        request.version, request.versioning_scheme = self.determine_version(request, *args, **kwargs)
+
+        await self.aperform_authentication(request)
+        await self.acheck_permissions(request)
+        self.check_throttles(request)
+
+    async def aperform_authentication(self, request: DRFRequest) -> None:
+        """Authenticate the request with the first authenticator that applies."""
+        authenticator: BaseAuthentication
+        for authenticator in self.get_authenticators():
+            try:
+                if hasattr(authenticator, "aauthenticate"):
+                    user_auth: Optional[tuple[Any, Any]] = await authenticator.aauthenticate(request)
+                else:
+                    user_auth = await sync_to_async(authenticator.authenticate)(request)
+            except exceptions.APIException:
+                request._not_authenticated()
+                raise
+
+            if user_auth is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth
+                return
+
+        request._not_authenticated()
+
+    async def acheck_permissions(self, request: DRFRequest) -> None:
+        """Async counterpart of APIView.check_permissions."""
+        permission: BasePermission
+        for permission in self.get_permissions():
+            if hasattr(permission, "ahas_permission"):
+                allowed: bool = await permission.ahas_permission(request, self)
+            else:
+                allowed = permission.has_permission(request, self)
+            if not allowed:
+                self.permission_denied(
+                    request,
+                    message=getattr(permission, "message", None),
+                    code=getattr(permission, "code", None),
+                )
+
+    async def acheck_object_permissions(self, request: DRFRequest, obj: Any) -> None:
+        """Async counterpart of APIView.check_object_permissions."""
+        permission: BasePermission
+        for permission in self.get_permissions():
+            if hasattr(permission, "ahas_object_permission"):
+                allowed: bool = await permission.ahas_object_permission(request, self, obj)
+            else:
+                allowed = permission.has_object_permission(request, self, obj)
+            if not allowed:
+                self.permission_denied(
+                    request,
+                    message=getattr(permission, "message", None),
+                    code=getattr(permission, "code", None),
+                )
@@ -0,0 +1,45 @@
+# Python modules
+from typing import Any, Awaitable, Callable
+from statistics import median, quantiles
+from time import perf_counter
+import asyncio
+
+
+async def measure_concurrent(
+    send: Callable[[], Awaitable[Any]],
+    requests: int,
+    concurrency: int,
+) -> dict[str, float]:
+    """
+    Run a request coroutine many times with bounded concurrency.
+
+    Parameters:
+        send: Callable
+            Coroutine function sending one request.
+        requests: int
+            Number of requests.
+        concurrency: int
+            Requests in flight at once.
+
+    Returns:
+        dict[str, float]
+            throughput (requests/s), p50 and p95 latency (ms).
+    """
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def timed() -> None:
+        async with semaphore:
+            started: float = perf_counter()
+            await send()
+            latencies.append(perf_counter() - started)
+
+    started: float = perf_counter()
+    await asyncio.gather(*(timed() for _ in range(requests)))
+    elapsed: float = perf_counter() - started
+
+    return {
+        "throughput": requests / elapsed,
+        "p50": median(latencies) * 1000,
+        "p95": quantiles(latencies, n=20)[-1] * 1000 if len(latencies) > 1 else latencies[0] * 1000,
+    }
@@ -0,0 +1,45 @@
+# Python modules
+from typing import Hashable, Iterable
+
+
+class BloomFilter:
+    """
+    Fixed size Bloom filter over hashable keys, for one process.
+
+    Bit positions come from the key's built-in hash(), which str caches,
+    with double hashing, so a check allocates no buffers. A miss is
+    definite, a hit has to be confirmed by an exact lookup.
+    """
+
+    MASK_32 = (1 << 32) - 1
+
+    def __init__(self, bits: int, hashes: int, keys: Iterable[Hashable] = ()) -> None:
+        self.bits: int = bits
+        self.hashes: int = hashes
+        self._data: bytearray = bytearray((bits + 7) // 8)
+        key: Hashable
+        for key in keys:
+            self.add(key)
+
+    def add(self, key: Hashable) -> None:
+        """Set the bits of a key."""
+        value: int = hash(key)
+        first: int = value & self.MASK_32
+        step: int = ((value >> 32) & self.MASK_32) | 1
+        data: bytearray = self._data
+        i: int
+        for i in range(self.hashes):
+            position: int = (first + i * step) % self.bits
+            data[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: Hashable) -> bool:
+        value: int = hash(key)
+        first: int = value & self.MASK_32
+        step: int = ((value >> 32) & self.MASK_32) | 1
+        data: bytearray = self._data
+        i: int
+        for i in range(self.hashes):
+            position: int = (first + i * step) % self.bits
+            if not data[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
@@ -0,0 +1,280 @@
+# Python modules
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Optional
+from collections import OrderedDict
+from hashlib import sha1
+from threading import Lock
+from time import monotonic, sleep, time_ns
+
+# Django modules
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.db import transaction
+
+# Project modules
+from apps.abstracts.replicas import primary_reads
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe in-process cache bounded by the number of entries.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries: int = max_entries
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock: Lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value and mark it as most recently used."""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used ones over the bound."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a value if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every value."""
+        with self._lock:
+            self._data.clear()
+
+
+class ResponseCache:
+    """
+    Two tier cache for serialized read responses.
+
+    Tier one is a bounded in-process LRU, tier two is a cache backend
+    shared by every worker (CACHES alias from RESPONSE_CACHE["ALIAS"]).
+    Keys embed the current generation of each scope they depend on, so
+    bumping a scope's generation invalidates every key of that scope in
+    both tiers at once. Concurrent misses of the same key are collapsed
+    into one computation: per key lock inside the process and an add()
+    based lock across processes. Values are computed with primary reads.
+    """
+
+    GENERATION_PREFIX = "response-cache:generation:"
+    VALUE_PREFIX = "response-cache:value:"
+    LOCK_PREFIX = "response-cache:lock:"
+
+    def __init__(self) -> None:
+        self._local: Optional[LRUCache] = None
+        self._key_locks: dict[str, Lock] = {}
+        self._key_locks_guard: Lock = Lock()
+
+    @property
+    def config(self) -> dict[str, Any]:
+        """Get the RESPONSE_CACHE settings."""
+        return settings.RESPONSE_CACHE
+
+    @property
+    def shared(self) -> BaseCache:
+        """Get the shared cache backend."""
+        return caches[self.config["ALIAS"]]
+
+    @property
+    def local(self) -> LRUCache:
+        """Get the in-process LRU tier."""
+        if self._local is None:
+            self._local = LRUCache(max_entries=self.config["LOCAL_MAX_ENTRIES"])
+        return self._local
+
+    def get_generations(self, scopes: Iterable[str]) -> list[str]:
+        """
+        Get the current generation of every scope, creating missing ones.
+
+        Parameters:
+            scopes: Iterable[str]
+                Invalidation scopes.
+
+        Returns:
+            list[str]
+                Generations in the order of scopes.
+        """
+        keys: list[str] = [self.GENERATION_PREFIX + scope for scope in scopes]
+        found: dict[str, Any] = self.shared.get_many(keys)
+
+        generations: list[str] = []
+        key: str
+        for key in keys:
+            if key not in found:
+                self.shared.add(key, str(time_ns()), timeout=None)
+                found[key] = self.shared.get(key)
+            generations.append(str(found[key]))
+        return generations
+
+    async def aget_generations(self, scopes: Iterable[str]) -> list[str]:
+        """Async counterpart of get_generations, through the async cache API."""
+        keys: list[str] = [self.GENERATION_PREFIX + scope for scope in scopes]
+        found: dict[str, Any] = await self.shared.aget_many(keys)
+
+        generations: list[str] = []
+        key: str
+        for key in keys:
+            if key not in found:
+                await self.shared.aadd(key, str(time_ns()), timeout=None)
+                found[key] = await self.shared.aget(key)
+            generations.append(str(found[key]))
+        return generations
+
+    def invalidate(self, scopes: Iterable[str], using: Optional[str] = None) -> None:
+        """
+        Invalidate every cached value depending on the given scopes.
+
+        Inside a transaction the invalidation is deferred until commit,
+        so a reader can not re-cache data the transaction is replacing.
+
+        Parameters:
+            scopes: Iterable[str]
+                Invalidation scopes.
+            using: Optional[str]
+                Database alias of the transaction, default when None.
+        """
+        keys: dict[str, str] = {
+            self.GENERATION_PREFIX + scope: str(time_ns())
+            for scope in set(scopes)
+        }
+        if keys:
+            # A fresh unique value instead of incr(), which is not atomic on every backend
+            transaction.on_commit(lambda: self.shared.set_many(keys, timeout=None), using=using)
+
+    def build_key(self, endpoint: str, scopes: Iterable[str], variant: str) -> str:
+        """
+        Build a versioned cache key.
+
+        Parameters:
+            endpoint: str
+                Name of the cached endpoint.
+            scopes: Iterable[str]
+                Invalidation scopes the response depends on.
+            variant: str
+                Everything else the response depends on (e.g. full URL).
+
+        Returns:
+            str
+                Cache key.
+        """
+        scopes = list(scopes)
+        digest: str = sha1(
+            "\n".join([variant, *scopes, *self.get_generations(scopes)]).encode("utf-8")
+        ).hexdigest()
+        return f"{self.VALUE_PREFIX}{endpoint}:{digest}"
+
+    async def abuild_key(self, endpoint: str, scopes: Iterable[str], variant: str) -> str:
+        """Async counterpart of build_key."""
+        scopes = list(scopes)
+        digest: str = sha1(
+            "\n".join([variant, *scopes, *await self.aget_generations(scopes)]).encode("utf-8")
+        ).hexdigest()
+        return f"{self.VALUE_PREFIX}{endpoint}:{digest}"
+
+    def _get_key_lock(self, key: str) -> Lock:
+        """Get the in-process lock of a key."""
+        with self._key_locks_guard:
+            lock: Optional[Lock] = self._key_locks.get(key)
+            if lock is None:
+                if len(self._key_locks) >= self.config["LOCAL_MAX_ENTRIES"]:
+                    self._key_locks = {k: v for k, v in self._key_locks.items() if v.locked()}
+                lock = self._key_locks[key] = Lock()
+            return lock
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Get a cached value or compute it once and store it in both tiers.
+
+        Parameters:
+            key: str
+                Key built by build_key.
+            compute: Callable[[], Any]
+                Producer of a picklable value.
+
+        Returns:
+            Any
+                Cached or freshly computed value.
+        """
+        value: Any = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._get_key_lock(key):
+            value = self.local.get(key, _MISSING)
+            if value is _MISSING:
+                value = self._get_or_compute_shared(key, compute)
+                self.local.set(key, value)
+        return value
+
+    async def aget_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async counterpart of get_or_compute.
+
+        Concurrent misses are not collapsed: the locks of get_or_compute
+        would block the event loop, so each computes the value itself.
+
+        Parameters:
+            key: str
+                Key built by abuild_key.
+            compute: Callable[[], Awaitable[Any]]
+                Coroutine function producing a picklable value.
+
+        Returns:
+            Any
+                Cached or freshly computed value.
+        """
+        value: Any = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        value = await self.shared.aget(key, _MISSING)
+        if value is _MISSING:
+            with primary_reads():
+                value = await compute()
+            await self.shared.aset(key, value, timeout=self.config["TIMEOUT"])
+        self.local.set(key, value)
+        return value
+
+    def _get_or_compute_shared(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Get a value from the shared tier, computing it under a cross-process lock."""
+        value: Any = self.shared.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        lock_key: str = self.LOCK_PREFIX + key
+        acquired: bool = self.shared.add(lock_key, 1, timeout=self.config["LOCK_TIMEOUT"])
+        if not acquired:
+            # Another worker computes the value, wait for it a bounded time
+            deadline: float = monotonic() + self.config["LOCK_WAIT"]
+            while monotonic() < deadline:
+                sleep(self.config["LOCK_POLL_INTERVAL"])
+                value = self.shared.get(key, _MISSING)
+                if value is not _MISSING:
+                    return value
+
+        try:
+            # Entries outlive the replica lag, so they are built from the primary
+            with primary_reads():
+                value = compute()
+            self.shared.set(key, value, timeout=self.config["TIMEOUT"])
+        finally:
+            if acquired:
+                self.shared.delete(lock_key)
+        return value
+
+
+response_cache: ResponseCache = ResponseCache()
@@ -0,0 +1,82 @@
+# Python modules
+from typing import Any, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+import asyncio
+
+
+class BoundedExecutor:
+    """
+    Thread pool for CPU bound work awaited from async code.
+
+    The number of workers caps how many calls run at once; callers over
+    the cap wait in the pool queue, whose depth is kept for metrics.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "") -> None:
+        self.max_workers: int = max_workers
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=thread_name_prefix,
+        )
+        self._lock: Lock = Lock()
+        self._queued: int = 0
+        self._running: int = 0
+        self._completed: int = 0
+        self._peak_queued: int = 0
+
+    def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+    def _on_done(self, future: Future) -> None:
+        # A call cancelled while queued never reaches _call
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a function in the pool and wait for its result without blocking the loop.
+
+        Parameters:
+            func: Callable
+                CPU bound function.
+            *args: Any
+                Positional arguments of the function.
+
+        Returns:
+            Any
+                The result of the function.
+        """
+        with self._lock:
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+        future: Future = self._executor.submit(self._call, func, *args)
+        future.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(future)
+
+    def get_metrics(self) -> dict[str, int]:
+        """
+        Get a snapshot of the executor state.
+
+        Returns:
+            dict[str, int]
+                max_workers, queued (waiting for a worker), running,
+                completed and peak_queued since the process started.
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "queued": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "peak_queued": self._peak_queued,
+            }
@@ -0,0 +1,100 @@
+# Python modules
+from typing import Any, Iterator, Optional, Sequence, Type
+
+# Django modules
+from django.conf import settings
+from django.db.models import Model, QuerySet
+from django.http import StreamingHttpResponse
+
+# Django REST Framework modules
+from rest_framework.serializers import BaseSerializer
+from rest_framework.utils.encoders import JSONEncoder
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+
+def iter_ndjson(
+    queryset: QuerySet | Sequence[QuerySet],
+    serializer_class: Type[BaseSerializer],
+    chunk_size: Optional[int] = None,
+    context: Optional[dict[str, Any]] = None,
+) -> Iterator[bytes]:
+    """
+    Serialize a queryset into NDJSON lines, one chunk of rows at a time.
+
+    Rows are read with QuerySet.iterator(chunk_size=...), so previous
+    prefetch_related() calls are applied per chunk and at most one chunk
+    of model instances is alive at any moment.
+
+    Parameters:
+        queryset: QuerySet | Sequence[QuerySet]
+            Ordered queryset to export, or several exported one after the other.
+        serializer_class: Type[BaseSerializer]
+            Serializer used for every single row.
+        chunk_size: Optional[int]
+            Number of rows fetched (and prefetched) per round trip.
+        context: Optional[dict]
+            Serializer context.
+
+    Yields:
+        bytes
+            Newline terminated JSON documents of a whole chunk.
+    """
+    chunk_size = chunk_size or settings.NDJSON_EXPORT_CHUNK_SIZE
+    encoder: JSONEncoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    lines: list[str] = []
+
+    querysets: Sequence[QuerySet] = [queryset] if isinstance(queryset, QuerySet) else queryset
+
+    obj: Model
+    for queryset in querysets:
+        for obj in queryset.iterator(chunk_size=chunk_size):
+            lines.append(
+                encoder.encode(serializer_class(obj, context=context or {}).data)
+            )
+            if len(lines) >= chunk_size:
+                yield ("\n".join(lines) + "\n").encode("utf-8")
+                lines = []
+
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def ndjson_response(
+    queryset: QuerySet | Sequence[QuerySet],
+    serializer_class: Type[BaseSerializer],
+    filename: str,
+    chunk_size: Optional[int] = None,
+    context: Optional[dict[str, Any]] = None,
+) -> StreamingHttpResponse:
+    """
+    Build a streaming NDJSON attachment response for a queryset.
+
+    Parameters:
+        queryset: QuerySet | Sequence[QuerySet]
+            Ordered queryset to export, or several exported one after the other.
+        serializer_class: Type[BaseSerializer]
+            Serializer used for every single row.
+        filename: str
+            Suggested download file name.
+        chunk_size: Optional[int]
+            Number of rows fetched per round trip.
+        context: Optional[dict]
+            Serializer context.
+
+    Returns:
+        StreamingHttpResponse
+            Response streaming the serialized rows.
+    """
+    response: StreamingHttpResponse = StreamingHttpResponse(
+        streaming_content=iter_ndjson(
+            queryset=queryset,
+            serializer_class=serializer_class,
+            chunk_size=chunk_size,
+            context=context,
+        ),
+        content_type=NDJSON_CONTENT_TYPE,
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -0,0 +1,129 @@
+# Python modules
+from typing import Optional, Sequence
+import re
+
+# Django modules
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def is_fts_supported(using: str = "default") -> bool:
+    """Check whether the database supports the SQLite FTS5 indexes."""
+    return connections[using].vendor == "sqlite"
+
+
+def build_fts_schema_sql(
+    fts_table: str,
+    content_table: str,
+    columns: Sequence[str],
+    options: str = "",
+) -> tuple[str, ...]:
+    """
+    Build the DDL of an external content FTS5 index kept in sync by triggers.
+
+    Triggers cover every write path, bulk inserts, QuerySet.update() and
+    raw deletes included.
+
+    Parameters:
+        fts_table: str
+            Name of the FTS5 table.
+        content_table: str
+            Indexed table, its "id" is the FTS5 rowid.
+        columns: Sequence[str]
+            Indexed text columns.
+        options: str
+            Extra FTS5 options, e.g. "tokenize='...', prefix='2 3'".
+
+    Returns:
+        tuple[str, ...]
+            CREATE statements, all idempotent.
+    """
+    names: str = ", ".join(columns)
+    new_values: str = ", ".join(f"new.{column}" for column in columns)
+    old_values: str = ", ".join(f"old.{column}" for column in columns)
+    extra: str = f", {options}" if options else ""
+
+    return (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5("
+        f"{names}, content='{content_table}', content_rowid='id'{extra})",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {content_table} BEGIN "
+        f"INSERT INTO {fts_table}(rowid, {names}) VALUES (new.id, {new_values}); "
+        f"END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {content_table} BEGIN "
+        f"INSERT INTO {fts_table}({fts_table}, rowid, {names}) VALUES ('delete', old.id, {old_values}); "
+        f"END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF {names} ON {content_table} BEGIN "
+        f"INSERT INTO {fts_table}({fts_table}, rowid, {names}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts_table}(rowid, {names}) VALUES (new.id, {new_values}); "
+        f"END",
+    )
+
+
+def create_fts_schema(connection: BaseDatabaseWrapper, statements: Sequence[str]) -> None:
+    """Execute the statements of build_fts_schema_sql."""
+    with connection.cursor() as cursor:
+        statement: str
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def ensure_fts_triggers(using: str, fts_table: str, statements: Sequence[str]) -> None:
+    """
+    Recreate the triggers of an existing FTS5 index.
+
+    SQLite drops triggers whenever a migration rebuilds their table, so
+    apps call this after every migrate.
+
+    Parameters:
+        using: str
+            Database alias.
+        fts_table: str
+            Name of the FTS5 table, nothing happens until it exists.
+        statements: Sequence[str]
+            Statements of build_fts_schema_sql.
+    """
+    if is_fts_supported(using) and fts_table in connections[using].introspection.table_names():
+        create_fts_schema(connections[using], statements)
+
+
+def rebuild_fts_index(connection: BaseDatabaseWrapper, fts_table: str, statements: Sequence[str]) -> None:
+    """
+    Rebuild an FTS5 index from its content table and merge its segments.
+
+    Parameters:
+        connection: BaseDatabaseWrapper
+            SQLite connection.
+        fts_table: str
+            Name of the FTS5 table.
+        statements: Sequence[str]
+            Statements of build_fts_schema_sql.
+    """
+    create_fts_schema(connection, statements)
+    with connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+        cursor.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('optimize')")
+
+
+def build_match_expression(text: str) -> Optional[str]:
+    """
+    Turn user input into a safe FTS5 MATCH expression.
+
+    Every word must match, the last one as a prefix (search as you type).
+    Words are quoted, so FTS5 operators in the input are plain text.
+
+    Parameters:
+        text: str
+            Raw search input.
+
+    Returns:
+        Optional[str]
+            MATCH expression, None if the input has no words.
+    """
+    words: list[str] = WORD_RE.findall(text)
+    if not words:
+        return None
+    terms: list[str] = [f'"{word}"' for word in words]
+    terms[-1] += "*"
+    return " AND ".join(terms)
@@ -0,0 +1,174 @@
+# Python modules
+from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from random import Random
+from tempfile import TemporaryDirectory
+from threading import Event
+from time import perf_counter
+import os
+
+# Django modules
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import OperationalError, connections, transaction
+
+
+class Command(BaseCommand):
+    help = "Benchmark mixed read/write throughput of default and tuned SQLite connections"
+
+    TABLE = "benchmark_item"
+    SEED_ROWS = 10000
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command arguments."""
+        parser.add_argument(
+            "--seconds",
+            type=float,
+            default=5.0,
+            help="Duration of each run.",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=8,
+            help="Concurrent workers, each standing for a request thread.",
+        )
+        parser.add_argument(
+            "--write-ratio",
+            type=float,
+            default=0.2,
+            help="Share of requests that write.",
+        )
+
+    def __get_profiles(self, directory: str) -> dict[str, dict[str, Any]]:
+        """Database settings of the compared profiles, each on its own file."""
+        return {
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": os.path.join(directory, "default.sqlite3"),
+                "CONN_MAX_AGE": 0,
+            },
+            "tuned": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": os.path.join(directory, "tuned.sqlite3"),
+                "CONN_MAX_AGE": settings.SQLITE_CONNECTIONS["CONN_MAX_AGE"],
+                "CONN_HEALTH_CHECKS": settings.SQLITE_CONNECTIONS["CONN_HEALTH_CHECKS"],
+                "PRAGMAS": settings.SQLITE_PRAGMAS,
+            },
+        }
+
+    def __seed(self, alias: str) -> None:
+        """Create and fill the benchmark table."""
+        with connections[alias].cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE {self.TABLE} (id INTEGER PRIMARY KEY, value TEXT NOT NULL, counter INTEGER NOT NULL)"
+            )
+            cursor.executemany(
+                f"INSERT INTO {self.TABLE} (value, counter) VALUES (%s, %s)",
+                [(f"item {index}", 0) for index in range(self.SEED_ROWS)],
+            )
+        connections[alias].close()
+
+    def __request(self, alias: str, random: Random, write_ratio: float) -> None:
+        """One request: a read of a page of rows or a small write transaction."""
+        connection = connections[alias]
+        # What the request_started and request_finished signals do
+        connection.close_if_unusable_or_obsolete()
+        try:
+            row_id: int = random.randint(1, self.SEED_ROWS)
+            if random.random() < write_ratio:
+                with transaction.atomic(using=alias), connection.cursor() as cursor:
+                    cursor.execute(
+                        f"UPDATE {self.TABLE} SET counter = counter + 1 WHERE id = %s",
+                        [row_id],
+                    )
+                    cursor.execute(
+                        f"INSERT INTO {self.TABLE} (value, counter) VALUES (%s, %s)",
+                        [f"item {row_id}", 0],
+                    )
+            else:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"SELECT id, value, counter FROM {self.TABLE} WHERE id >= %s ORDER BY id LIMIT 20",
+                        [row_id],
+                    )
+                    cursor.fetchall()
+        finally:
+            connection.close_if_unusable_or_obsolete()
+
+    def __worker(self, alias: str, seed: int, write_ratio: float, stop: Event) -> tuple[int, int]:
+        """Send requests until stopped, return (completed, locked) counts."""
+        random: Random = Random(seed)
+        completed: int = 0
+        locked: int = 0
+        try:
+            while not stop.is_set():
+                try:
+                    self.__request(alias=alias, random=random, write_ratio=write_ratio)
+                    completed += 1
+                except OperationalError as error:
+                    if "locked" not in str(error):
+                        raise
+                    locked += 1
+        finally:
+            connections[alias].close()
+        return completed, locked
+
+    def __run(self, alias: str, seconds: float, threads: int, write_ratio: float) -> tuple[float, int]:
+        """Run the workers on one database, return requests/s and lock errors."""
+        stop: Event = Event()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            started: float = perf_counter()
+            futures: list = [
+                executor.submit(self.__worker, alias, seed, write_ratio, stop)
+                for seed in range(threads)
+            ]
+            stop.wait(seconds)
+            stop.set()
+            results: list[tuple[int, int]] = [future.result() for future in futures]
+            elapsed: float = perf_counter() - started
+
+        return (
+            sum(completed for completed, _ in results) / elapsed,
+            sum(locked for _, locked in results),
+        )
+
+    def handle(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        """Command entry point."""
+
+        seconds: float = kwargs["seconds"]
+        threads: int = kwargs["threads"]
+        write_ratio: float = kwargs["write_ratio"]
+
+        directory: str
+        with TemporaryDirectory() as directory:
+            profiles: dict[str, dict[str, Any]] = self.__get_profiles(directory)
+            aliases: dict[str, str] = {}
+            try:
+                name: str
+                database: dict[str, Any]
+                for name, database in profiles.items():
+                    alias: str = f"benchmark_{name}"
+                    connections.settings[alias] = connections.configure_settings(
+                        {**connections.settings, alias: database}
+                    )[alias]
+                    aliases[name] = alias
+                    self.__seed(alias)
+
+                for name, alias in aliases.items():
+                    throughput: float
+                    locked: int
+                    throughput, locked = self.__run(
+                        alias=alias,
+                        seconds=seconds,
+                        threads=threads,
+                        write_ratio=write_ratio,
+                    )
+                    self.stdout.write(
+                        f"{name:>7}: {throughput:.0f} requests/s, "
+                        f"{locked} \"database is locked\" errors"
+                    )
+            finally:
+                for alias in aliases.values():
+                    connections[alias].close()
+                    del connections.settings[alias]
@@ -0,0 +1,58 @@
+# Python modules
+from typing import Any
+import gzip
+import os
+
+# Django modules
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+# Project modules
+from apps.abstracts.openapi import get_schema_paths, render_schema
+
+
+class Command(BaseCommand):
+    help = "Generate the OpenAPI schema artifact served at api/schema/, or check it is up to date"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command arguments."""
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Fail if the files differ from a fresh build instead of writing them.",
+        )
+
+    def is_stale(self, paths: dict[str, str], schema: dict[str, bytes]) -> bool:
+        """Compare the files with a fresh build, the gzip one by its content."""
+        try:
+            with open(paths["identity"], "rb") as file:
+                if file.read() != schema["identity"]:
+                    return True
+            # Compressed bytes may differ between zlib versions
+            with gzip.open(paths["gzip"], "rb") as file:
+                return file.read() != schema["identity"]
+        except (FileNotFoundError, gzip.BadGzipFile):
+            return True
+
+    def handle(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        """Command entry point."""
+
+        if not apps.is_installed("drf_spectacular"):
+            raise CommandError("The schema is generated by drf_spectacular, run with the local settings.")
+
+        paths: dict[str, str] = get_schema_paths()
+        schema: dict[str, bytes] = render_schema()
+
+        if kwargs["check"]:
+            if self.is_stale(paths, schema):
+                raise CommandError(f"{paths['identity']} is out of date, run buildschema and commit the result.")
+            self.stdout.write(self.style.SUCCESS(f"{paths['identity']} is up to date."))
+            return
+
+        os.makedirs(os.path.dirname(paths["identity"]), exist_ok=True)
+        coding: str
+        path: str
+        for coding, path in paths.items():
+            with open(path, "wb") as file:
+                file.write(schema[coding])
+            self.stdout.write(f"Wrote {path} ({len(schema[coding])} bytes).")
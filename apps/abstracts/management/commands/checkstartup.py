@@ -0,0 +1,85 @@
+# Python modules
+from typing import Any
+
+# Django modules
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.urls import reverse
+
+# Project modules
+from apps.abstracts.startup import measure_middleware_overhead, measure_worker_imports, summarize_imports
+
+
+class Command(BaseCommand):
+    help = "Report the import time of a worker and the middleware cost per request, fail above budget"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command arguments."""
+        parser.add_argument(
+            "--max-import-ms",
+            type=int,
+            default=settings.STARTUP_BUDGET["MAX_IMPORT_MS"],
+            help="Budget of the worker import time.",
+        )
+        parser.add_argument(
+            "--max-middleware-us",
+            type=int,
+            default=settings.STARTUP_BUDGET["MAX_MIDDLEWARE_US"],
+            help="Budget of the middleware cost per request.",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=settings.STARTUP_BUDGET["MIDDLEWARE_REQUESTS"],
+            help="Requests timed with and without middleware.",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=10,
+            help="Number of packages listed by import time.",
+        )
+
+    def handle(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        """Command entry point."""
+
+        # Development tools the current settings leave out must not be imported
+        forbidden: list[str] = [app for app in settings.DEV_TOOLS_APPS if not apps.is_installed(app)]
+        try:
+            entries: list[tuple[str, int, int, int]] = measure_worker_imports(settings.SETTINGS_MODULE)
+        except RuntimeError as exc:
+            raise CommandError(str(exc))
+        imports: dict[str, Any] = summarize_imports(
+            entries=entries,
+            forbidden=forbidden,
+            top=kwargs["top"],
+        )
+        self.stdout.write(
+            f"Worker boot ({settings.SETTINGS_MODULE}): {imports['total_ms']:.1f} ms "
+            f"importing {imports['modules']} modules"
+        )
+        package: str
+        ms: float
+        for package, ms in imports["packages"]:
+            self.stdout.write(f"  {package:<30} {ms:8.1f} ms")
+
+        middleware: dict[str, float] = measure_middleware_overhead(
+            path=reverse("hello-view"),
+            requests=kwargs["requests"],
+        )
+        self.stdout.write(
+            f"Middleware ({len(settings.MIDDLEWARE)}): {middleware['overhead_us']:.1f} us per request "
+            f"({middleware['with_us']:.1f} us with, {middleware['without_us']:.1f} us without)"
+        )
+
+        errors: list[str] = []
+        if imports["forbidden"]:
+            errors.append(f"imported development tools: {', '.join(imports['forbidden'])}")
+        if imports["total_ms"] > kwargs["max_import_ms"]:
+            errors.append(f"import time above {kwargs['max_import_ms']} ms")
+        if middleware["overhead_us"] > kwargs["max_middleware_us"]:
+            errors.append(f"middleware cost above {kwargs['max_middleware_us']} us")
+        if errors:
+            raise CommandError("Startup budget exceeded: " + "; ".join(errors) + ".")
+        self.stdout.write(self.style.SUCCESS("Within the startup budget."))
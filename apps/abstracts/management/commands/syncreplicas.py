@@ -0,0 +1,34 @@
+# Python modules
+from typing import Any
+
+# Django modules
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# Project modules
+from apps.abstracts.replicas import get_replica_aliases
+
+
+class Command(BaseCommand):
+    help = "Copy the default SQLite database into every replica with the online backup API"
+
+    def handle(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        """Command entry point."""
+
+        source = connections[DEFAULT_DB_ALIAS]
+        if source.vendor != "sqlite":
+            raise CommandError("Replicas are copied with SQLite's backup API only.")
+
+        aliases: list[str] = get_replica_aliases()
+        if not aliases:
+            self.stdout.write("No replicas configured, see DATABASE_REPLICA_NAMES.")
+            return
+
+        source.ensure_connection()
+        alias: str
+        for alias in aliases:
+            target = connections[alias]
+            target.ensure_connection()
+            source.connection.backup(target.connection)
+            target.close()
+            self.stdout.write(f"Copied {source.settings_dict['NAME']} into {alias} ({target.settings_dict['NAME']}).")
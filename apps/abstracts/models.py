@@ -1,16 +1,110 @@
 # Python modules
 from typing import Any
+from datetime import datetime
 
 # from datetime import datetime, timezone
 
 # Django modules
-from django.db.models import Model, DateTimeField
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import Model, Manager, QuerySet, DateTimeField
+from django.db.models.signals import ModelSignal
 from django.utils import timezone as django_timezone
 
+# Sent after QuerySet.soft_delete() with the deleted_at value it stamped
+post_soft_delete: ModelSignal = ModelSignal(use_caching=True)
+
+
+class SoftDeleteQuerySet(QuerySet):
+    """
+    QuerySet whose delete() marks rows as deleted instead of removing them.
+    """
+
+    def soft_delete(self) -> int:
+        """
+        Mark every live row of the queryset as deleted with a single UPDATE.
+
+        Signals are not sent per row; post_soft_delete is sent once with
+        the stamped deleted_at value, so receivers can find the rows.
+
+        Returns:
+            int
+                Number of soft deleted rows.
+        """
+        deleted_at: datetime = django_timezone.now()
+        count: int = self.filter(deleted_at__isnull=True).update(deleted_at=deleted_at)
+        if count:
+            post_soft_delete.send(
+                sender=self.model,
+                deleted_at=deleted_at,
+                using=self.db,
+            )
+        return count
+
+    def delete(self) -> tuple[int, dict[str, int]]:
+        """Soft delete the rows, returning the same shape as QuerySet.delete()."""
+        count: int = self.soft_delete()
+        return count, {self.model._meta.label: count}
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+    def hard_delete(self) -> tuple[int, dict[str, int]]:
+        """Delete the rows from the database."""
+        return super().delete()
+
+    hard_delete.alters_data = True
+    hard_delete.queryset_only = True
+
+
+class SoftDeleteManager(Manager.from_queryset(SoftDeleteQuerySet)):
+    """
+    Manager returning only rows that are not soft deleted.
+    """
+
+    def get_queryset(self) -> SoftDeleteQuerySet:
+        """Get the queryset of live rows."""
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
+def delete_rows(queryset: QuerySet, using: str) -> int:
+    """
+    Delete the rows of a queryset with a single DELETE statement.
+
+    Unlike QuerySet.delete() the rows are not loaded: no signals are
+    sent and no cascades run, the caller takes care of both.
+
+    Parameters:
+        queryset: QuerySet
+            Rows to delete, filtered but not sliced.
+        using: str
+            Database alias, usually router.db_for_write(queryset.model).
+
+    Returns:
+        int
+            Number of deleted rows.
+    """
+    connection: BaseDatabaseWrapper = connections[using]
+    ids_sql: str
+    params: tuple
+    try:
+        ids_sql, params = queryset.order_by().values("pk").query.get_compiler(using=using).as_sql()
+    except EmptyResultSet:
+        # e.g. an empty "__in" list
+        return 0
+    table: str = connection.ops.quote_name(queryset.model._meta.db_table)
+    pk: str = connection.ops.quote_name(queryset.model._meta.pk.column)
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {table} WHERE {pk} IN ({ids_sql})", params)
+        return cursor.rowcount
+
 
 class AbstractBaseModel(Model):
     """
     Abstract base model with common fields.
+
+    "objects" hides soft deleted rows, "all_objects" includes them.
     """
 
     created_at = DateTimeField(
@@ -24,6 +118,9 @@ class AbstractBaseModel(Model):
         blank=True,
     )
 
+    objects = SoftDeleteManager()
+    all_objects = Manager.from_queryset(SoftDeleteQuerySet)()
+
     class Meta:
         """Meta class for AbstractBaseModel."""
 
@@ -36,3 +133,6 @@ class AbstractBaseModel(Model):
         self.deleted_at = django_timezone.now()
         self.save(update_fields=["deleted_at"])
 
+    def hard_delete(self, *args: tuple[Any, ...], **kwargs: dict[Any, Any]) -> tuple[int, dict[str, int]]:
+        """Delete the object from the database."""
+        return super().delete(*args, **kwargs)
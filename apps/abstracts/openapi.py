@@ -0,0 +1,130 @@
+# Python modules
+from typing import Any, Callable, Optional
+from hashlib import sha256
+from threading import Lock
+import gzip
+import os
+
+# Django modules
+from django.apps import apps
+from django.conf import settings
+
+OPENAPI_MEDIA_TYPE = "application/vnd.oai.openapi+json"
+
+
+class OpenApiResponse:
+    """
+    Documented response of extend_schema, converted to drf_spectacular's on use.
+
+    Lets views describe their responses without importing drf_spectacular,
+    which only the settings generating the schema install.
+    """
+
+    def __init__(self, response: Any = None, description: str = "") -> None:
+        self.response: Any = response
+        self.description: str = description
+
+
+def extend_schema(**kwargs: dict[str, Any]) -> Callable[[Any], Any]:
+    """
+    Decorate a view with drf_spectacular's extend_schema when it is installed.
+
+    Without drf_spectacular in INSTALLED_APPS nothing reads the schema
+    annotations and the view is returned untouched.
+
+    Parameters:
+        **kwargs: dict
+            Arguments of drf_spectacular.utils.extend_schema, "responses"
+            may hold OpenApiResponse values.
+
+    Returns:
+        Callable
+            Decorator.
+    """
+    if not apps.is_installed("drf_spectacular"):
+        return lambda view: view
+
+    from drf_spectacular.utils import OpenApiResponse as SpectacularResponse, extend_schema as spectacular_extend_schema
+
+    responses: Optional[Any] = kwargs.get("responses")
+    if isinstance(responses, dict):
+        kwargs["responses"] = {
+            status: SpectacularResponse(response=value.response, description=value.description)
+            if isinstance(value, OpenApiResponse) else value
+            for status, value in responses.items()
+        }
+    return spectacular_extend_schema(**kwargs)
+
+
+def get_schema_paths() -> dict[str, str]:
+    """Get the files of the schema artifact by content coding."""
+    path: str = os.path.join(settings.OPENAPI_SCHEMA_DIR, settings.OPENAPI_SCHEMA["FILENAME"])
+    return {
+        "identity": path,
+        "gzip": f"{path}.gz",
+    }
+
+
+def render_schema() -> dict[str, bytes]:
+    """
+    Generate the OpenAPI schema of every route, as written by buildschema.
+
+    Needs drf_spectacular installed, i.e. the local settings.
+
+    Returns:
+        dict[str, bytes]
+            JSON document and its gzip variant by content coding, both
+            byte for byte reproducible.
+    """
+    from drf_spectacular.generators import SchemaGenerator
+    from drf_spectacular.renderers import OpenApiJsonRenderer
+
+    content: bytes = OpenApiJsonRenderer().render(
+        SchemaGenerator().get_schema(request=None, public=True),
+        renderer_context={},
+    ) + b"\n"
+    return {
+        "identity": content,
+        # No timestamp in the header, an unchanged schema gives the same file
+        "gzip": gzip.compress(content, compresslevel=9, mtime=0),
+    }
+
+
+def build_etag(content: bytes) -> str:
+    """Get the strong ETag of a representation."""
+    return f'"{sha256(content).hexdigest()}"'
+
+
+_artifact: Optional[dict[str, tuple[bytes, str]]] = None
+_artifact_lock: Lock = Lock()
+
+
+def get_schema_artifact() -> Optional[dict[str, tuple[bytes, str]]]:
+    """
+    Get the built schema, read once per process.
+
+    Returns:
+        Optional[dict[str, tuple[bytes, str]]]
+            Content and ETag by content coding, None when the artifact
+            was not built. A missing gzip file is compressed in memory.
+    """
+    global _artifact
+    if _artifact is None:
+        with _artifact_lock:
+            if _artifact is None:
+                paths: dict[str, str] = get_schema_paths()
+                try:
+                    with open(paths["identity"], "rb") as file:
+                        content: bytes = file.read()
+                except FileNotFoundError:
+                    return None
+                try:
+                    with open(paths["gzip"], "rb") as file:
+                        compressed: bytes = file.read()
+                except FileNotFoundError:
+                    compressed = gzip.compress(content, compresslevel=9, mtime=0)
+                _artifact = {
+                    "identity": (content, build_etag(content)),
+                    "gzip": (compressed, build_etag(compressed)),
+                }
+    return _artifact
@@ -0,0 +1,382 @@
+# Python modules
+from typing import Any, Callable, Iterable, Optional, Sequence
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import date, datetime
+import json
+
+# Django modules
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Model, Q, QuerySet
+
+# Django REST Framework modules
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request as DRFRequest
+from rest_framework.response import Response as DRFResponse
+from rest_framework.status import HTTP_200_OK
+from rest_framework.utils.urls import replace_query_param
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode keyset values into an opaque cursor string.
+
+    Parameters:
+        values: Sequence
+            Values of the ordering fields of the last row on a page.
+
+    Returns:
+        str
+            URL safe cursor string.
+    """
+    prepared: list[Any] = [
+        value.isoformat() if isinstance(value, (date, datetime)) else value
+        for value in values
+    ]
+    raw: bytes = json.dumps(prepared, separators=(",", ":")).encode("utf-8")
+    return urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """
+    Decode an opaque cursor string back into keyset values.
+
+    Parameters:
+        cursor: str
+            Cursor produced by encode_cursor.
+        size: int
+            Expected number of values (one per ordering field).
+
+    Returns:
+        list
+            Keyset values.
+
+    Raises:
+        ValueError
+            If the cursor is malformed.
+    """
+    padding: str = "=" * (-len(cursor) % 4)
+    try:
+        values: Any = json.loads(urlsafe_b64decode(cursor + padding))
+    except (BinasciiError, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("Malformed cursor.") from exc
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Malformed cursor.")
+    return values
+
+
+def build_keyset_filter(ordering: Sequence[str], values: Sequence[Any]) -> Q:
+    """
+    Build the "row comes after the cursor" condition for a keyset.
+
+    For ordering ("-updated_at", "-id") and values (u, i) the result is
+    ``updated_at < u OR (updated_at = u AND id < i)``.
+
+    Parameters:
+        ordering: Sequence[str]
+            Ordering fields, all in the same direction.
+        values: Sequence
+            Cursor values, one per ordering field.
+
+    Returns:
+        Q
+            Filter condition.
+    """
+    condition: Q = Q()
+    equal_prefix: dict[str, Any] = {}
+
+    field: str
+    value: Any
+    for field, value in zip(ordering, values):
+        name: str = field.lstrip("-")
+        lookup: str = "lt" if field.startswith("-") else "gt"
+        condition |= Q(**equal_prefix, **{f"{name}__{lookup}": value})
+        equal_prefix[name] = value
+
+    return condition
+
+
+def merge_keyset_rows(
+    pages: Iterable[Sequence[Any]],
+    ordering: Sequence[str],
+    get_value: Callable[[Any, str], Any] = getattr,
+) -> list[Any]:
+    """
+    Merge pages of several sources, each ordered by the same keyset.
+
+    Parameters:
+        pages: Iterable[Sequence]
+            Rows of every source, fetched with the same cursor and limit.
+        ordering: Sequence[str]
+            Keyset ordering shared by the sources, one direction.
+        get_value: Callable
+            Reads an ordering field of a row, getattr by default.
+
+    Returns:
+        list
+            Rows of every source in keyset order.
+    """
+    fields: list[str] = [field.lstrip("-") for field in ordering]
+    return sorted(
+        (row for page in pages for row in page),
+        key=lambda row: tuple(get_value(row, field) for field in fields),
+        reverse=ordering[0].startswith("-"),
+    )
+
+
+class KeysetPaginator:
+    """
+    Opaque cursor (keyset) paginator.
+
+    Pages are fetched with ``WHERE (keyset) > (cursor) ORDER BY keyset
+    LIMIT n`` so every page costs the same as the first one. The last
+    ordering field must be unique (usually "id") and all fields must
+    share the same direction.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(
+        self,
+        ordering: Sequence[str],
+        page_size: Optional[int] = None,
+        max_page_size: Optional[int] = None,
+    ) -> None:
+        assert ordering, "KeysetPaginator requires at least one ordering field."
+        assert len({field.startswith("-") for field in ordering}) == 1, (
+            "KeysetPaginator ordering fields must share the same direction."
+        )
+        config: dict[str, int] = getattr(settings, "KEYSET_PAGINATION", {})
+
+        self.ordering: tuple[str, ...] = tuple(ordering)
+        self.page_size: int = page_size or config.get("PAGE_SIZE", 50)
+        self.max_page_size: int = max_page_size or config.get("MAX_PAGE_SIZE", 200)
+        self.request: Optional[DRFRequest] = None
+        self.next_values: Optional[list[Any]] = None
+
+    def get_page_size(self, request: DRFRequest) -> int:
+        """Get the page size requested by the client, capped by max_page_size."""
+        try:
+            requested: int = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if requested <= 0:
+            return self.page_size
+        return min(requested, self.max_page_size)
+
+    def get_cursor_values(
+        self,
+        request: DRFRequest,
+        model: Optional[type[Model]] = None,
+    ) -> Optional[list[Any]]:
+        """
+        Decode the cursor of the request.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            model: Optional[type[Model]]
+                Model of the ordering fields, when given every value is
+                converted by its field, e.g. ISO strings into datetimes.
+
+        Returns:
+            Optional[list]
+                Keyset values of the cursor, None on the first page.
+
+        Raises:
+            NotFound
+                If the cursor is malformed or holds invalid values.
+        """
+        cursor: Optional[str] = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None
+        try:
+            values: list[Any] = decode_cursor(cursor, len(self.ordering))
+            if any(value is None for value in values):
+                raise ValueError("Malformed cursor.")
+            if model is not None:
+                values = [
+                    model._meta.get_field(field.lstrip("-")).to_python(value)
+                    for field, value in zip(self.ordering, values)
+                ]
+        except (ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    def get_page_queryset(self, queryset: QuerySet, request: DRFRequest) -> QuerySet:
+        """
+        Order and filter the queryset down to the requested page plus one row.
+
+        Parameters:
+            queryset: QuerySet
+                Filtered, unordered queryset.
+            request: DRFRequest
+                The request object.
+
+        Returns:
+            QuerySet
+                Unevaluated queryset of at most page_size + 1 rows.
+        """
+        page_size: int = self.get_page_size(request)
+        values: Optional[list[Any]] = self.get_cursor_values(request, model=queryset.model)
+
+        queryset = queryset.order_by(*self.ordering)
+        if values is not None:
+            queryset = queryset.filter(build_keyset_filter(self.ordering, values))
+        return queryset[:page_size + 1]
+
+    def paginate_queryset(self, queryset: QuerySet, request: DRFRequest) -> list[Model]:
+        """
+        Fetch a single page of the queryset.
+
+        Parameters:
+            queryset: QuerySet
+                Filtered, unordered queryset.
+            request: DRFRequest
+                The request object.
+
+        Returns:
+            list
+                Objects of the requested page.
+        """
+        return self.paginate_rows(
+            rows=list(self.get_page_queryset(queryset=queryset, request=request)),
+            request=request,
+            get_value=getattr,
+        )
+
+    async def apaginate_queryset(self, queryset: QuerySet, request: DRFRequest) -> list[Model]:
+        """Async counterpart of paginate_queryset, fetching with the async ORM."""
+        return self.paginate_rows(
+            rows=[row async for row in self.get_page_queryset(queryset=queryset, request=request)],
+            request=request,
+            get_value=getattr,
+        )
+
+    def paginate_querysets(self, querysets: Sequence[QuerySet], request: DRFRequest) -> list[Model]:
+        """
+        Fetch a single page out of several querysets, e.g. one per database.
+
+        Each queryset is asked for a full page, the merged rows are cut
+        like the rows of a single queryset.
+
+        Parameters:
+            querysets: Sequence[QuerySet]
+                Filtered, unordered querysets of the same model.
+            request: DRFRequest
+                The request object.
+
+        Returns:
+            list
+                Objects of the requested page.
+        """
+        return self.paginate_rows(
+            rows=merge_keyset_rows(
+                pages=[
+                    list(self.get_page_queryset(queryset=queryset, request=request))
+                    for queryset in querysets
+                ],
+                ordering=self.ordering,
+            ),
+            request=request,
+            get_value=getattr,
+        )
+
+    async def apaginate_querysets(self, querysets: Sequence[QuerySet], request: DRFRequest) -> list[Model]:
+        """Async counterpart of paginate_querysets."""
+        return self.paginate_rows(
+            rows=merge_keyset_rows(
+                pages=[
+                    [row async for row in self.get_page_queryset(queryset=queryset, request=request)]
+                    for queryset in querysets
+                ],
+                ordering=self.ordering,
+            ),
+            request=request,
+            get_value=getattr,
+        )
+
+    def paginate_rows(
+        self,
+        rows: Sequence[Any],
+        request: DRFRequest,
+        get_value: Callable[[Any, str], Any] = getattr,
+    ) -> list[Any]:
+        """
+        Cut a page out of rows fetched with LIMIT page_size + 1.
+
+        For sources other than querysets (e.g. raw SQL) that apply the
+        cursor values themselves.
+
+        Parameters:
+            rows: Sequence
+                Ordered rows, at most page_size + 1 of them.
+            request: DRFRequest
+                The request object.
+            get_value: Callable
+                Reads an ordering field of a row, getattr by default.
+
+        Returns:
+            list
+                Rows of the requested page.
+        """
+        self.request = request
+        page_size: int = self.get_page_size(request)
+        page: list[Any] = list(rows[:page_size])
+
+        self.next_values = None
+        if len(rows) > page_size:
+            self.next_values = [
+                get_value(page[-1], field.lstrip("-"))
+                for field in self.ordering
+            ]
+        return page
+
+    def get_next_link(self) -> Optional[str]:
+        """Get the absolute URL of the next page, if any."""
+        if self.next_values is None or self.request is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            encode_cursor(self.next_values),
+        )
+
+    def get_paginated_data(self, data: list[Any]) -> dict[str, Any]:
+        """
+        Wrap serialized page data into the paginated envelope.
+
+        Parameters:
+            data: list
+                Serialized objects of the current page.
+
+        Returns:
+            dict
+                Envelope with "next" link and "results".
+        """
+        return {
+            "next": self.get_next_link(),
+            "results": data,
+        }
+
+    def get_paginated_response(self, data: list[Any]) -> DRFResponse:
+        """
+        Build the paginated response of serialized page data.
+
+        Parameters:
+            data: list
+                Serialized objects of the current page.
+
+        Returns:
+            DRFResponse
+                Response with "next" link and "results".
+        """
+        return DRFResponse(
+            data=self.get_paginated_data(data),
+            status=HTTP_200_OK
+        )
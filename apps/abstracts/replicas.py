@@ -0,0 +1,174 @@
+# Python modules
+from typing import Any, Callable, Iterator, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from itertools import count
+from time import time
+
+# Django modules
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model
+from django.http import HttpRequest, HttpResponse
+
+# Django REST Framework modules
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request as DRFRequest
+
+
+class ReadRouting:
+    """
+    Read routing state of one request, shared with the threads serving it.
+
+    Reads go to a replica only once a view allowed it and while the
+    request is not pinned to the primary. A write pins the rest of the
+    request and marks it so the middleware makes the client sticky.
+    """
+
+    def __init__(self, pinned: bool = False) -> None:
+        self.replicas_allowed: bool = False
+        self.pinned: bool = pinned
+        self.wrote: bool = False
+
+
+_routing: ContextVar[Optional[ReadRouting]] = ContextVar("read_routing", default=None)
+
+
+def get_replica_aliases() -> list[str]:
+    """Get the database aliases flagged with "REPLICA"."""
+    return [
+        alias for alias, database in settings.DATABASES.items()
+        if database.get("REPLICA")
+    ]
+
+
+def allow_replica_reads() -> None:
+    """Let the remaining reads of the current request go to a replica."""
+    state: Optional[ReadRouting] = _routing.get()
+    if state is not None:
+        state.replicas_allowed = True
+
+
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """Read from the primary inside the block, e.g. to fill long lived caches."""
+    token: Token = _routing.set(ReadRouting(pinned=True))
+    try:
+        yield
+    finally:
+        _routing.reset(token)
+
+
+class ReplicaRouter:
+    """
+    Send reads allowed by the request to the replicas, everything else to default.
+
+    Replicas are the DATABASES entries with "REPLICA": True, picked round
+    robin. They are never migrated or written to, see syncreplicas.
+    """
+
+    def __init__(self) -> None:
+        self._replicas: list[str] = get_replica_aliases()
+        self._next: Iterator[int] = count()
+
+    def db_for_read(self, model: type[Model], **hints: dict[str, Any]) -> Optional[str]:
+        """Get a replica alias when the current request allows replica reads."""
+        state: Optional[ReadRouting] = _routing.get()
+        if not self._replicas or state is None or state.pinned or not state.replicas_allowed:
+            return DEFAULT_DB_ALIAS
+        return self._replicas[next(self._next) % len(self._replicas)]
+
+    def db_for_write(self, model: type[Model], **hints: dict[str, Any]) -> Optional[str]:
+        """Write to default and pin the reads of the request to it."""
+        state: Optional[ReadRouting] = _routing.get()
+        if state is not None:
+            state.pinned = True
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: dict[str, Any]) -> Optional[bool]:
+        """Replicas hold the same rows as default."""
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, model_name: Optional[str] = None, **hints: dict[str, Any]) -> Optional[bool]:
+        """Replicas get their schema from default."""
+        if db in self._replicas:
+            return False
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Scope the read routing state to a request, keep writers on the primary.
+
+    A request that wrote sets a cookie holding the time until which the
+    client reads from the primary, DATABASE_REPLICAS["STICKY_SECONDS"]
+    ahead, so its next requests see its own writes despite replica lag.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response: Callable = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        state: ReadRouting = ReadRouting(pinned=self.is_sticky(request))
+        token: Token = _routing.set(state)
+        try:
+            response: HttpResponse = self.get_response(request)
+        finally:
+            _routing.reset(token)
+        return self.process_response(state, response)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        state: ReadRouting = ReadRouting(pinned=self.is_sticky(request))
+        token: Token = _routing.set(state)
+        try:
+            response: HttpResponse = await self.get_response(request)
+        finally:
+            _routing.reset(token)
+        return self.process_response(state, response)
+
+    def is_sticky(self, request: HttpRequest) -> bool:
+        """Check whether the client wrote within the sticky window."""
+        try:
+            return float(request.COOKIES[settings.DATABASE_REPLICAS["COOKIE_NAME"]]) > time()
+        except (KeyError, ValueError):
+            return False
+
+    def process_response(self, state: ReadRouting, response: HttpResponse) -> HttpResponse:
+        """Make a client that wrote sticky to the primary."""
+        if state.wrote:
+            sticky_seconds: int = settings.DATABASE_REPLICAS["STICKY_SECONDS"]
+            response.set_cookie(
+                settings.DATABASE_REPLICAS["COOKIE_NAME"],
+                f"{time() + sticky_seconds:.3f}",
+                max_age=sticky_seconds,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+class ReplicaReadMixin:
+    """
+    ViewSet mixin sending the reads of safe "replica_read_actions" to replicas.
+
+    Replica reads start after authentication and permission checks, which
+    stay on the primary.
+    """
+
+    replica_read_actions: tuple[str, ...] = ()
+
+    def initial(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        """Allow replica reads once the request is authenticated and permitted."""
+        super().initial(request, *args, **kwargs)
+        if request.method in SAFE_METHODS and self.action in self.replica_read_actions:
+            allow_replica_reads()
@@ -1,5 +1,13 @@
+# Python modules
+from typing import Any, Optional, Sequence
+
+# Django modules
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, Prefetch, QuerySet
+
 # Django REST Framework modules
-from rest_framework.serializers import ModelSerializer
+from rest_framework.request import Request as DRFRequest
+from rest_framework.serializers import Field, ModelSerializer, Serializer, ValidationError
 
 # Project modules
 from apps.auths.models import CustomUser
@@ -22,3 +30,125 @@ class CustomUserForeignSerializer(ModelSerializer):
             "created_at",
             "updated_at",
         )
+
+
+class DynamicFieldsSerializerMixin:
+    """
+    Serializer mixin adding sparse fieldsets and opt-in expansion.
+
+    The "fields" and "expand" sets are read from the serializer context
+    (see get_fieldset_context). Relations listed in expandable_fields are
+    rendered as primary keys unless expanded, and optimize_queryset turns
+    the selected fields into only()/select_related()/prefetch_related().
+    """
+
+    # Field name -> (nested serializer class, serializer kwargs) used when expanded
+    expandable_fields: dict[str, tuple[type[Serializer], dict[str, Any]]] = {}
+    # SerializerMethodField name -> model fields read by the method
+    method_field_sources: dict[str, tuple[str, ...]] = {}
+
+    @staticmethod
+    def get_fieldset_context(request: DRFRequest) -> dict[str, Optional[frozenset[str]]]:
+        """
+        Parse "?fields=" and "?expand=" query parameters into serializer context.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+
+        Returns:
+            dict
+                Context entries "fields" (None means all) and "expand".
+        """
+        def split(value: Optional[str]) -> frozenset[str]:
+            return frozenset(part.strip() for part in (value or "").split(",") if part.strip())
+
+        fields: frozenset[str] = split(request.query_params.get("fields"))
+        return {
+            "fields": fields or None,
+            "expand": split(request.query_params.get("expand")),
+        }
+
+    def get_fields(self) -> dict[str, Field]:
+        """Get the fields narrowed to the requested fieldset, with expansions applied."""
+        fields: dict[str, Field] = super().get_fields()
+        requested: Optional[frozenset[str]] = self.context.get("fields")
+        expand: frozenset[str] = self.context.get("expand") or frozenset()
+
+        unknown_fields: frozenset[str] = (requested or frozenset()) - fields.keys()
+        unknown_expand: frozenset[str] = expand - self.expandable_fields.keys()
+        if unknown_fields or unknown_expand:
+            errors: dict[str, list[str]] = {}
+            if unknown_fields:
+                errors["fields"] = [f"Unknown fields: {', '.join(sorted(unknown_fields))}."]
+            if unknown_expand:
+                errors["expand"] = [f"Not expandable: {', '.join(sorted(unknown_expand))}."]
+            raise ValidationError(detail=errors)
+
+        if requested is not None:
+            fields = {name: field for name, field in fields.items() if name in requested}
+
+        name: str
+        for name in expand & fields.keys():
+            serializer_class, serializer_kwargs = self.expandable_fields[name]
+            fields[name] = serializer_class(**serializer_kwargs)
+        return fields
+
+    @classmethod
+    def optimize_queryset(
+        cls,
+        queryset: QuerySet,
+        context: dict[str, Any],
+        required_fields: Sequence[str] = (),
+    ) -> QuerySet:
+        """
+        Load only the columns and relations the selected fieldset reads.
+
+        Parameters:
+            queryset: QuerySet
+                Queryset of the serializer's model.
+            context: dict
+                Serializer context with "fields" and "expand".
+            required_fields: Sequence[str]
+                Extra model fields the caller reads (e.g. pagination keys).
+
+        Returns:
+            QuerySet
+                Queryset with only(), select_related() and prefetch_related() applied.
+        """
+        model: type[Model] = cls.Meta.model
+        expand: frozenset[str] = context.get("expand") or frozenset()
+        only: set[str] = {model._meta.pk.name, *required_fields}
+        related: list[str] = []
+        prefetch: list[str | Prefetch] = []
+
+        name: str
+        field: Field
+        for name, field in cls(context=context).fields.items():
+            source: str
+            for source in cls.method_field_sources.get(name, (field.source,)):
+                try:
+                    model_field = model._meta.get_field(source)
+                except FieldDoesNotExist:
+                    continue
+
+                if model_field.many_to_many:
+                    prefetch.append(
+                        source if name in expand else Prefetch(
+                            source,
+                            queryset=model_field.related_model._base_manager.only(
+                                model_field.related_model._meta.pk.name
+                            ),
+                        )
+                    )
+                elif model_field.concrete:
+                    only.add(source)
+                    if model_field.is_relation and name in expand:
+                        related.append(source)
+
+        queryset = queryset.only(*only)
+        if related:
+            queryset = queryset.select_related(*related)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
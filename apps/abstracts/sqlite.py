@@ -0,0 +1,33 @@
+# Python modules
+from typing import Any
+
+# Django modules
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+
+def apply_sqlite_pragmas(sender: type, connection: BaseDatabaseWrapper, **kwargs: dict[str, Any]) -> None:
+    """
+    Apply the "PRAGMAS" of a SQLite database settings entry to a new connection.
+
+    connection_created receiver. Pragmas run in the order given, so
+    "busy_timeout" should come first to cover the "journal_mode" switch
+    while other connections hold the file. Databases without "PRAGMAS"
+    keep the SQLite defaults.
+
+    Parameters:
+        sender: type
+            Database wrapper class.
+        connection: BaseDatabaseWrapper
+            The new connection.
+    """
+    if connection.vendor != "sqlite":
+        return
+    pragmas: dict[str, Any] = connection.settings_dict.get("PRAGMAS") or {}
+    if not pragmas:
+        return
+
+    with connection.cursor() as cursor:
+        name: str
+        value: Any
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
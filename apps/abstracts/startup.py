@@ -0,0 +1,158 @@
+# Python modules
+from typing import Any, Iterable
+from collections import Counter
+from time import perf_counter
+import os
+import subprocess
+import sys
+
+# Django modules
+from django.conf import settings
+from django.test import Client
+from django.test.utils import override_settings
+
+# What a worker does before serving its first request: set up the apps,
+# build the ASGI handler with its middleware chain and load the URLconf
+WORKER_BOOT_CODE = (
+    "import django; django.setup(); "
+    "from django.core.handlers.asgi import ASGIHandler; ASGIHandler(); "
+    "from django.urls import get_resolver; get_resolver().url_patterns"
+)
+IMPORTTIME_PREFIX = "import time:"
+
+
+def parse_importtime(report: str) -> list[tuple[str, int, int, int]]:
+    """
+    Parse the stderr of "python -X importtime".
+
+    Parameters:
+        report: str
+            Lines like "import time:  self [us] | cumulative | imported package".
+
+    Returns:
+        list[tuple[str, int, int, int]]
+            Module name, self and cumulative microseconds and nesting depth,
+            0 for the modules imported by the code itself.
+    """
+    entries: list[tuple[str, int, int, int]] = []
+
+    line: str
+    for line in report.splitlines():
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+        fields: list[str] = line[len(IMPORTTIME_PREFIX):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # The header line
+            continue
+        name: str = fields[2].rstrip()
+        entries.append((
+            name.strip(),
+            int(fields[0]),
+            int(fields[1]),
+            (len(name) - len(name.lstrip()) - 1) // 2,
+        ))
+    return entries
+
+
+def summarize_imports(
+    entries: list[tuple[str, int, int, int]],
+    forbidden: Iterable[str] = (),
+    top: int = 10,
+) -> dict[str, Any]:
+    """
+    Sum up an import time report.
+
+    Parameters:
+        entries: list[tuple[str, int, int, int]]
+            Output of parse_importtime.
+        forbidden: Iterable[str]
+            Top level packages that must not be imported.
+        top: int
+            Number of packages listed by import time.
+
+    Returns:
+        dict[str, Any]
+            total_ms, modules, packages (the "top" slowest top level
+            packages as (name, ms), by self time of all their modules) and
+            the forbidden packages found.
+    """
+    forbidden = set(forbidden)
+    packages: Counter = Counter()
+
+    name: str
+    self_us: int
+    for name, self_us, _, _ in entries:
+        packages[name.partition(".")[0]] += self_us
+
+    return {
+        "total_ms": sum(cumulative for _, _, cumulative, depth in entries if depth == 0) / 1000,
+        "modules": len(entries),
+        "packages": [(package, self_us / 1000) for package, self_us in packages.most_common(top)],
+        "forbidden": sorted({
+            name.partition(".")[0] for name, _, _, _ in entries
+        } & forbidden),
+    }
+
+
+def measure_worker_imports(settings_module: str) -> list[tuple[str, int, int, int]]:
+    """
+    Boot a worker in a fresh interpreter under "-X importtime".
+
+    Parameters:
+        settings_module: str
+            DJANGO_SETTINGS_MODULE of the worker.
+
+    Returns:
+        list[tuple[str, int, int, int]]
+            Output of parse_importtime.
+    """
+    result: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", WORKER_BOOT_CODE],
+        env={
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": settings_module,
+            "PYTHONPATH": os.pathsep.join(filter(None, (settings.BASE_DIR, os.environ.get("PYTHONPATH")))),
+        },
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(f"The worker failed to boot:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def measure_middleware_overhead(path: str, requests: int) -> dict[str, float]:
+    """
+    Time requests through the configured middleware and without any.
+
+    Parameters:
+        path: str
+            URL of a view without database access.
+        requests: int
+            Number of requests per run, after one warm up request.
+
+    Returns:
+        dict[str, float]
+            Mean microseconds per request with and without middleware and
+            their difference, the overhead.
+    """
+    # The test client sends "Host: testserver"
+    with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+        means: dict[str, float] = {}
+
+        name: str
+        overrides: dict[str, Any]
+        for name, overrides in (("with", {}), ("without", {"MIDDLEWARE": []})):
+            with override_settings(**overrides):
+                client: Client = Client()
+                client.get(path)
+                started: float = perf_counter()
+                for _ in range(requests):
+                    client.get(path)
+                means[name] = (perf_counter() - started) / requests * 1_000_000
+
+    return {
+        "with_us": means["with"],
+        "without_us": means["without"],
+        "overhead_us": means["with"] - means["without"],
+    }
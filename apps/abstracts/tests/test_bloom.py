@@ -0,0 +1,22 @@
+# Project modules
+from apps.abstracts.bloom import BloomFilter
+
+
+class TestBloomFilter:
+    def test_added_keys_are_found(self) -> None:
+        bloom: BloomFilter = BloomFilter(bits=1024, hashes=4, keys=["a", "b"])
+        bloom.add("c")
+        assert "a" in bloom and "b" in bloom and "c" in bloom
+
+    def test_empty_filter_finds_nothing(self) -> None:
+        bloom: BloomFilter = BloomFilter(bits=1024, hashes=4)
+        assert "a" not in bloom
+
+    def test_false_positive_rate_is_low(self) -> None:
+        bloom: BloomFilter = BloomFilter(
+            bits=1 << 16,
+            hashes=4,
+            keys=(f"revoked-{i}" for i in range(1000)),
+        )
+        false_positives: int = sum(f"valid-{i}" in bloom for i in range(10000))
+        assert false_positives < 50
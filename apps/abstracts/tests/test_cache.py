@@ -0,0 +1,27 @@
+from apps.abstracts.cache import LRUCache
+
+
+class TestLRUCache:
+    def test_get_returns_default_for_missing_key(self) -> None:
+        cache: LRUCache = LRUCache(max_entries=2)
+        assert cache.get("missing", "default") == "default"
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache: LRUCache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "b" becomes the least recently used
+        cache.set("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+
+    def test_delete_and_clear(self) -> None:
+        cache: LRUCache = LRUCache(max_entries=3)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.delete("a")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
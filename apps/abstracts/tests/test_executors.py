@@ -0,0 +1,34 @@
+# Python modules
+from threading import Event
+import asyncio
+
+# Project modules
+from apps.abstracts.executors import BoundedExecutor
+
+
+class TestBoundedExecutor:
+    def test_run_returns_result(self) -> None:
+        executor: BoundedExecutor = BoundedExecutor(max_workers=1)
+        assert asyncio.run(executor.run(pow, 2, 10)) == 1024
+        assert executor.get_metrics()["completed"] == 1
+
+    def test_calls_over_the_cap_are_queued(self) -> None:
+        executor: BoundedExecutor = BoundedExecutor(max_workers=1)
+        release: Event = Event()
+
+        async def main() -> dict[str, int]:
+            tasks: list[asyncio.Task] = [
+                asyncio.ensure_future(executor.run(release.wait)) for _ in range(3)
+            ]
+            await asyncio.sleep(0.05)
+            metrics: dict[str, int] = executor.get_metrics()
+            release.set()
+            await asyncio.gather(*tasks)
+            return metrics
+
+        metrics: dict[str, int] = asyncio.run(main())
+        assert metrics["running"] == 1
+        assert metrics["queued"] == 2
+        metrics = executor.get_metrics()
+        assert (metrics["queued"], metrics["running"], metrics["completed"]) == (0, 0, 3)
+        assert metrics["peak_queued"] >= 2
@@ -0,0 +1,60 @@
+# Python modules
+from io import StringIO
+from pathlib import Path
+
+# Django modules
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.http import HttpResponse
+from django.test import Client, override_settings
+from django.urls import reverse
+
+# Pytest modules
+import pytest
+
+# Project modules
+from apps.abstracts import openapi
+
+
+@pytest.fixture
+def schema_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Build the schema into a temporary directory, read afresh by the view."""
+    monkeypatch.setattr(openapi, "_artifact", None)
+    with override_settings(OPENAPI_SCHEMA_DIR=str(tmp_path)):
+        yield tmp_path
+
+
+class TestBuildSchema:
+    def test_committed_schema_is_up_to_date(self) -> None:
+        call_command("buildschema", "--check", stdout=StringIO())
+
+    def test_check_fails_on_a_stale_schema(self, schema_dir: Path) -> None:
+        call_command("buildschema", stdout=StringIO())
+        Path(openapi.get_schema_paths()["identity"]).write_bytes(b"{}\n")
+
+        with pytest.raises(CommandError, match="out of date"):
+            call_command("buildschema", "--check", stdout=StringIO())
+
+
+class TestOpenApiSchemaView:
+    def test_missing_schema_is_not_found(self, schema_dir: Path) -> None:
+        assert Client().get(reverse("schema")).status_code == 404
+
+    def test_gzip_and_conditional_requests(self, schema_dir: Path) -> None:
+        call_command("buildschema", stdout=StringIO())
+        client: Client = Client()
+
+        response: HttpResponse = client.get(reverse("schema"), headers={"Accept-Encoding": "gzip, br"})
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+
+        identity: HttpResponse = client.get(reverse("schema"))
+        assert "Content-Encoding" not in identity.headers
+        assert identity.headers["ETag"] != response.headers["ETag"]
+
+        not_modified: HttpResponse = client.get(
+            reverse("schema"),
+            headers={"If-None-Match": f"W/{identity.headers['ETag']}"},
+        )
+        assert not_modified.status_code == 304
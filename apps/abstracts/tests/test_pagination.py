@@ -0,0 +1,82 @@
+import pytest
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from django.db.models import Q
+from django.urls import reverse
+
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+from apps.abstracts.pagination import build_keyset_filter, decode_cursor, encode_cursor, merge_keyset_rows
+from apps.auths.models import CustomUser
+from apps.tasks.models import Project
+
+
+class TestCursorCodec:
+    def test_round_trip_keeps_values(self) -> None:
+        moment: datetime = datetime(2025, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc)
+        cursor: str = encode_cursor([moment, 42])
+        assert decode_cursor(cursor, 2) == [moment.isoformat(), 42]
+
+    def test_cursor_is_url_safe(self) -> None:
+        cursor: str = encode_cursor(["???>>>", 1])
+        assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+
+    @pytest.mark.parametrize(
+        argnames=["cursor", "size"],
+        argvalues=[
+            ("not a cursor", 1),
+            (encode_cursor([1, 2]), 1),
+            ("eyJpZCI6MX0", 1),
+        ]
+    )
+    def test_malformed_cursor_raises(self, cursor: str, size: int) -> None:
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, size)
+
+
+def test_keyset_filter_uses_equal_prefix() -> None:
+    condition = build_keyset_filter(("-updated_at", "-id"), ("u", 7))
+    assert condition == Q(updated_at__lt="u") | Q(updated_at="u", id__lt=7)
+
+
+def test_merge_keyset_rows_keeps_descending_order() -> None:
+    pages: list[list[dict[str, int]]] = [
+        [{"rank": 9, "id": 4}, {"rank": 5, "id": 2}],
+        [{"rank": 9, "id": 7}, {"rank": 1, "id": 3}],
+    ]
+    merged: list[dict[str, int]] = merge_keyset_rows(pages, ordering=("-rank", "-id"), get_value=dict.get)
+    assert [row["id"] for row in merged] == [7, 4, 2, 3]
+
+
+class TestProjectListCursor:
+    def test_next_link_continues_the_listing(
+        self,
+        project_factory: Callable[..., Project],
+        user: CustomUser,
+    ) -> None:
+        projects: list[Project] = [project_factory(author=user, name=f"Project {index}") for index in range(3)]
+        client: APIClient = APIClient()
+        client.force_authenticate(user)
+
+        response: Response = client.get(reverse("project-list"), {"page_size": 2})
+        assert response.status_code == 200
+        seen: list[int] = [item["id"] for item in response.data["results"]]
+
+        response = client.get(response.data["next"])
+        assert response.status_code == 200
+        assert response.data["next"] is None
+        seen += [item["id"] for item in response.data["results"]]
+        assert seen == [project.id for project in reversed(projects)]
+
+    @pytest.mark.parametrize("url_name", ["project-list", "project-async-list"])
+    @pytest.mark.parametrize(
+        argnames="values",
+        argvalues=[["abc", 1], [{}, 1], [None, None], [1, "x"], ["2025-01-01T00:00:00+00:00", [1]]],
+    )
+    def test_tampered_cursor_is_a_client_error(self, user: CustomUser, url_name: str, values: list[Any]) -> None:
+        client: APIClient = APIClient()
+        client.force_authenticate(user)
+        response: Response = client.get(reverse(url_name), {"cursor": encode_cursor(values)})
+        assert response.status_code == 404
@@ -0,0 +1,58 @@
+# Django modules
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+# Django REST Framework modules
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+# Project modules
+from apps.abstracts.replicas import primary_reads
+from apps.auths.models import CustomUser
+from apps.tasks.models import Project
+
+
+def count_queries(client: APIClient, method: str, path: str, **kwargs: dict) -> tuple[Response, int, int]:
+    """Send a request, returning it with the number of queries on default and on the replica."""
+    with (
+        CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as primary,
+        CaptureQueriesContext(connections["replica_1"]) as replica,
+    ):
+        response: Response = getattr(client, method)(path, **kwargs)
+    return response, len(primary), len(replica)
+
+
+class TestReplicaRouting:
+    def test_safe_action_reads_from_the_replica(self, replica: str, project: Project, user: CustomUser) -> None:
+        client: APIClient = APIClient()
+        client.force_authenticate(user)
+
+        response, _, replica_queries = count_queries(client, "get", reverse("project-detail", kwargs={"pk": project.id}))
+
+        assert response.status_code == 200
+        assert replica_queries > 0
+        assert settings.DATABASE_REPLICAS["COOKIE_NAME"] not in response.cookies
+
+    def test_writer_reads_its_writes_from_the_primary(self, replica: str, user: CustomUser) -> None:
+        client: APIClient = APIClient()
+        client.force_authenticate(user)
+
+        response: Response = client.post(reverse("project-list"), {"name": "New", "author": user.id, "users": [user.id]}, format="json")
+        assert response.status_code == 201
+        assert settings.DATABASE_REPLICAS["COOKIE_NAME"] in response.cookies
+
+        # The cookie keeps the client on the primary
+        response, primary_queries, replica_queries = count_queries(
+            client, "get", reverse("project-detail", kwargs={"pk": response.data["id"]}),
+        )
+        assert response.status_code == 200
+        assert (primary_queries > 0, replica_queries) == (True, 0)
+
+    def test_reads_outside_requests_stay_on_the_primary(self, replica: str, project: Project) -> None:
+        with CaptureQueriesContext(connections["replica_1"]) as queries:
+            Project.objects.count()
+            with primary_reads():
+                Project.objects.count()
+        assert len(queries) == 0
@@ -0,0 +1,44 @@
+# Project modules
+from apps.abstracts.startup import parse_importtime, summarize_imports
+
+REPORT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | marshal
+import time:       500 |        500 |     debug_toolbar.settings
+import time:       250 |        750 |   debug_toolbar
+import time:      1000 |       1750 | settings.urls
+Traceback lines and other output are ignored
+"""
+
+
+class TestParseImporttime:
+    def test_entries_keep_order_times_and_depth(self) -> None:
+        assert parse_importtime(REPORT) == [
+            ("_io", 120, 120, 1),
+            ("marshal", 300, 420, 0),
+            ("debug_toolbar.settings", 500, 500, 2),
+            ("debug_toolbar", 250, 750, 1),
+            ("settings.urls", 1000, 1750, 0),
+        ]
+
+    def test_empty_report(self) -> None:
+        assert parse_importtime("") == []
+
+
+class TestSummarizeImports:
+    def test_total_counts_top_level_imports_once(self) -> None:
+        summary: dict = summarize_imports(parse_importtime(REPORT))
+        assert summary["total_ms"] == 2.17
+        assert summary["modules"] == 5
+
+    def test_packages_are_ranked_by_self_time(self) -> None:
+        summary: dict = summarize_imports(parse_importtime(REPORT), top=2)
+        assert summary["packages"] == [("settings", 1.0), ("debug_toolbar", 0.75)]
+
+    def test_forbidden_packages_are_reported(self) -> None:
+        summary: dict = summarize_imports(
+            parse_importtime(REPORT),
+            forbidden=["debug_toolbar", "django_extensions"],
+        )
+        assert summary["forbidden"] == ["debug_toolbar"]
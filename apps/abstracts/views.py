@@ -1,3 +1,63 @@
-from django.shortcuts import render
+# Python modules
+from typing import Any, Optional
+import re
 
-# Create your views here.
+# Django modules
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from django.views.decorators.http import require_safe
+
+# Project modules
+from apps.abstracts.openapi import OPENAPI_MEDIA_TYPE, get_schema_artifact
+
+ACCEPTS_GZIP_RE = re.compile(r"\bgzip\b")
+
+
+@require_safe
+def openapi_schema_view(
+    request: HttpRequest,
+    *args: tuple[Any, ...],
+    **kwargs: dict[str, Any]
+) -> HttpResponse:
+    """
+    Serve the schema built by the buildschema command from memory.
+
+    Clients accepting gzip get the precompressed file. Each content
+    coding has its own strong ETag, a matching If-None-Match gets a 304.
+
+    Parameters:
+        request: HttpRequest
+            The request object.
+        *args: list
+            Additional positional arguments.
+        **kwargs: dict
+            Additional keyword arguments.
+
+    Returns:
+        HttpResponse
+            The OpenAPI document, or 304 Not Modified.
+    """
+    artifact: Optional[dict[str, tuple[bytes, str]]] = get_schema_artifact()
+    if artifact is None:
+        raise Http404("The OpenAPI schema was not built, see the buildschema command.")
+
+    coding: str = "gzip" if ACCEPTS_GZIP_RE.search(request.headers.get("Accept-Encoding", "")) else "identity"
+    content: bytes
+    etag: str
+    content, etag = artifact[coding]
+
+    # If-None-Match compares weakly
+    etags: list[str] = [tag.removeprefix("W/") for tag in parse_etags(request.headers.get("If-None-Match", ""))]
+    response: HttpResponse
+    if etag in etags or "*" in etags:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(content, content_type=OPENAPI_MEDIA_TYPE)
+        if coding == "gzip":
+            response.headers["Content-Encoding"] = "gzip"
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = f"public, max-age={settings.OPENAPI_SCHEMA['CACHE_MAX_AGE']}"
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
@@ -1,8 +1,16 @@
+# Python modules
+from typing import Optional
+
 # Django modules
 from django.contrib.admin import register, ModelAdmin
+from django.db.models import QuerySet
+from django.db.models.expressions import RawSQL
+from django.http import HttpRequest
 
 # Project modules
-from apps.auths.models import CustomUser
+from apps.abstracts.fts import build_match_expression, is_fts_supported
+from apps.auths.models import CustomUser, RevokedToken
+from apps.auths.search import get_matching_user_ids_sql
 
 
 @register(CustomUser)
@@ -20,4 +28,32 @@ class CustomUserAdmin(ModelAdmin):
     list_filter = ("is_active", "is_staff", "is_superuser")
     ordering = ("email",)
 
+    def get_search_results(
+        self,
+        request: HttpRequest,
+        queryset: QuerySet[CustomUser],
+        search_term: str,
+    ) -> tuple[QuerySet[CustomUser], bool]:
+        """Search with the FTS5 user index instead of icontains scans."""
+        match: Optional[str] = build_match_expression(search_term)
+        if match is None or not is_fts_supported(queryset.db):
+            return super().get_search_results(request, queryset, search_term)
+
+        return queryset.filter(
+            id__in=RawSQL(get_matching_user_ids_sql(), (match,))
+        ), False
+
 
+@register(RevokedToken)
+class RevokedTokenAdmin(ModelAdmin):
+    """Admin model for RevokedToken, a jti added here is revoked in every worker."""
+
+    list_display = (
+        "jti",
+        "user",
+        "expires_at",
+        "created_at",
+    )
+    search_fields = ("jti",)
+    raw_id_fields = ("user",)
+    list_select_related = ("user",)
@@ -1,6 +1,25 @@
+# Python modules
+from typing import Any
+
+# Django modules
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def ensure_lookup_schema(using: str, **kwargs: dict[str, Any]) -> None:
+    """Recreate the user lookup triggers a rebuild of auths_customuser may have dropped."""
+    from apps.abstracts.fts import ensure_fts_triggers
+    from apps.auths.search import FTS_TABLE, SCHEMA_SQL
+
+    ensure_fts_triggers(using=using, fts_table=FTS_TABLE, statements=SCHEMA_SQL)
 
 
 class AuthsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.auths'
+
+    def ready(self) -> None:
+        """Connect the app's signal receivers."""
+        from apps.auths import signals  # noqa: F401
+
+        post_migrate.connect(ensure_lookup_schema, sender=self)
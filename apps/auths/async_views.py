@@ -0,0 +1,77 @@
+# Python modules
+from typing import Any, Optional
+import json
+
+# Django modules
+from django.http import HttpRequest, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+
+# Django REST Framework modules
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_400_BAD_REQUEST,
+    HTTP_405_METHOD_NOT_ALLOWED,
+)
+
+# Project modules
+from apps.auths.hashing import acheck_user_password
+from apps.auths.models import CustomUser
+from apps.auths.serializers import UserCredentialsSerializer
+from apps.auths.tokens import get_login_response_data
+
+
+@csrf_exempt
+async def login_async(request: HttpRequest) -> JsonResponse:
+    """
+    Async-native counterpart of CustomUserViewSet.login.
+
+    Same request, responses and errors as the DRF view. The user is read
+    with the async ORM and the password hashers run in the bounded pool
+    of apps.auths.hashing, so a burst of logins never blocks the event
+    loop serving other requests.
+
+    Parameters:
+        request: HttpRequest
+            The request object.
+
+    Returns:
+        JsonResponse
+            Response containing user data or error message.
+    """
+    if request.method != "POST":
+        return JsonResponse(
+            data={"detail": f'Method "{request.method}" not allowed.'},
+            status=HTTP_405_METHOD_NOT_ALLOWED,
+        )
+
+    data: Any
+    if request.content_type == "application/json":
+        try:
+            data = json.loads(request.body or b"{}")
+        except ValueError as error:
+            return JsonResponse(
+                data={"detail": f"JSON parse error - {error}"},
+                status=HTTP_400_BAD_REQUEST,
+            )
+    else:
+        data = request.POST
+
+    serializer: UserCredentialsSerializer = UserCredentialsSerializer(data=data)
+    if not serializer.is_valid():
+        return JsonResponse(data=serializer.errors, status=HTTP_400_BAD_REQUEST)
+
+    email: str = serializer.validated_data["email"]
+    user: Optional[CustomUser] = await CustomUser.objects.filter(email=email).afirst()
+    if not user:
+        return JsonResponse(
+            data={"email": [UserCredentialsSerializer.EMAIL_NOT_FOUND_MESSAGE.format(email=email)]},
+            status=HTTP_400_BAD_REQUEST,
+        )
+
+    if not await acheck_user_password(user, serializer.validated_data["password"]):
+        return JsonResponse(
+            data={"password": [UserCredentialsSerializer.INCORRECT_PASSWORD_MESSAGE]},
+            status=HTTP_400_BAD_REQUEST,
+        )
+
+    return JsonResponse(data=get_login_response_data(user), status=HTTP_200_OK)
@@ -0,0 +1,253 @@
+# Python modules
+from typing import Any, Optional
+from copy import copy
+from hashlib import sha256
+from time import monotonic, time
+
+# Django modules
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+
+# Django REST Framework modules
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.request import Request
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+# Project modules
+from apps.abstracts.cache import LRUCache
+from apps.auths.models import CustomUser
+from apps.auths.revocation import get_revocation_list
+from apps.auths.tokens import IDENTITY_CLAIMS
+
+
+class ClaimsUser:
+    """
+    Authenticated user served from the identity claims of an access token.
+
+    id, email and full_name come from the token, so endpoints reading
+    only them need no query. Any other attribute loads the CustomUser
+    through CachedJWTAuthentication's user cache on first access.
+    """
+
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, user_id: int, token: Token, authentication: "CachedJWTAuthentication") -> None:
+        self.id: int = user_id
+        self.pk: int = user_id
+        self.email: str = token["email"]
+        self.full_name: str = token["full_name"]
+        self._authentication: CachedJWTAuthentication = authentication
+        self._user: Optional[CustomUser] = None
+
+    def __str__(self) -> str:
+        return self.email
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, (ClaimsUser, CustomUser)) and self.pk == other.pk
+
+    def __hash__(self) -> int:
+        return hash(self.pk)
+
+    def get_user(self) -> CustomUser:
+        """Get the CustomUser instance behind the claims."""
+        if self._user is None:
+            self._user = self._authentication.get_cached_user(self.id)
+        return self._user
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes missing on the instance
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.get_user(), name)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication without per request signature checks and user queries.
+
+    Verified tokens are kept in a bounded LRU keyed by the SHA-256 of the
+    raw token until their "exp". Users are kept in a small per-process
+    LRU for JWT_AUTH_CACHE["USER_TIMEOUT"] seconds, dropped on every
+    CustomUser save or delete in the process. Access tokens carrying the
+    identity claims, issued at login with JWT_AUTH_CACHE
+    ["EMBED_IDENTITY_CLAIMS"], resolve to a ClaimsUser, which loads the
+    CustomUser only when something beyond the claims is read; like with
+    JWTStatelessUserAuthentication, such a token of a deactivated user
+    is accepted until it expires.
+    """
+
+    _tokens: Optional[LRUCache] = None
+    _users: Optional[LRUCache] = None
+
+    @classmethod
+    def get_token_cache(cls) -> LRUCache:
+        """Get the verified token cache, (token, exp) by token hash."""
+        if cls._tokens is None:
+            cls._tokens = LRUCache(max_entries=settings.JWT_AUTH_CACHE["TOKEN_MAX_ENTRIES"])
+        return cls._tokens
+
+    @classmethod
+    def get_user_cache(cls) -> LRUCache:
+        """Get the user cache, (user, expires_at) by user id."""
+        if cls._users is None:
+            cls._users = LRUCache(max_entries=settings.JWT_AUTH_CACHE["USER_MAX_ENTRIES"])
+        return cls._users
+
+    @classmethod
+    def invalidate_user(cls, user_id: int) -> None:
+        """Drop a user from the user cache of this process."""
+        cls.get_user_cache().delete(user_id)
+
+    def get_verified_token(self, raw_token: bytes) -> Token:
+        """
+        Get a token with a verified signature, verifying it once per token.
+
+        Parameters:
+            raw_token: bytes
+                Encoded JWT from the Authorization header.
+
+        Returns:
+            Token
+                The verified token, revocation not checked.
+        """
+        key: bytes = sha256(raw_token).digest()
+        tokens: LRUCache = self.get_token_cache()
+        cached: Optional[tuple[Token, int]] = tokens.get(key)
+        if cached is not None and cached[1] > time():
+            return cached[0]
+
+        token: Token = super().get_validated_token(raw_token)
+        tokens.set(key, (token, token["exp"]))
+        return token
+
+    def get_validated_token(self, raw_token: bytes) -> Token:
+        """
+        Get a verified token, checking the revocation list on every call.
+
+        Parameters:
+            raw_token: bytes
+                Encoded JWT from the Authorization header.
+
+        Returns:
+            Token
+                The validated token.
+        """
+        token: Token = self.get_verified_token(raw_token)
+        if get_revocation_list().is_revoked(token.get(api_settings.JTI_CLAIM)):
+            raise InvalidToken(_("Token is revoked"))
+        return token
+
+    async def aget_validated_token(self, raw_token: bytes) -> Token:
+        """Async counterpart of get_validated_token."""
+        token: Token = self.get_verified_token(raw_token)
+        if await get_revocation_list().ais_revoked(token.get(api_settings.JTI_CLAIM)):
+            raise InvalidToken(_("Token is revoked"))
+        return token
+
+    def get_cached_user(self, user_id: int) -> CustomUser:
+        """
+        Get a live, active user by id through the user cache.
+
+        Parameters:
+            user_id: int
+                The CustomUser id.
+
+        Returns:
+            CustomUser
+                A copy of the cached instance, views can not alter the cache.
+        """
+        user: Optional[CustomUser] = self.get_user_from_cache(user_id)
+        if user is None:
+            try:
+                user = CustomUser.objects.get(id=user_id)
+            except CustomUser.DoesNotExist as error:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found") from error
+            self.cache_user(user)
+        return self.check_user(user)
+
+    async def aget_cached_user(self, user_id: int) -> CustomUser:
+        """Async counterpart of get_cached_user, loading with the async ORM."""
+        user: Optional[CustomUser] = self.get_user_from_cache(user_id)
+        if user is None:
+            try:
+                user = await CustomUser.objects.aget(id=user_id)
+            except CustomUser.DoesNotExist as error:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found") from error
+            self.cache_user(user)
+        return self.check_user(user)
+
+    def get_user_from_cache(self, user_id: int) -> Optional[CustomUser]:
+        """Get a cached user unless missing or expired."""
+        cached: Optional[tuple[CustomUser, float]] = self.get_user_cache().get(user_id)
+        if cached is None or cached[1] <= monotonic():
+            return None
+        return cached[0]
+
+    def cache_user(self, user: CustomUser) -> None:
+        """Cache a freshly loaded user for JWT_AUTH_CACHE["USER_TIMEOUT"] seconds."""
+        self.get_user_cache().set(
+            user.pk,
+            (user, monotonic() + settings.JWT_AUTH_CACHE["USER_TIMEOUT"]),
+        )
+
+    def check_user(self, user: CustomUser) -> CustomUser:
+        """Reject inactive users, return a copy of the cached instance."""
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return copy(user)
+
+    def get_user_id(self, validated_token: Token) -> int:
+        """Get the user id of a token as the model pk, the claim holds a string."""
+        try:
+            return CustomUser._meta.pk.to_python(validated_token[api_settings.USER_ID_CLAIM])
+        except KeyError as error:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from error
+
+    def get_user(self, validated_token: Token) -> CustomUser | ClaimsUser:
+        """
+        Get the user of a validated token.
+
+        Parameters:
+            validated_token: Token
+                The validated token.
+
+        Returns:
+            CustomUser | ClaimsUser
+                A ClaimsUser when the token carries the identity claims and
+                the user is not cached, the cached CustomUser otherwise.
+        """
+        user_id: int = self.get_user_id(validated_token)
+        if self.get_user_from_cache(user_id) is None and all(
+            claim in validated_token for claim in IDENTITY_CLAIMS
+        ):
+            return ClaimsUser(user_id=user_id, token=validated_token, authentication=self)
+        return self.get_cached_user(user_id)
+
+    async def aauthenticate(self, request: Request) -> Optional[tuple[CustomUser, Token]]:
+        """
+        Async counterpart of authenticate() for AsyncAPIView.
+
+        Always resolves the CustomUser (through the user cache), since the
+        lazy loading of a ClaimsUser would query from the event loop.
+
+        Parameters:
+            request: Request
+                The request object.
+
+        Returns:
+            Optional[tuple[CustomUser, Token]]
+                The user and the token, None without a JWT header.
+        """
+        header: Optional[bytes] = self.get_header(request)
+        if header is None:
+            return None
+        raw_token: Optional[bytes] = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token: Token = await self.aget_validated_token(raw_token)
+        return await self.aget_cached_user(self.get_user_id(validated_token)), validated_token
@@ -0,0 +1,55 @@
+# Python modules
+from typing import Optional
+from threading import Lock
+
+# Django modules
+from django.conf import settings
+from django.contrib.auth.hashers import make_password, verify_password
+
+# Project modules
+from apps.abstracts.executors import BoundedExecutor
+from apps.auths.models import CustomUser
+
+_pool: Optional[BoundedExecutor] = None
+_pool_lock: Lock = Lock()
+
+
+def get_password_hash_pool() -> BoundedExecutor:
+    """Get the process wide pool, sized by PASSWORD_HASHING["MAX_WORKERS"]."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = BoundedExecutor(
+                    max_workers=settings.PASSWORD_HASHING["MAX_WORKERS"],
+                    thread_name_prefix="password-hash",
+                )
+    return _pool
+
+
+async def acheck_user_password(user: CustomUser, raw_password: str) -> bool:
+    """
+    Async counterpart of user.check_password() running the hashers in the pool.
+
+    A password stored with outdated hasher settings is rehashed in the
+    pool and saved with the async ORM, like check_password() does.
+
+    Parameters:
+        user: CustomUser
+            The CustomUser instance.
+        raw_password: str
+            Password to verify.
+
+    Returns:
+        bool
+            Whether the password is correct.
+    """
+    pool: BoundedExecutor = get_password_hash_pool()
+    is_correct: bool
+    must_update: bool
+    is_correct, must_update = await pool.run(verify_password, raw_password, user.password)
+
+    if is_correct and must_update:
+        user.password = await pool.run(make_password, raw_password)
+        await user.asave(update_fields=["password"])
+    return is_correct
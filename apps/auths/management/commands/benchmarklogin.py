@@ -0,0 +1,113 @@
+# Python modules
+from typing import Any
+from time import perf_counter
+import asyncio
+
+# Django modules
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.test import AsyncClient
+from django.test.utils import override_settings
+from django.urls import reverse
+
+# Project modules
+from apps.abstracts.benchmarks import measure_concurrent
+from apps.auths.hashing import get_password_hash_pool
+from apps.auths.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = "Benchmark the sync and async login views through the ASGI handler"
+
+    EMAIL = "login-benchmark@example.com"
+    PASSWORD = "Benchmark-Pass-1"
+    # Pause between two requests of the probe standing for unrelated traffic
+    PROBE_INTERVAL = 0.01
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command arguments."""
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=200,
+            help="Logins per view.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=20,
+            help="Logins in flight at once.",
+        )
+
+    async def __probe(self, client: AsyncClient, stop: asyncio.Event) -> float:
+        """Request an unrelated sync view during the run, return its worst latency."""
+        worst: float = 0.0
+        while not stop.is_set():
+            started: float = perf_counter()
+            await client.get(reverse("hello-view"))
+            worst = max(worst, perf_counter() - started)
+            await asyncio.sleep(self.PROBE_INTERVAL)
+        return worst
+
+    async def __run(self, path: str, requests: int, concurrency: int) -> dict[str, float]:
+        """Send the logins to one view and collect throughput and latencies."""
+        client: AsyncClient = AsyncClient()
+        stop: asyncio.Event = asyncio.Event()
+        probe: asyncio.Task = asyncio.ensure_future(self.__probe(client, stop))
+
+        async def login() -> None:
+            response = await client.post(
+                path,
+                data={"email": self.EMAIL, "password": self.PASSWORD},
+                content_type="application/json",
+            )
+            assert response.status_code == 200, response.content
+
+        result: dict[str, float] = await measure_concurrent(
+            send=login,
+            requests=requests,
+            concurrency=concurrency,
+        )
+        stop.set()
+        result["probe_worst"] = await probe * 1000
+        return result
+
+    def handle(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        """Command entry point."""
+
+        requests: int = kwargs["requests"]
+        concurrency: int = kwargs["concurrency"]
+
+        user: CustomUser
+        created: bool
+        user, created = CustomUser.all_objects.get_or_create(
+            email=self.EMAIL,
+            defaults={"full_name": "Login Benchmark"},
+        )
+        user.set_password(self.PASSWORD)
+        user.deleted_at = None
+        user.is_active = True
+        user.save()
+
+        views: dict[str, str] = {
+            "sync": reverse("user-login"),
+            "async": reverse("user-login-async"),
+        }
+        try:
+            # The test client sends "Host: testserver"
+            with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+                name: str
+                path: str
+                for name, path in views.items():
+                    result: dict[str, float] = asyncio.run(
+                        self.__run(path=path, requests=requests, concurrency=concurrency)
+                    )
+                    self.stdout.write(
+                        f"{name:>5}: {result['throughput']:.1f} logins/s, "
+                        f"p50 {result['p50']:.1f} ms, p95 {result['p95']:.1f} ms, "
+                        f"worst unrelated request {result['probe_worst']:.1f} ms"
+                    )
+            self.stdout.write(f"Hash pool: {get_password_hash_pool().get_metrics()}")
+        finally:
+            if created:
+                user.hard_delete()
@@ -0,0 +1,44 @@
+# Generated by Django 5.0 on 2026-10-18 04:40
+
+from django.db import migrations
+
+SCHEMA_SQL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS auths_customuser_fts USING fts5(email, full_name, content='auths_customuser', content_rowid='id', tokenize='unicode61 remove_diacritics 2', prefix='1 2 3')",
+    'CREATE TRIGGER IF NOT EXISTS auths_customuser_fts_ai AFTER INSERT ON auths_customuser BEGIN INSERT INTO auths_customuser_fts(rowid, email, full_name) VALUES (new.id, new.email, new.full_name); END',
+    "CREATE TRIGGER IF NOT EXISTS auths_customuser_fts_ad AFTER DELETE ON auths_customuser BEGIN INSERT INTO auths_customuser_fts(auths_customuser_fts, rowid, email, full_name) VALUES ('delete', old.id, old.email, old.full_name); END",
+    "CREATE TRIGGER IF NOT EXISTS auths_customuser_fts_au AFTER UPDATE OF email, full_name ON auths_customuser BEGIN INSERT INTO auths_customuser_fts(auths_customuser_fts, rowid, email, full_name) VALUES ('delete', old.id, old.email, old.full_name); INSERT INTO auths_customuser_fts(rowid, email, full_name) VALUES (new.id, new.email, new.full_name); END",
+    "INSERT INTO auths_customuser_fts(auths_customuser_fts) VALUES ('rebuild')",
+)
+
+DROP_SQL = (
+    'DROP TRIGGER IF EXISTS auths_customuser_fts_ai',
+    'DROP TRIGGER IF EXISTS auths_customuser_fts_ad',
+    'DROP TRIGGER IF EXISTS auths_customuser_fts_au',
+    'DROP TABLE IF EXISTS auths_customuser_fts',
+)
+
+
+def create_lookup_index(apps, schema_editor):
+    # FTS5 is SQLite only
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in SCHEMA_SQL:
+        schema_editor.execute(statement)
+
+
+def drop_lookup_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in DROP_SQL:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auths', '0002_alter_customuser_password'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_lookup_index, drop_lookup_index),
+    ]
@@ -3,24 +3,28 @@ from typing import Any
 
 # Django modules
 from django.db.models import (
+    Model,
     EmailField,
     CharField,
     BooleanField,
+    DateTimeField,
+    ForeignKey,
+    CASCADE,
 )
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
 
 # Project modules
-from apps.abstracts.models import AbstractBaseModel
+from apps.abstracts.models import AbstractBaseModel, SoftDeleteManager
 from apps.auths.validators import (
     validate_email_domain,
     validate_email_payload_not_in_full_name,
 )
 
 
-class CustomUserManager(BaseUserManager):
-    """Custom User Manager to make database requests."""
+class CustomUserManager(SoftDeleteManager, BaseUserManager):
+    """Custom User Manager to make database requests, soft deleted users excluded."""
 
     def __obtain_user_instance(
         self,
@@ -143,3 +147,43 @@ class CustomUser(AbstractBaseUser, PermissionsMixin, AbstractBaseModel):
             full_name=self.full_name,
         )
         return super().clean()
+
+
+class RevokedToken(Model):
+    """
+    Access token revoked before its expiry, identified by its jti claim.
+
+    Every worker reads new rows incrementally by id into an in-memory
+    filter, see apps.auths.revocation. A row is useless once expires_at
+    has passed and is removed on a later revocation.
+    """
+    JTI_MAX_LENGTH = 255
+
+    jti = CharField(
+        max_length=JTI_MAX_LENGTH,
+        unique=True,
+        verbose_name="Token id",
+    )
+    user = ForeignKey(
+        to=CustomUser,
+        on_delete=CASCADE,
+        related_name="revoked_tokens",
+        verbose_name="User",
+    )
+    expires_at = DateTimeField(
+        db_index=True,
+        verbose_name="Token expiry",
+    )
+    created_at = DateTimeField(
+        auto_now_add=True,
+    )
+
+    class Meta:
+        """Meta options for RevokedToken model."""
+
+        verbose_name = "Revoked Token"
+        verbose_name_plural = "Revoked Tokens"
+        ordering = ["-id"]
+
+    def __str__(self) -> str:
+        return self.jti
@@ -0,0 +1,149 @@
+# Python modules
+from typing import Optional
+from datetime import datetime, timezone
+from threading import Lock
+from time import monotonic, time
+
+# Django modules
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone as django_timezone
+
+# Django REST Framework modules
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+# Project modules
+from apps.abstracts.bloom import BloomFilter
+from apps.auths.models import RevokedToken
+
+
+class TokenRevocationList:
+    """
+    Per worker view of RevokedToken: a Bloom filter in front of an exact dict.
+
+    is_revoked() answers almost every valid token from the filter alone
+    and confirms hits in the dict of jti -> exp. New rows are fetched by
+    id at most every TOKEN_REVOCATION["REFRESH_INTERVAL"] seconds; once
+    the earliest exp has passed, the structures are rebuilt without the
+    expired entries and swapped in, so readers never take a lock.
+    """
+
+    def __init__(self) -> None:
+        self._bloom: BloomFilter = self._build_bloom(())
+        self._revoked: dict[str, int] = {}
+        self._last_id: int = 0
+        self._next_expiry: float = float("inf")
+        self._refresh_at: float = 0.0
+        self._refresh_lock: Lock = Lock()
+
+    @staticmethod
+    def _build_bloom(jtis: tuple[str, ...] | list[str]) -> BloomFilter:
+        return BloomFilter(
+            bits=settings.TOKEN_REVOCATION["BLOOM_BITS"],
+            hashes=settings.TOKEN_REVOCATION["BLOOM_HASHES"],
+            keys=jtis,
+        )
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def is_revoked(self, jti: str) -> bool:
+        """
+        Check whether a jti is revoked, refreshing from the table when due.
+
+        Parameters:
+            jti: str
+                jti claim of a validated token.
+
+        Returns:
+            bool
+                True if the token is revoked.
+        """
+        if monotonic() >= self._refresh_at:
+            self.refresh()
+        return jti in self._bloom and jti in self._revoked
+
+    async def ais_revoked(self, jti: str) -> bool:
+        """Async counterpart of is_revoked, refreshing like the async ORM queries."""
+        if monotonic() >= self._refresh_at:
+            await sync_to_async(self.refresh)()
+        return jti in self._bloom and jti in self._revoked
+
+    def add(self, jti: str, exp: int) -> None:
+        """Add a revoked jti, valid until the exp timestamp."""
+        self._revoked[jti] = exp
+        self._bloom.add(jti)
+        self._next_expiry = min(self._next_expiry, exp)
+
+    def refresh(self) -> None:
+        """Apply new RevokedToken rows and drop expired entries."""
+        # A single thread refreshes, the others keep answering from the current state
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            self._refresh_at = monotonic() + settings.TOKEN_REVOCATION["REFRESH_INTERVAL"]
+            now: float = time()
+            row_id: int
+            jti: str
+            expires_at: datetime
+            for row_id, jti, expires_at in RevokedToken.objects.filter(
+                id__gt=self._last_id,
+                expires_at__gt=datetime.fromtimestamp(now, tz=timezone.utc),
+            ).order_by("id").values_list("id", "jti", "expires_at"):
+                self.add(jti, int(expires_at.timestamp()))
+                self._last_id = row_id
+
+            if self._next_expiry <= now:
+                revoked: dict[str, int] = {
+                    jti: exp for jti, exp in self._revoked.items() if exp > now
+                }
+                self._bloom = self._build_bloom(list(revoked))
+                self._revoked = revoked
+                self._next_expiry = min(revoked.values(), default=float("inf"))
+        finally:
+            self._refresh_lock.release()
+
+
+_revocation_list: Optional[TokenRevocationList] = None
+_revocation_list_lock: Lock = Lock()
+
+
+def get_revocation_list() -> TokenRevocationList:
+    """Get the revocation list of this process."""
+    global _revocation_list
+    if _revocation_list is None:
+        with _revocation_list_lock:
+            if _revocation_list is None:
+                _revocation_list = TokenRevocationList()
+    return _revocation_list
+
+
+def revoke_token(token: Token) -> RevokedToken:
+    """
+    Revoke a validated token until its expiry.
+
+    The token is revoked in this worker at once, other workers pick it
+    up on their next refresh. Rows of tokens expired by now are removed.
+
+    Parameters:
+        token: Token
+            Validated token with jti, exp and user claims.
+
+    Returns:
+        RevokedToken
+            The revocation row.
+    """
+    jti: str = token[api_settings.JTI_CLAIM]
+    exp: int = token["exp"]
+    RevokedToken.objects.filter(expires_at__lte=django_timezone.now()).delete()
+    revoked: RevokedToken
+    revoked, _ = RevokedToken.objects.get_or_create(
+        jti=jti,
+        defaults={
+            "user_id": token[api_settings.USER_ID_CLAIM],
+            "expires_at": datetime.fromtimestamp(exp, tz=timezone.utc),
+        },
+    )
+    get_revocation_list().add(jti, exp)
+    return revoked
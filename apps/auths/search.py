@@ -0,0 +1,72 @@
+# Django modules
+from django.conf import settings
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models.query import RawQuerySet
+
+# Project modules
+from apps.abstracts.fts import build_fts_schema_sql, create_fts_schema, rebuild_fts_index
+from apps.auths.models import CustomUser
+
+FTS_TABLE = "auths_customuser_fts"
+
+# Word prefix index: every 1 to 3 character prefix of every token is
+# stored, so "jo" or "j.do" resolve with index lookups only
+SCHEMA_SQL = build_fts_schema_sql(
+    fts_table=FTS_TABLE,
+    content_table="auths_customuser",
+    columns=("email", "full_name"),
+    options="tokenize='unicode61 remove_diacritics 2', prefix='1 2 3'",
+)
+
+
+def create_lookup_schema(connection: BaseDatabaseWrapper) -> None:
+    """Create the FTS5 user index and its triggers when missing."""
+    create_fts_schema(connection, SCHEMA_SQL)
+
+
+def rebuild_lookup_index(connection: BaseDatabaseWrapper) -> None:
+    """Rebuild the FTS5 user index from auths_customuser."""
+    rebuild_fts_index(connection, FTS_TABLE, SCHEMA_SQL)
+
+
+def get_matching_user_ids_sql() -> str:
+    """Get the SQL selecting the ids of users matching a MATCH parameter."""
+    return f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s"
+
+
+def lookup_users(match: str, limit: int) -> RawQuerySet:
+    """
+    Find the top active users for a typeahead query.
+
+    Only the USER_LOOKUP["CANDIDATES"] best ranked index matches are
+    joined with the users table, so a one letter query over a huge
+    table reads few user rows. The cut is made in rank order, the best
+    matches always reach the outer ranking.
+
+    Parameters:
+        match: str
+            Expression from build_match_expression.
+        limit: int
+            Maximum number of users.
+
+    Returns:
+        RawQuerySet
+            Users ordered by relevance, with id, email and full_name loaded.
+    """
+    user_table: str = CustomUser._meta.db_table
+    return CustomUser.objects.raw(
+        f"""
+        SELECT u.id, u.email, u.full_name
+        FROM (
+            SELECT rowid, rank FROM {FTS_TABLE}
+            WHERE {FTS_TABLE} MATCH %s
+            ORDER BY rank, rowid
+            LIMIT %s
+        ) candidates
+        JOIN {user_table} u ON u.id = candidates.rowid
+        WHERE u.is_active AND u.deleted_at IS NULL
+        ORDER BY candidates.rank, u.id
+        LIMIT %s
+        """,
+        [match, settings.USER_LOOKUP["CANDIDATES"], limit],
+    )
@@ -1,11 +1,15 @@
 # Python modules
 from typing import Any, Optional
 
+# Django modules
+from django.conf import settings
+
 # Django REST Framework
 from rest_framework.serializers import Serializer, CharField, EmailField, IntegerField, ListField
 from rest_framework.exceptions import ValidationError
 
 # Project modules
+from apps.abstracts.fts import build_match_expression
 from apps.auths.models import CustomUser
 
 
@@ -69,11 +73,14 @@ class HTTP405MethodNotAllowedSerializer(Serializer):
             "detail",
         )
 
-class UserLoginSerializer(Serializer):
+class UserCredentialsSerializer(Serializer):
     """
-    Serializer for user login.
+    Serializer for login credentials, without any database access.
     """
 
+    EMAIL_NOT_FOUND_MESSAGE = "User with email '{email}' does not exist."
+    INCORRECT_PASSWORD_MESSAGE = "Incorrect password."
+
     email = EmailField(
         required=True,
         max_length=CustomUser.EMAIL_MAX_LENGTH,
@@ -95,6 +102,12 @@ class UserLoginSerializer(Serializer):
         """Validates the email field."""
         return value.lower()
 
+
+class UserLoginSerializer(UserCredentialsSerializer):
+    """
+    Serializer for user login.
+    """
+
     def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
         """Validates the input data."""
         email: str = attrs["email"]
@@ -105,17 +118,92 @@ class UserLoginSerializer(Serializer):
         if not user:
             raise ValidationError(
                 detail={
-                    "email": [f"User with email '{email}' does not exist."]
+                    "email": [self.EMAIL_NOT_FOUND_MESSAGE.format(email=email)]
                 }
             )
 
         if not user.check_password(raw_password=password):
             raise ValidationError(
                 detail={
-                    "password": ["Incorrect password."]
+                    "password": [self.INCORRECT_PASSWORD_MESSAGE]
                 }
             )
 
         attrs["user"] = user    
 
         return super().validate(attrs)
+
+
+class PasswordHashingMetricsSerializer(Serializer):
+    """
+    Serializer for the password hashing pool metrics of a worker process.
+    """
+
+    max_workers = IntegerField()
+    queued = IntegerField()
+    running = IntegerField()
+    completed = IntegerField()
+    peak_queued = IntegerField()
+
+    class Meta:
+        """Customization of the Serializer metadata."""
+
+        fields = (
+            "max_workers",
+            "queued",
+            "running",
+            "completed",
+            "peak_queued",
+        )
+
+
+class UserLookupQuerySerializer(Serializer):
+    """
+    Serializer for validating user typeahead query parameters.
+    """
+
+    QUERY_MAX_LEN = 150
+
+    q = CharField(
+        max_length=QUERY_MAX_LEN,
+        help_text="Beginning of the words of an email or full name.",
+    )
+    limit = IntegerField(
+        min_value=1,
+        max_value=settings.USER_LOOKUP["MAX_LIMIT"],
+        default=settings.USER_LOOKUP["LIMIT"],
+    )
+
+    class Meta:
+        """Customization of the Serializer metadata."""
+
+        fields = (
+            "q",
+            "limit",
+        )
+
+    def validate_q(self, value: str) -> str:
+        """Validates the input and turns it into an FTS5 MATCH expression."""
+        match: Optional[str] = build_match_expression(value)
+        if match is None:
+            raise ValidationError("Enter at least one letter or digit.")
+        return match
+
+
+class UserLookupSerializer(Serializer):
+    """
+    Serializer for user typeahead results.
+    """
+
+    id = IntegerField()
+    email = EmailField()
+    full_name = CharField()
+
+    class Meta:
+        """Customization of the Serializer metadata."""
+
+        fields = (
+            "id",
+            "email",
+            "full_name",
+        )
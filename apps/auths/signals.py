@@ -0,0 +1,24 @@
+# Python modules
+from typing import Any
+
+# Django modules
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# Project modules
+from apps.abstracts.models import post_soft_delete
+from apps.auths.authentication import CachedJWTAuthentication
+from apps.auths.models import CustomUser
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_cached_user(sender: type[CustomUser], instance: CustomUser, **kwargs: dict[str, Any]) -> None:
+    """Drop the user from the authentication user cache."""
+    CachedJWTAuthentication.invalidate_user(instance.pk)
+
+
+@receiver(post_soft_delete, sender=CustomUser)
+def invalidate_cached_users(sender: type[CustomUser], **kwargs: dict[str, Any]) -> None:
+    """Drop every user after a QuerySet soft delete, the rows are not known."""
+    CachedJWTAuthentication.get_user_cache().clear()
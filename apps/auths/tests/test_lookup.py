@@ -0,0 +1,44 @@
+# Django modules
+from django.conf import settings
+from django.test import override_settings
+from django.urls import reverse
+
+# Django REST Framework modules
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+# Project modules
+from apps.abstracts.fts import build_match_expression
+from apps.auths.models import CustomUser
+from apps.auths.search import lookup_users
+
+
+def lookup(text: str, limit: int = 10) -> list[int]:
+    return [user.id for user in lookup_users(match=build_match_expression(text), limit=limit)]
+
+
+class TestUserLookup:
+    def test_prefixes_of_email_and_name_words(self, user: CustomUser) -> None:
+        other: CustomUser = CustomUser.objects.create(email="jo.doe@example.com", full_name="Jo Doe")
+        CustomUser.objects.create(email="gone@example.com", full_name="Jo Gone", is_active=False)
+
+        assert lookup("jo") == [other.id]
+        assert lookup("aut") == [user.id]
+
+    def test_candidates_are_cut_in_rank_order(self, db: None) -> None:
+        # Inserted first, so the lowest rowid, but a weaker match than the second user
+        weak: CustomUser = CustomUser.objects.create(email="zed@example.com", full_name="Annabel Zed")
+        strong: CustomUser = CustomUser.objects.create(email="ann@example.com", full_name="Ann")
+
+        with override_settings(USER_LOOKUP={**settings.USER_LOOKUP, "CANDIDATES": 1}):
+            assert lookup("ann") == [strong.id]
+        assert lookup("ann") == [strong.id, weak.id]
+
+    def test_endpoint(self, user: CustomUser) -> None:
+        client: APIClient = APIClient()
+        client.force_authenticate(user)
+
+        response: Response = client.get(reverse("user-lookup"), {"q": "auth"})
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.data] == [user.id]
@@ -0,0 +1,74 @@
+# Python modules
+from datetime import timedelta
+
+# Django modules
+from django.conf import settings
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+# Django REST Framework modules
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+# Project modules
+from apps.auths.models import CustomUser, RevokedToken
+from apps.auths.revocation import TokenRevocationList, revoke_token
+from apps.auths.tokens import get_login_response_data
+
+
+def authenticated_client(user: CustomUser) -> tuple[APIClient, AccessToken]:
+    access: str = get_login_response_data(user)["access"]
+    client: APIClient = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"JWT {access}")
+    return client, AccessToken(access)
+
+
+class TestRevokeEndpoint:
+    def test_revoked_token_is_rejected(self, user: CustomUser) -> None:
+        client: APIClient
+        token: AccessToken
+        client, token = authenticated_client(user)
+        assert client.get(reverse("project-list")).status_code == 200
+
+        assert client.post(reverse("user-revoke_token")).status_code == 204
+
+        assert RevokedToken.objects.filter(jti=token["jti"], user=user).exists()
+        assert client.get(reverse("project-list")).status_code == 401
+
+    def test_other_tokens_of_the_user_stay_valid(self, user: CustomUser) -> None:
+        revoked_client, _ = authenticated_client(user)
+        other_client, _ = authenticated_client(user)
+        revoked_client.post(reverse("user-revoke_token"))
+
+        assert other_client.get(reverse("project-list")).status_code == 200
+
+
+class TestTokenRevocationList:
+    def test_other_workers_pick_revocations_up_on_refresh(self, user: CustomUser) -> None:
+        worker: TokenRevocationList = TokenRevocationList()
+        token: AccessToken = AccessToken.for_user(user)
+        with override_settings(TOKEN_REVOCATION={**settings.TOKEN_REVOCATION, "REFRESH_INTERVAL": 60}):
+            assert not worker.is_revoked(token["jti"])
+
+            revoke_token(token)
+            assert not worker.is_revoked(token["jti"])  # Until the refresh interval passes
+        worker.refresh()
+        assert worker.is_revoked(token["jti"])
+        assert len(worker) == 1
+
+    def test_expired_entries_are_dropped(self, user: CustomUser) -> None:
+        RevokedToken.objects.create(
+            jti="expired",
+            user=user,
+            expires_at=timezone.now() - timedelta(minutes=1),
+        )
+        worker: TokenRevocationList = TokenRevocationList()
+        worker.add("expiring", exp=int((timezone.now() - timedelta(seconds=1)).timestamp()))
+        worker.refresh()
+
+        assert not worker.is_revoked("expired") and not worker.is_revoked("expiring")
+        assert len(worker) == 0
+
+        revoke_token(AccessToken.for_user(user))
+        assert not RevokedToken.objects.filter(jti="expired").exists()
@@ -0,0 +1,43 @@
+# Django modules
+from django.conf import settings
+from django.test import override_settings
+
+# Django REST Framework modules
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+# Project modules
+from apps.auths.authentication import CachedJWTAuthentication, ClaimsUser
+from apps.auths.models import CustomUser
+from apps.auths.tokens import IDENTITY_CLAIMS, get_login_response_data
+
+
+def embed_identity_claims(enabled: bool) -> override_settings:
+    return override_settings(JWT_AUTH_CACHE={**settings.JWT_AUTH_CACHE, "EMBED_IDENTITY_CLAIMS": enabled})
+
+
+class TestLoginTokens:
+    def test_identity_claims_are_opt_in(self, user: CustomUser) -> None:
+        data: dict = get_login_response_data(user)
+        access_token: AccessToken = AccessToken(data["access"])
+        assert not any(claim in access_token for claim in IDENTITY_CLAIMS)
+        assert isinstance(CachedJWTAuthentication().get_user(access_token), CustomUser)
+
+    def test_identity_claims_are_on_the_access_token_only(self, user: CustomUser) -> None:
+        with embed_identity_claims(True):
+            data: dict = get_login_response_data(user)
+        access_token: AccessToken = AccessToken(data["access"])
+        refresh_token: RefreshToken = RefreshToken(data["refresh"])
+
+        assert (access_token["email"], access_token["full_name"]) == (user.email, user.full_name)
+        assert not any(claim in refresh_token for claim in IDENTITY_CLAIMS)
+        assert not any(claim in refresh_token.access_token for claim in IDENTITY_CLAIMS)
+
+    def test_claims_user_loads_the_user_lazily(self, user: CustomUser) -> None:
+        CachedJWTAuthentication.invalidate_user(user.id)
+        with embed_identity_claims(True):
+            access_token: AccessToken = AccessToken(get_login_response_data(user)["access"])
+
+        claims_user: ClaimsUser = CachedJWTAuthentication().get_user(access_token)
+        assert isinstance(claims_user, ClaimsUser)
+        assert claims_user == user and claims_user.email == user.email
+        assert claims_user.is_active
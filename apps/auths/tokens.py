@@ -0,0 +1,48 @@
+# Python modules
+from typing import Any
+
+# Django modules
+from django.conf import settings
+
+# Django REST Framework modules
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+# Project modules
+from apps.auths.models import CustomUser
+
+# Claims read by ClaimsUser, see CachedJWTAuthentication
+IDENTITY_CLAIMS = ("email", "full_name")
+
+
+def get_login_response_data(user: CustomUser) -> dict[str, Any]:
+    """
+    Issue a JWT pair for a user and build the login response body.
+
+    Shared by the sync and async login views, see UserLoginResponseSerializer.
+    With JWT_AUTH_CACHE["EMBED_IDENTITY_CLAIMS"] the access token carries
+    the IDENTITY_CLAIMS as they are at login, for its short lifetime.
+    The refresh token does not, access tokens issued on refresh resolve
+    the user from the database.
+
+    Parameters:
+        user: CustomUser
+            The authenticated CustomUser instance.
+
+    Returns:
+        dict[str, Any]
+            User data along with access and refresh tokens.
+    """
+    refresh_token: RefreshToken = RefreshToken.for_user(user)
+    access_token: AccessToken = refresh_token.access_token
+    if settings.JWT_AUTH_CACHE["EMBED_IDENTITY_CLAIMS"]:
+        claim: str
+        for claim in IDENTITY_CLAIMS:
+            access_token[claim] = getattr(user, claim)
+
+    return {
+        "id": user.id,
+        "full_name": user.full_name,
+        "email": user.email,
+        "access": str(access_token),
+        "refresh": str(refresh_token),
+    }
@@ -5,6 +5,7 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 # Project modules
+from apps.auths.async_views import login_async
 from apps.auths.views import CustomUserViewSet
 
 
@@ -19,5 +20,6 @@ router.register(
 )
 
 urlpatterns = [
+    path("v1/users/login/async", login_async, name="user-login-async"),
     path("v1/", include(router.urls)),
 ]
@@ -1,19 +1,30 @@
 # Python modules
 from typing import Any
-from rest_framework_simplejwt.tokens import RefreshToken
-from drf_spectacular.utils import extend_schema, OpenApiResponse
 
 # Django REST Framework
 from rest_framework.viewsets import ViewSet
 from rest_framework.request import Request as DRFRequest
 from rest_framework.response import Response as DRFResponse
-from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST, HTTP_405_METHOD_NOT_ALLOWED
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.status import HTTP_200_OK, HTTP_204_NO_CONTENT, HTTP_400_BAD_REQUEST, HTTP_405_METHOD_NOT_ALLOWED
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.decorators import action
 
 # Project modules
+from apps.abstracts.openapi import extend_schema, OpenApiResponse
+from apps.auths.hashing import get_password_hash_pool
 from apps.auths.models import CustomUser
-from apps.auths.serializers import UserLoginSerializer, UserLoginResponseSerializer, UserLoginErrorsSerializer, HTTP405MethodNotAllowedSerializer
+from apps.auths.revocation import revoke_token
+from apps.auths.search import lookup_users
+from apps.auths.serializers import (
+    UserLoginSerializer,
+    UserLoginResponseSerializer,
+    UserLoginErrorsSerializer,
+    HTTP405MethodNotAllowedSerializer,
+    UserLookupQuerySerializer,
+    UserLookupSerializer,
+    PasswordHashingMetricsSerializer,
+)
+from apps.auths.tokens import get_login_response_data
 
 
 class CustomUserViewSet(ViewSet):
@@ -76,21 +87,87 @@ class CustomUserViewSet(ViewSet):
 
         user: CustomUser = serializer.validated_data.pop("user")
 
-        # Generate JWT tokens
-        refresh_token: RefreshToken = RefreshToken.for_user(user)
-        access_token: str = str(refresh_token.access_token)
+        return DRFResponse(
+            data=get_login_response_data(user),
+            status=HTTP_200_OK
+        )
+
+    @extend_schema(
+        summary="Password hashing metrics of the async login",
+        responses={
+            HTTP_200_OK: PasswordHashingMetricsSerializer,
+        }
+    )
+    @action(
+        methods=("GET",),
+        detail=False,
+        url_path="login/metrics",
+        url_name="login_metrics",
+        permission_classes=(IsAdminUser,)
+    )
+    def login_metrics(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """
+        Fetch the password hashing pool state of the worker process.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: tuple
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+
+        Returns:
+            DRFResponse
+                Response containing the queue depth and worker usage.
+        """
+
+        serializer: PasswordHashingMetricsSerializer = PasswordHashingMetricsSerializer(
+            instance=get_password_hash_pool().get_metrics()
+        )
 
         return DRFResponse(
-            data={
-                "id": user.id,
-                "full_name": user.full_name,
-                "email": user.email,
-                "access": access_token,
-                "refresh": str(refresh_token),
-            },
+            data=serializer.data,
             status=HTTP_200_OK
         )
 
+    @extend_schema(
+        summary="Revoke the access token of the request",
+        request=None,
+        responses={
+            HTTP_204_NO_CONTENT: None,
+        }
+    )
+    @action(
+        methods=("POST",),
+        detail=False,
+        url_path="token/revoke",
+        url_name="revoke_token",
+        permission_classes=(IsAuthenticated,)
+    )
+    def revoke_token(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """
+        Revoke the access token used by the request until it expires (logout).
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: tuple
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+
+        Returns:
+            DRFResponse
+                Empty response.
+        """
+
+        revoke_token(request.auth)
+
+        return DRFResponse(
+            status=HTTP_204_NO_CONTENT
+        )
+
     @action(
         methods=("GET",),
         detail=False,
@@ -125,3 +202,52 @@ class CustomUserViewSet(ViewSet):
             },
             status=HTTP_200_OK
         )
+
+    @extend_schema(
+        summary="User typeahead lookup",
+        parameters=[UserLookupQuerySerializer],
+        responses={
+            HTTP_200_OK: UserLookupSerializer(many=True),
+        }
+    )
+    @action(
+        methods=("GET",),
+        detail=False,
+        url_name="lookup",
+        url_path="lookup",
+        permission_classes=(IsAuthenticated,)
+    )
+    def lookup(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """
+        Find active users by the beginning of the words of their email or name.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: tuple
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+
+        Returns:
+            DRFResponse
+                Response containing the best matching users.
+        """
+
+        query_serializer: UserLookupQuerySerializer = UserLookupQuerySerializer(
+            data=request.query_params
+        )
+        query_serializer.is_valid(raise_exception=True)
+
+        serializer: UserLookupSerializer = UserLookupSerializer(
+            instance=lookup_users(
+                match=query_serializer.validated_data["q"],
+                limit=query_serializer.validated_data["limit"],
+            ),
+            many=True,
+        )
+
+        return DRFResponse(
+            data=serializer.data,
+            status=HTTP_200_OK
+        )
@@ -0,0 +1,153 @@
+# Python modules
+from typing import Any, Callable, Iterator, Optional
+from pathlib import Path
+import os
+
+# Django modules
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connections, router
+from django.test.utils import setup_databases, setup_test_environment, teardown_databases, teardown_test_environment
+import django
+
+# Pytest modules
+import pytest
+
+os.environ.setdefault("DJANGORLAR_ENV_ID", "local")
+os.environ.setdefault("SECRET_KEY", "insecure-test-secret-key")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings.env.local")
+django.setup()
+
+# Project modules
+from apps.auths import revocation  # noqa: E402
+from apps.auths.authentication import CachedJWTAuthentication  # noqa: E402
+from apps.auths.models import CustomUser  # noqa: E402
+from apps.tasks.models import Project  # noqa: E402
+from apps.tasks.sharding import id_allocator, project_shard, reserve_project_id, shard_map  # noqa: E402
+
+SHARD_ALIAS = "shard_1"
+REPLICA_ALIAS = "replica_1"
+
+
+def reset_routing() -> None:
+    """Rebuild the routers and forget shard placements and id blocks."""
+    router.__dict__.pop("routers", None)
+    shard_map._placements = None
+    id_allocator._blocks.clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def django_test_environment(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Set up Django's test environment, e.g. "testserver" in ALLOWED_HOSTS."""
+    setup_test_environment()
+    # Never write into the project's shared cache directory
+    settings.CACHES["shared"]["LOCATION"] = str(tmp_path_factory.mktemp("cache"))
+    yield
+    teardown_test_environment()
+
+
+@pytest.fixture(scope="session")
+def django_db_setup(django_test_environment: None, tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """
+    Create the test databases once per session.
+
+    The databases are files rather than shared in-memory ones, so
+    threads get their own connections and real SQLite locking.
+    """
+    directory: Path = tmp_path_factory.mktemp("databases")
+
+    alias: str
+    for alias in connections:
+        connections[alias].settings_dict["TEST"]["NAME"] = str(directory / f"{alias}.sqlite3")
+    old_config: list[Any] = setup_databases(verbosity=0, interactive=False)
+    yield directory
+    teardown_databases(old_config, verbosity=0)
+
+
+@pytest.fixture
+def db(django_db_setup: Path) -> Iterator[None]:
+    """
+    Give a test the test databases, emptied afterwards.
+
+    Data is committed for real, on_commit callbacks and other threads
+    see it, so every table is flushed after the test instead of rolling
+    a transaction back.
+    """
+    yield
+    alias: str
+    for alias in connections:
+        call_command("flush", interactive=False, verbosity=0, database=alias)
+    for alias in settings.CACHES:
+        caches[alias].clear()
+    # Ids are reused once the tables are flushed
+    CachedJWTAuthentication._tokens = CachedJWTAuthentication._users = None
+    revocation._revocation_list = None
+    reset_routing()
+
+
+@pytest.fixture(scope="session")
+def shard_database(django_db_setup: Path) -> str:
+    """Create a second project database, left out of routing until a test asks for it."""
+    connections.settings[SHARD_ALIAS] = {
+        **connections.settings["default"],
+        "NAME": str(django_db_setup / f"{SHARD_ALIAS}.live.sqlite3"),
+        "SHARD": False,
+        "TEST": {
+            **connections.settings["default"]["TEST"],
+            "NAME": str(django_db_setup / f"{SHARD_ALIAS}.sqlite3"),
+        },
+    }
+    connections[SHARD_ALIAS].creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    return SHARD_ALIAS
+
+
+@pytest.fixture
+def sharded(shard_database: str, db: None) -> Iterator[str]:
+    """Spread projects over default and a second shard during the test."""
+    connections.settings[shard_database]["SHARD"] = True
+    reset_routing()
+    yield shard_database
+    connections.settings[shard_database]["SHARD"] = False
+    reset_routing()
+
+
+@pytest.fixture
+def replica(db: None) -> Iterator[str]:
+    """Add a read replica during the test, a second connection to the default test database."""
+    connections.settings[REPLICA_ALIAS] = {
+        **connections.settings["default"],
+        "REPLICA": True,
+        "TEST": {**connections.settings["default"]["TEST"], "MIRROR": "default"},
+    }
+    reset_routing()
+    yield REPLICA_ALIAS
+    connections[REPLICA_ALIAS].close()
+    del connections[REPLICA_ALIAS]
+    del connections.settings[REPLICA_ALIAS]
+    reset_routing()
+
+
+@pytest.fixture
+def user(db: None) -> CustomUser:
+    """A user without a usable password, hashing is not under test."""
+    return CustomUser.objects.create(email="author@example.com", full_name="Author")
+
+
+@pytest.fixture
+def project_factory(db: None) -> Callable[..., Project]:
+    """Create projects the way the views do, on the shard picked for their id."""
+    def create_project(author: CustomUser, name: str = "Project") -> Project:
+        project_id: Optional[int] = reserve_project_id()
+        with project_shard(project_id):
+            project: Project = Project.objects.create(id=project_id, name=name, author=author)
+            project.users.add(author)
+        return project
+
+    return create_project
+
+
+@pytest.fixture
+def project(project_factory: Callable[..., Project], user: CustomUser) -> Project:
+    """A project of the user fixture, who is also its member."""
+    return project_factory(author=user)
@@ -6,7 +6,7 @@ from django.contrib.admin import ModelAdmin, register
 from django.core.handlers.wsgi import WSGIRequest
 
 # Project modules
-from apps.tasks.models import Task, UserTask, Project
+from apps.tasks.models import Task, UserTask, Project, ProjectDeletionJob
 
 
 @register(Project)
@@ -116,3 +116,30 @@ class UserTaskAdmin(ModelAdmin):
     """
 
     ...
+
+
+@register(ProjectDeletionJob)
+class ProjectDeletionJobAdmin(ModelAdmin):
+    """
+    ProjectDeletionJob admin configuration class.
+    """
+
+    list_display = (
+        "id",
+        "project",
+        "status",
+        "tasks_deleted",
+        "user_tasks_deleted",
+        "updated_at",
+    )
+    list_filter = (
+        "status",
+    )
+    readonly_fields = (
+        "project",
+        "last_task_id",
+        "tasks_deleted",
+        "user_tasks_deleted",
+        "created_at",
+        "updated_at",
+    )
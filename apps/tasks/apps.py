@@ -1,7 +1,26 @@
+# Python modules
+from typing import Any
+
+# Django modules
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def ensure_search_schema(using: str, **kwargs: dict[str, Any]) -> None:
+    """Recreate the task search triggers a rebuild of tasks_task may have dropped."""
+    from apps.abstracts.fts import ensure_fts_triggers
+    from apps.tasks.search import FTS_TABLE, SCHEMA_SQL
+
+    ensure_fts_triggers(using=using, fts_table=FTS_TABLE, statements=SCHEMA_SQL)
 
 
 class TasksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.tasks'
     verbose_name = "Tasks management"
+
+    def ready(self) -> None:
+        """Connect the app's signal receivers."""
+        from apps.tasks import signals  # noqa: F401
+
+        post_migrate.connect(ensure_search_schema, sender=self)
@@ -0,0 +1,207 @@
+# Python modules
+from typing import Any, Callable
+from collections import Counter
+from datetime import datetime
+
+# Django modules
+from django.db import router, transaction
+from django.db.models import Exists, Max, OuterRef, QuerySet
+
+# Project modules
+from apps.abstracts.models import delete_rows
+from apps.tasks.caching import invalidate_projects
+from apps.tasks.counters import apply_task_status_deltas
+from apps.tasks.models import ArchivedTask, ArchivedUserTask, Task, UserTask
+
+# Columns copied into ArchivedTask
+ARCHIVED_TASK_FIELDS = (
+    "id",
+    "project_id",
+    "parent_id",
+    "name",
+    "description",
+    "status",
+    "created_at",
+    "updated_at",
+)
+
+
+def process_leaf_batches(
+    queryset: QuerySet[Task],
+    batch_size: int,
+    handle: Callable[[list[dict[str, Any]]], None],
+) -> int:
+    """
+    Feed the matching tasks to a handler in batches, deepest level first.
+
+    Only tasks without any child row are selected, so a handler removing
+    them never leaves a dangling parent reference; going from the deepest
+    level up lets a whole matching subtree go in a single run. Every
+    batch is selected and handled in its own transaction.
+
+    Parameters:
+        queryset: QuerySet[Task]
+            Tasks to process, from Task._base_manager.
+        batch_size: int
+            Maximum number of tasks per batch.
+        handle: Callable
+            Receives the ARCHIVED_TASK_FIELDS values of a batch.
+
+    Returns:
+        int
+            Number of processed tasks.
+    """
+    deepest: int | None = queryset.aggregate(deepest=Max("depth"))["deepest"]
+    if deepest is None:
+        return 0
+
+    leaves: QuerySet[Task] = queryset.filter(
+        ~Exists(Task._base_manager.filter(parent_id=OuterRef("pk")))
+    )
+    processed: int = 0
+
+    depth: int
+    for depth in range(deepest, -1, -1):
+        last_id: int = 0
+        while True:
+            with transaction.atomic(using=router.db_for_write(Task)):
+                rows: list[dict[str, Any]] = list(
+                    leaves.filter(
+                        depth=depth,
+                        id__gt=last_id,
+                    ).order_by("id").values(*ARCHIVED_TASK_FIELDS)[:batch_size]
+                )
+                if not rows:
+                    break
+                handle(rows)
+
+            processed += len(rows)
+            last_id = rows[-1]["id"]
+    return processed
+
+
+def archive_done_tasks(cutoff: datetime, batch_size: int) -> int:
+    """
+    Move live done tasks not updated since the cutoff into the archive tables.
+
+    Live assignments move into ArchivedUserTask, the rows are removed
+    from the live tables and the project counters are shifted.
+
+    Parameters:
+        cutoff: datetime
+            Tasks updated before this moment are archived.
+        batch_size: int
+            Maximum number of tasks per transaction.
+
+    Returns:
+        int
+            Number of archived tasks.
+    """
+
+    def archive(rows: list[dict[str, Any]]) -> None:
+        task_ids: list[int] = [row["id"] for row in rows]
+        ArchivedTask.objects.bulk_create(
+            [ArchivedTask(**row) for row in rows],
+        )
+        ArchivedUserTask.objects.bulk_create(
+            [
+                ArchivedUserTask(task_id=task_id, user_id=user_id)
+                for task_id, user_id in UserTask._base_manager.filter(
+                    task_id__in=task_ids,
+                    deleted_at__isnull=True,
+                ).values_list("task_id", "user_id")
+            ],
+            ignore_conflicts=True,
+        )
+        delete_task_rows(task_ids)
+
+        project_id: int
+        count: int
+        for project_id, count in Counter(row["project_id"] for row in rows).items():
+            apply_task_status_deltas(
+                project_id=project_id,
+                status_deltas={Task.STATUS_DONE: -count},
+            )
+        invalidate_projects({row["project_id"] for row in rows})
+
+    return process_leaf_batches(
+        queryset=Task._base_manager.filter(
+            status=Task.STATUS_DONE,
+            deleted_at__isnull=True,
+            updated_at__lt=cutoff,
+        ),
+        batch_size=batch_size,
+        handle=archive,
+    )
+
+
+def purge_deleted_tasks(cutoff: datetime, batch_size: int) -> int:
+    """
+    Remove tasks soft deleted before the cutoff, with all their assignments.
+
+    Parameters:
+        cutoff: datetime
+            Tasks soft deleted before this moment are removed.
+        batch_size: int
+            Maximum number of tasks per transaction.
+
+    Returns:
+        int
+            Number of removed tasks.
+    """
+    return process_leaf_batches(
+        queryset=Task._base_manager.filter(
+            deleted_at__lt=cutoff,
+        ),
+        batch_size=batch_size,
+        handle=lambda rows: delete_task_rows([row["id"] for row in rows]),
+    )
+
+
+def purge_deleted_user_tasks(cutoff: datetime, batch_size: int) -> int:
+    """
+    Remove assignments soft deleted before the cutoff.
+
+    Parameters:
+        cutoff: datetime
+            Assignments soft deleted before this moment are removed.
+        batch_size: int
+            Maximum number of rows per transaction.
+
+    Returns:
+        int
+            Number of removed assignments.
+    """
+    using: str = router.db_for_write(UserTask)
+    removed: int = 0
+    last_id: int = 0
+    while True:
+        with transaction.atomic(using=using):
+            ids: list[int] = list(
+                UserTask._base_manager.filter(
+                    id__gt=last_id,
+                    deleted_at__lt=cutoff,
+                ).order_by("id").values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                return removed
+            removed += delete_rows(UserTask._base_manager.filter(id__in=ids), using=using)
+        last_id = ids[-1]
+
+
+def delete_task_rows(task_ids: list[int]) -> None:
+    """
+    Delete tasks and their assignments with plain DELETEs, without signals.
+
+    Parameters:
+        task_ids: list[int]
+            Ids of tasks without child rows.
+    """
+    delete_rows(
+        UserTask._base_manager.filter(task_id__in=task_ids),
+        using=router.db_for_write(UserTask),
+    )
+    delete_rows(
+        Task._base_manager.filter(id__in=task_ids),
+        using=router.db_for_write(Task),
+    )
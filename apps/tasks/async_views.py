@@ -0,0 +1,159 @@
+# Python modules
+from typing import Any, Optional
+
+# Django modules
+from asgiref.sync import sync_to_async
+
+# Django REST Framework modules
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request as DRFRequest
+from rest_framework.response import Response as DRFResponse
+from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_400_BAD_REQUEST
+
+# Project modules
+from apps.abstracts.async_views import AsyncAPIView
+from apps.abstracts.cache import response_cache
+from apps.abstracts.pagination import KeysetPaginator
+from apps.tasks.caching import PROJECTS_SCOPE
+from apps.tasks.mixins import ProjectResolverMixin
+from apps.tasks.models import Project
+from apps.tasks.permissions import IsUserInProject
+from apps.tasks.serializers import ProjectAsyncCreateSerializer, ProjectListSerializer
+from apps.tasks.sharding import aproject_shard, reserve_project_id, shard_querysets
+
+
+class AsyncProjectListView(AsyncAPIView):
+    """
+    Async counterpart of the list and create actions of ProjectViewSet.
+    """
+
+    async def get(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """
+        Handle GET requests to list projects.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: list
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+
+        Returns:
+            DRFResponse
+                A response containing a page of projects and the next page link.
+        """
+
+        async def get_page_data() -> dict[str, Any]:
+            context: dict[str, Any] = ProjectListSerializer.get_fieldset_context(request)
+            paginator: KeysetPaginator = KeysetPaginator(
+                ordering=("-updated_at", "-id")
+            )
+            page: list[Project] = await paginator.apaginate_querysets(
+                querysets=shard_querysets(
+                    ProjectListSerializer.optimize_queryset(
+                        queryset=Project.objects.all(),
+                        context=context,
+                        required_fields=("updated_at",),
+                    )
+                ),
+                request=request,
+            )
+
+            serializer: ProjectListSerializer = ProjectListSerializer(
+                page,
+                many=True,
+                context=context,
+            )
+            return paginator.get_paginated_data(
+                data=serializer.data
+            )
+
+        return DRFResponse(
+            data=await response_cache.aget_or_compute(
+                key=await response_cache.abuild_key(
+                    endpoint="projects.list",
+                    scopes=(PROJECTS_SCOPE,),
+                    variant=request.build_absolute_uri(),
+                ),
+                compute=get_page_data,
+            ),
+            status=HTTP_200_OK
+        )
+
+    async def post(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """
+        Handle POST requests to create a new project.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: list
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+
+        Returns:
+            DRFResponse
+                A response indicating the result of the creation operation.
+        """
+        serializer: ProjectAsyncCreateSerializer = ProjectAsyncCreateSerializer(
+            data=request.data
+        )
+
+        if not serializer.is_valid():
+            return DRFResponse(
+                data=serializer.errors,
+                status=HTTP_400_BAD_REQUEST
+            )
+
+        await serializer.avalidate_users()
+        project_id: Optional[int] = await sync_to_async(reserve_project_id)()
+        async with aproject_shard(project_id):
+            await serializer.asave(project_id=project_id)
+
+        return DRFResponse(
+            data=serializer.data,
+            status=HTTP_201_CREATED
+        )
+
+
+class AsyncProjectDetailView(ProjectResolverMixin, AsyncAPIView):
+    """
+    Async counterpart of the retrieve action of ProjectViewSet.
+    """
+
+    permission_classes = (IsAuthenticated, IsUserInProject,)
+
+    async def get(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """
+        Handle GET requests to fetch a project.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: list
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+
+        Returns:
+            DRFResponse
+                A response containing the project, "?fields=" and "?expand=" apply.
+        """
+        async with aproject_shard(kwargs["pk"]):
+            project: Project = await self.aget_project(
+                request=request,
+                pk=kwargs["pk"],
+                error_key="pk",
+            )
+
+        serializer: ProjectListSerializer = ProjectListSerializer(
+            project,
+            context=ProjectListSerializer.get_fieldset_context(request),
+        )
+
+        return DRFResponse(
+            data=serializer.data,
+            status=HTTP_200_OK
+        )
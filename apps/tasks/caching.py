@@ -0,0 +1,31 @@
+# Python modules
+from typing import Iterable
+
+# Project modules
+from apps.abstracts.cache import response_cache
+from apps.tasks.sharding import get_current_shard
+
+# Scope of every cached project listing
+PROJECTS_SCOPE = "projects"
+
+
+def project_scope(project_id: int) -> str:
+    """Get the invalidation scope of the cached responses of a single project."""
+    return f"project:{project_id}"
+
+
+def invalidate_projects(project_ids: Iterable[int]) -> None:
+    """
+    Invalidate the cached responses of the given projects and the project listings.
+
+    Project listings are invalidated too, they render the project counters.
+    The invalidation waits for the transaction of the current shard.
+
+    Parameters:
+        project_ids: Iterable[int]
+            Ids of the changed projects.
+    """
+    response_cache.invalidate(
+        [PROJECTS_SCOPE, *(project_scope(project_id) for project_id in project_ids)],
+        using=get_current_shard(),
+    )
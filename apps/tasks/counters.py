@@ -0,0 +1,158 @@
+# Python modules
+from typing import Iterable, Mapping, Optional
+
+# Django modules
+from django.db.models import Count, F, Q
+
+# Project modules
+from apps.tasks.models import Project, Task
+
+# Task status -> Project counter column
+TASK_STATUS_COUNTER_FIELDS = {
+    Task.STATUS_TODO: "tasks_todo_count",
+    Task.STATUS_IN_PROGRESS: "tasks_in_progress_count",
+    Task.STATUS_DONE: "tasks_done_count",
+}
+COUNTER_FIELDS = (
+    "members_count",
+    "tasks_count",
+    *TASK_STATUS_COUNTER_FIELDS.values(),
+)
+
+
+def get_task_counter_state(task: Task) -> Optional[tuple[int, bool]]:
+    """
+    Get the part of a task's state the project counters depend on.
+
+    Parameters:
+        task: Task
+            The Task instance.
+
+    Returns:
+        Optional[tuple[int, bool]]
+            (status, is_live) or None when those fields were deferred.
+    """
+    if {"status", "deleted_at"} & task.get_deferred_fields():
+        return None
+    return task.status, task.deleted_at is None
+
+
+def apply_task_status_deltas(project_id: int, status_deltas: Mapping[int, int]) -> None:
+    """
+    Shift the task counters of a project with a single UPDATE.
+
+    Parameters:
+        project_id: int
+            The Project id.
+        status_deltas: Mapping[int, int]
+            Task status -> change of the number of live tasks.
+    """
+    updates: dict[str, F] = {}
+    total: int = 0
+
+    status: int
+    delta: int
+    for status, delta in status_deltas.items():
+        if delta:
+            field: str = TASK_STATUS_COUNTER_FIELDS[status]
+            updates[field] = F(field) + delta
+            total += delta
+
+    if not updates:
+        return
+    if total:
+        updates["tasks_count"] = F("tasks_count") + total
+    Project._base_manager.filter(id=project_id).update(**updates)
+
+
+def apply_members_delta(project_id: int, delta: int) -> None:
+    """
+    Shift the members counter of a project with a single UPDATE.
+
+    Parameters:
+        project_id: int
+            The Project id.
+        delta: int
+            Change of the number of members.
+    """
+    if delta:
+        Project._base_manager.filter(id=project_id).update(
+            members_count=F("members_count") + delta
+        )
+
+
+def count_project_stats(project_ids: Iterable[int]) -> dict[int, dict[str, int]]:
+    """
+    Count the real values of every counter for the given projects.
+
+    Parameters:
+        project_ids: Iterable[int]
+            Project ids to count.
+
+    Returns:
+        dict
+            Project id -> counter field -> value.
+    """
+    ids: list[int] = list(project_ids)
+    stats: dict[int, dict[str, int]] = {
+        project_id: dict.fromkeys(COUNTER_FIELDS, 0)
+        for project_id in ids
+    }
+
+    row: dict[str, int]
+    for row in Project.users.through.objects.filter(
+        project_id__in=ids
+    ).order_by().values("project_id").annotate(count=Count("id")):
+        stats[row["project_id"]]["members_count"] = row["count"]
+
+    for row in Task._base_manager.filter(
+        Q(project_id__in=ids) & Q(deleted_at__isnull=True)
+    ).order_by().values("project_id", "status").annotate(count=Count("id")):
+        counters: dict[str, int] = stats[row["project_id"]]
+        counters[TASK_STATUS_COUNTER_FIELDS[row["status"]]] = row["count"]
+        counters["tasks_count"] += row["count"]
+
+    return stats
+
+
+def recount_projects(project_ids: Iterable[int]) -> None:
+    """
+    Overwrite the counters of the given projects with real counts.
+
+    Parameters:
+        project_ids: Iterable[int]
+            Project ids to recount.
+    """
+    project_id: int
+    counters: dict[str, int]
+    for project_id, counters in count_project_stats(project_ids).items():
+        Project._base_manager.filter(id=project_id).update(**counters)
+
+
+def reconcile_projects(projects: Iterable[Project]) -> list[Project]:
+    """
+    Overwrite drifted counters of the given projects with real values.
+
+    Parameters:
+        projects: Iterable[Project]
+            Projects with counter fields loaded.
+
+    Returns:
+        list[Project]
+            Projects whose counters were corrected.
+    """
+    by_id: dict[int, Project] = {project.id: project for project in projects}
+    drifted: list[Project] = []
+
+    project_id: int
+    counters: dict[str, int]
+    for project_id, counters in count_project_stats(by_id).items():
+        project: Project = by_id[project_id]
+        if any(getattr(project, field) != value for field, value in counters.items()):
+            for field, value in counters.items():
+                setattr(project, field, value)
+            drifted.append(project)
+
+    if drifted:
+        Project._base_manager.bulk_update(drifted, fields=COUNTER_FIELDS)
+    return drifted
@@ -0,0 +1,253 @@
+# Python modules
+from typing import Optional
+from datetime import datetime, timedelta
+from threading import Thread
+from time import sleep
+import logging
+
+# Django modules
+from django.conf import settings
+from django.db import DatabaseError, OperationalError, connections, router, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+# Project modules
+from apps.tasks.caching import invalidate_projects
+from apps.tasks.counters import recount_projects
+from apps.tasks.models import Project, ProjectDeletionJob, Task, UserTask
+from apps.tasks.sharding import project_shard
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def schedule_project_deletion(project: Project) -> ProjectDeletionJob:
+    """
+    Soft delete a project and queue the cascade over its contents.
+
+    Only the project row and the job row are written, so the cost does
+    not depend on the project size. The cascade starts in a background
+    thread once the surrounding transaction of the project's shard
+    commits (see PROJECT_DELETION["RUN_IN_BACKGROUND"]).
+
+    Parameters:
+        project: Project
+            The Project instance.
+
+    Returns:
+        ProjectDeletionJob
+            The queued job.
+    """
+    with project_shard(project.id):
+        using: str = router.db_for_write(ProjectDeletionJob)
+        with transaction.atomic(using=using):
+            project.delete()
+            job: ProjectDeletionJob
+            job, _ = ProjectDeletionJob.all_objects.update_or_create(
+                project=project,
+                defaults={
+                    "status": ProjectDeletionJob.STATUS_PENDING,
+                    "last_task_id": 0,
+                    "tasks_deleted": 0,
+                    "user_tasks_deleted": 0,
+                },
+            )
+
+        if settings.PROJECT_DELETION["RUN_IN_BACKGROUND"]:
+            transaction.on_commit(lambda: start_project_deletion(job.id, project.id), using=using)
+    return job
+
+
+def start_project_deletion(job_id: int, project_id: int) -> Thread:
+    """Run a deletion job in a daemon thread."""
+    thread: Thread = Thread(
+        target=_run_in_thread,
+        args=(job_id, project_id),
+        name=f"project-deletion-{job_id}",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+def _run_in_thread(job_id: int, project_id: int) -> None:
+    """
+    Thread target, the thread's database connections are closed at the end.
+
+    Threads do not inherit the shard scope, the job runs on the shard
+    of its project. A run failing on a locked database is retried with an exponential
+    backoff (see PROJECT_DELETION["RETRIES"] and ["RETRY_BACKOFF"]).
+    """
+    retries: int = settings.PROJECT_DELETION["RETRIES"]
+    try:
+        attempt: int
+        for attempt in range(retries + 1):
+            try:
+                with project_shard(project_id):
+                    run_project_deletion_job(job_id=job_id)
+                return
+            except OperationalError:
+                if attempt == retries:
+                    raise
+                logger.warning("Project deletion job %s hit a locked database, retrying.", job_id)
+                connections.close_all()
+                sleep(settings.PROJECT_DELETION["RETRY_BACKOFF"] * 2 ** attempt)
+    except Exception:
+        # Progress is committed per batch, runprojectdeletions resumes the job
+        logger.exception("Project deletion job %s failed.", job_id)
+    finally:
+        connections.close_all()
+
+
+def claim_project_deletion_job(job_id: int) -> Optional[ProjectDeletionJob]:
+    """
+    Take a pending or stale running job over, so a job has a single runner.
+
+    Parameters:
+        job_id: int
+            ProjectDeletionJob id.
+
+    Returns:
+        Optional[ProjectDeletionJob]
+            The claimed job, None if it is done or actively running.
+    """
+    now: datetime = timezone.now()
+    stale_before: datetime = now - timedelta(seconds=settings.PROJECT_DELETION["STALE_AFTER"])
+
+    claimed: int = ProjectDeletionJob.objects.filter(
+        Q(status=ProjectDeletionJob.STATUS_PENDING)
+        | Q(status=ProjectDeletionJob.STATUS_RUNNING, updated_at__lt=stale_before),
+        id=job_id,
+    ).update(
+        status=ProjectDeletionJob.STATUS_RUNNING,
+        updated_at=now,
+    )
+    if not claimed:
+        return None
+    return ProjectDeletionJob.objects.get(id=job_id)
+
+
+def release_project_deletion_job(job_id: int) -> None:
+    """
+    Put a job that failed while running back to PENDING.
+
+    The next runner claims it right away instead of waiting for
+    PROJECT_DELETION["STALE_AFTER"].
+
+    Parameters:
+        job_id: int
+            ProjectDeletionJob id.
+    """
+    try:
+        ProjectDeletionJob.objects.filter(
+            id=job_id,
+            status=ProjectDeletionJob.STATUS_RUNNING,
+        ).update(
+            status=ProjectDeletionJob.STATUS_PENDING,
+            updated_at=timezone.now(),
+        )
+    except DatabaseError:
+        # Still unavailable, the job is taken over once stale
+        logger.warning("Project deletion job %s could not be released.", job_id)
+
+
+def process_project_deletion_batch(
+    job: ProjectDeletionJob,
+    deleted_at: datetime,
+    batch_size: int,
+) -> bool:
+    """
+    Tombstone the next batch of tasks and their assignments in one transaction.
+
+    Runs on the shard of the current scope, like run_project_deletion_job.
+
+    Parameters:
+        job: ProjectDeletionJob
+            The claimed job, its progress is saved with the batch.
+        deleted_at: datetime
+            Deletion time of the project, stamped on every row.
+        batch_size: int
+            Maximum number of tasks per batch.
+
+    Returns:
+        bool
+            False once there is nothing left to delete.
+    """
+    with transaction.atomic(using=router.db_for_write(ProjectDeletionJob)):
+        # Write first: a transaction that reads before writing cannot wait
+        # for another SQLite writer and fails at once with "database is
+        # locked", whereas a first write waits for the busy timeout
+        ProjectDeletionJob.objects.filter(id=job.id).update(updated_at=timezone.now())
+
+        task_ids: list[int] = list(
+            Task._base_manager.filter(
+                project_id=job.project_id,
+                id__gt=job.last_task_id,
+            ).order_by("id").values_list("id", flat=True)[:batch_size]
+        )
+        if not task_ids:
+            return False
+
+        # An id range of a single project, no parameter list per row
+        batch: Q = Q(id__gt=job.last_task_id, id__lte=task_ids[-1])
+        job.user_tasks_deleted += UserTask._base_manager.filter(
+            task_id__in=Task._base_manager.filter(batch, project_id=job.project_id).values("id"),
+            deleted_at__isnull=True,
+        ).update(deleted_at=deleted_at)
+        job.tasks_deleted += Task._base_manager.filter(
+            batch,
+            project_id=job.project_id,
+            deleted_at__isnull=True,
+        ).update(deleted_at=deleted_at)
+
+        job.last_task_id = task_ids[-1]
+        job.save(update_fields=["last_task_id", "tasks_deleted", "user_tasks_deleted", "updated_at"])
+    return True
+
+
+def run_project_deletion_job(job_id: int, batch_size: Optional[int] = None) -> Optional[ProjectDeletionJob]:
+    """
+    Claim a deletion job and run it batch by batch until it is done.
+
+    Every batch commits on its own, so an interrupted run resumes from
+    the last committed batch. A project restored in the meantime stops
+    the job without touching its contents. Job ids are per shard, the
+    job is looked up on the shard of the current scope.
+
+    Parameters:
+        job_id: int
+            ProjectDeletionJob id.
+        batch_size: Optional[int]
+            Tasks per batch, PROJECT_DELETION["BATCH_SIZE"] by default.
+
+    Returns:
+        Optional[ProjectDeletionJob]
+            The finished job, None if it could not be claimed.
+    """
+    job: Optional[ProjectDeletionJob] = claim_project_deletion_job(job_id)
+    if job is None:
+        return None
+
+    batch_size = batch_size or settings.PROJECT_DELETION["BATCH_SIZE"]
+    try:
+        deleted_at: Optional[datetime] = Project._base_manager.filter(
+            id=job.project_id,
+        ).values_list("deleted_at", flat=True).first()
+
+        while deleted_at is not None and process_project_deletion_batch(
+            job=job,
+            deleted_at=deleted_at,
+            batch_size=batch_size,
+        ):
+            pass
+
+        with transaction.atomic(using=router.db_for_write(ProjectDeletionJob)):
+            # Write lock first, as in the batches
+            ProjectDeletionJob.objects.filter(id=job.id).update(updated_at=timezone.now())
+            recount_projects([job.project_id])
+            invalidate_projects([job.project_id])
+            job.status = ProjectDeletionJob.STATUS_DONE
+            job.save(update_fields=["status", "updated_at"])
+    except DatabaseError:
+        release_project_deletion_job(job.id)
+        raise
+    return job
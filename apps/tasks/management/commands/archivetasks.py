@@ -0,0 +1,73 @@
+# Python modules
+from typing import Any
+from datetime import datetime, timedelta
+
+# Django modules
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+
+# Project modules
+from apps.tasks.archive import archive_done_tasks, purge_deleted_tasks, purge_deleted_user_tasks
+from apps.tasks.sharding import get_shard_aliases, use_shard
+
+
+class Command(BaseCommand):
+    help = "Purge old soft deleted tasks and move old done tasks to the archive tables"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command arguments."""
+        parser.add_argument(
+            "--done-after-days",
+            type=int,
+            default=settings.TASK_ARCHIVE["DONE_AFTER_DAYS"],
+            help="Archive done tasks not updated for this many days.",
+        )
+        parser.add_argument(
+            "--purge-after-days",
+            type=int,
+            default=settings.TASK_ARCHIVE["PURGE_DELETED_AFTER_DAYS"],
+            help="Remove rows soft deleted more than this many days ago.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.TASK_ARCHIVE["BATCH_SIZE"],
+            help="Number of tasks moved or removed per transaction.",
+        )
+
+    def handle(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        """Command entry point."""
+
+        start_time: datetime = datetime.now()
+        now: datetime = timezone.now()
+        batch_size: int = kwargs["batch_size"]
+
+        purge_cutoff: datetime = now - timedelta(days=kwargs["purge_after_days"])
+        purged_tasks: int = 0
+        purged_user_tasks: int = 0
+        archived: int = 0
+
+        alias: str
+        for alias in get_shard_aliases():
+            with use_shard(alias):
+                # Tombstones go first, they may be the only children left under done tasks
+                purged_tasks += purge_deleted_tasks(cutoff=purge_cutoff, batch_size=batch_size)
+                purged_user_tasks += purge_deleted_user_tasks(cutoff=purge_cutoff, batch_size=batch_size)
+
+                archived += archive_done_tasks(
+                    cutoff=now - timedelta(days=kwargs["done_after_days"]),
+                    batch_size=batch_size,
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Purged {purged_tasks} tasks and {purged_user_tasks} assignments, "
+                f"archived {archived} tasks."
+            )
+        )
+        self.stdout.write(
+            "The whole process took: {} seconds".format(
+                (datetime.now() - start_time).total_seconds()
+            )
+        )
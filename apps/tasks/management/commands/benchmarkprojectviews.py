@@ -0,0 +1,122 @@
+# Python modules
+from typing import Any, Awaitable, Callable
+import asyncio
+
+# Django modules
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.test import AsyncClient
+from django.test.utils import override_settings
+from django.urls import reverse
+
+# Project modules
+from apps.abstracts.benchmarks import measure_concurrent
+from apps.auths.models import CustomUser
+from apps.auths.tokens import get_login_response_data
+from apps.tasks.models import Project
+
+
+class Command(BaseCommand):
+    help = "Benchmark the sync and async project views through the ASGI handler"
+
+    EMAIL = "project-benchmark@example.com"
+    PROJECT_NAME = "Project benchmark"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command arguments."""
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=500,
+            help="Requests per action and view.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=50,
+            help="Requests in flight at once.",
+        )
+
+    async def __run(
+        self,
+        send: Callable[[AsyncClient], Awaitable[Any]],
+        requests: int,
+        concurrency: int,
+    ) -> dict[str, float]:
+        """Send the requests of one action to one view."""
+        client: AsyncClient = AsyncClient()
+
+        async def request() -> None:
+            response = await send(client)
+            assert response.status_code in (200, 201), response.content
+
+        return await measure_concurrent(
+            send=request,
+            requests=requests,
+            concurrency=concurrency,
+        )
+
+    def handle(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        """Command entry point."""
+
+        requests: int = kwargs["requests"]
+        concurrency: int = kwargs["concurrency"]
+
+        user: CustomUser
+        created: bool
+        user, created = CustomUser.all_objects.get_or_create(
+            email=self.EMAIL,
+            defaults={"full_name": "Project Benchmark"},
+        )
+        user.deleted_at = None
+        user.is_active = True
+        user.save()
+
+        project: Project = Project.objects.create(name=self.PROJECT_NAME, author=user)
+        project.users.add(user)
+        headers: dict[str, str] = {
+            "Authorization": f"JWT {get_login_response_data(user)['access']}",
+        }
+        body: dict[str, Any] = {
+            "name": self.PROJECT_NAME,
+            "author": user.id,
+            "users": [user.id],
+        }
+
+        views: dict[str, tuple[str, str]] = {
+            "sync": ("project-list", "project-detail"),
+            "async": ("project-async-list", "project-async-detail"),
+        }
+        try:
+            # The test client sends "Host: testserver"
+            with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+                name: str
+                list_name: str
+                detail_name: str
+                for name, (list_name, detail_name) in views.items():
+                    list_path: str = reverse(list_name)
+                    detail_path: str = reverse(detail_name, kwargs={"pk": project.pk})
+                    actions: dict[str, Callable[[AsyncClient], Awaitable[Any]]] = {
+                        "list": lambda client: client.get(list_path, headers=headers),
+                        "retrieve": lambda client: client.get(detail_path, headers=headers),
+                        "create": lambda client: client.post(
+                            list_path,
+                            data=body,
+                            content_type="application/json",
+                            headers=headers,
+                        ),
+                    }
+                    action: str
+                    send: Callable[[AsyncClient], Awaitable[Any]]
+                    for action, send in actions.items():
+                        result: dict[str, float] = asyncio.run(
+                            self.__run(send=send, requests=requests, concurrency=concurrency)
+                        )
+                        self.stdout.write(
+                            f"{name:>5} {action:<8}: {result['throughput']:.1f} requests/s, "
+                            f"p50 {result['p50']:.1f} ms, p95 {result['p95']:.1f} ms"
+                        )
+        finally:
+            Project.all_objects.filter(author=user).hard_delete()
+            if created:
+                user.hard_delete()
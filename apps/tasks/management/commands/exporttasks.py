@@ -0,0 +1,101 @@
+# Python modules
+from typing import Any, BinaryIO, ContextManager
+from datetime import datetime
+import sys
+
+# Django modules
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import QuerySet
+
+# Project modules
+from apps.abstracts.exports import iter_ndjson
+from apps.tasks.models import Task
+from apps.tasks.serializers import TaskListSerializer
+from apps.tasks.sharding import get_shard_aliases, project_shard, use_shard
+
+
+class Command(BaseCommand):
+    help = "Stream tasks as NDJSON to a file or stdout"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command arguments."""
+        parser.add_argument(
+            "--project",
+            type=int,
+            help="Export only the tasks of this project id, read from its shard.",
+        )
+        parser.add_argument(
+            "--output",
+            type=str,
+            default="-",
+            help="Output file path, '-' writes to stdout.",
+        )
+        parser.add_argument(
+            "--fields",
+            type=str,
+            default="",
+            help="Comma separated fields to export, all fields by default.",
+        )
+        parser.add_argument(
+            "--expand",
+            type=str,
+            default="",
+            help="Comma separated relations to expand, e.g. 'assignees'.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=None,
+            help="Number of rows fetched per database round trip.",
+        )
+
+    def handle(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        """Command entry point."""
+
+        start_time: datetime = datetime.now()
+
+        context: dict[str, Any] = {
+            "fields": frozenset(filter(None, kwargs["fields"].split(","))) or None,
+            "expand": frozenset(filter(None, kwargs["expand"].split(","))),
+        }
+        tasks: QuerySet[Task] = TaskListSerializer.optimize_queryset(
+            queryset=Task.objects.order_by("id"),
+            context=context,
+        )
+        # One project lives on a single shard, a full export reads every shard in turn
+        scopes: list[ContextManager[None]]
+        if kwargs["project"] is not None:
+            tasks = tasks.filter(project_id=kwargs["project"])
+            scopes = [project_shard(kwargs["project"])]
+        else:
+            scopes = [use_shard(alias) for alias in get_shard_aliases()]
+
+        output: BinaryIO = (
+            sys.stdout.buffer if kwargs["output"] == "-" else open(kwargs["output"], "wb")
+        )
+        written: int = 0
+        try:
+            scope: ContextManager[None]
+            for scope in scopes:
+                with scope:
+                    chunk: bytes
+                    for chunk in iter_ndjson(
+                        queryset=tasks,
+                        serializer_class=TaskListSerializer,
+                        chunk_size=kwargs["chunk_size"],
+                        context=context,
+                    ):
+                        output.write(chunk)
+                        written += chunk.count(b"\n")
+        finally:
+            if output is not sys.stdout.buffer:
+                output.close()
+
+        self.stderr.write(
+            self.style.SUCCESS(
+                "Exported {} tasks in {} seconds".format(
+                    written,
+                    (datetime.now() - start_time).total_seconds(),
+                )
+            )
+        )
@@ -0,0 +1,64 @@
+# Python modules
+from typing import Any
+from datetime import datetime
+
+# Django modules
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+# Project modules
+from apps.tasks.models import Project
+from apps.tasks.rebalance import move_project
+from apps.tasks.sharding import get_shard_aliases
+
+
+class Command(BaseCommand):
+    help = "Move a project with all its tasks to another shard database"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command arguments."""
+        parser.add_argument(
+            "project_id",
+            type=int,
+            help="Id of the project to move.",
+        )
+        parser.add_argument(
+            "database",
+            choices=get_shard_aliases(),
+            help="Alias of the destination shard.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.PROJECT_SHARDING["REBALANCE_BATCH_SIZE"],
+            help="Number of rows copied or deleted per transaction.",
+        )
+
+    def handle(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        """Command entry point."""
+
+        start_time: datetime = datetime.now()
+
+        try:
+            result: dict[str, Any] = move_project(
+                project_id=kwargs["project_id"],
+                target=kwargs["database"],
+                batch_size=kwargs["batch_size"],
+            )
+        except Project.DoesNotExist as exc:
+            raise CommandError(str(exc))
+
+        if not result["copied"]:
+            self.stdout.write(f"Project {kwargs['project_id']} already lives on {kwargs['database']}.")
+            return
+
+        label: str
+        count: int
+        for label, count in result["copied"].items():
+            self.stdout.write(f"{label}: {count} rows copied.")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Moved project {kwargs['project_id']} from {result['source']} to {kwargs['database']} "
+                f"in {(datetime.now() - start_time).total_seconds()} seconds."
+            )
+        )
@@ -0,0 +1,43 @@
+# Python modules
+from typing import Any
+from datetime import datetime
+
+# Django modules
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+# Project modules
+from apps.abstracts.fts import is_fts_supported
+from apps.tasks.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index of tasks from the tasks table of one database"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command arguments."""
+        parser.add_argument(
+            "--database",
+            type=str,
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to rebuild the index in, run the command once per shard.",
+        )
+
+    def handle(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        """Command entry point."""
+
+        start_time: datetime = datetime.now()
+        using: str = kwargs["database"]
+        if not is_fts_supported(using):
+            raise CommandError(f"Database '{using}' has no FTS5 task search index.")
+
+        with transaction.atomic(using=using):
+            rebuild_search_index(connections[using])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Rebuilt the task search index in {} seconds".format(
+                    (datetime.now() - start_time).total_seconds()
+                )
+            )
+        )
@@ -0,0 +1,62 @@
+# Python modules
+from typing import Any
+from datetime import datetime
+
+# Django modules
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import router, transaction
+
+# Project modules
+from apps.tasks.counters import COUNTER_FIELDS, reconcile_projects
+from apps.tasks.models import Project
+from apps.tasks.sharding import get_shard_aliases, use_shard
+
+
+class Command(BaseCommand):
+    help = "Recount denormalized project counters and fix the drifted ones"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command arguments."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of projects checked per transaction.",
+        )
+
+    def handle(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        """Command entry point."""
+
+        start_time: datetime = datetime.now()
+        batch_size: int = kwargs["batch_size"]
+        checked: int = 0
+        fixed: int = 0
+
+        alias: str
+        for alias in get_shard_aliases():
+            last_id: int = 0
+            with use_shard(alias):
+                while True:
+                    with transaction.atomic(using=router.db_for_write(Project)):
+                        projects: list[Project] = list(
+                            Project._base_manager.filter(id__gt=last_id).order_by("id").only(
+                                "id", *COUNTER_FIELDS
+                            )[:batch_size]
+                        )
+                        if not projects:
+                            break
+                        fixed += len(reconcile_projects(projects))
+
+                    checked += len(projects)
+                    last_id = projects[-1].id
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked {checked} projects, fixed {fixed}."
+            )
+        )
+        self.stdout.write(
+            "The whole process took: {} seconds".format(
+                (datetime.now() - start_time).total_seconds()
+            )
+        )
@@ -0,0 +1,69 @@
+# Python modules
+from typing import Any, Optional
+from datetime import datetime
+
+# Django modules
+from django.core.management.base import BaseCommand, CommandParser
+
+# Project modules
+from apps.tasks.deletion import run_project_deletion_job
+from apps.tasks.models import ProjectDeletionJob
+from apps.tasks.sharding import get_shard_aliases, is_sharding_enabled, use_shard
+
+
+class Command(BaseCommand):
+    help = "Run or resume unfinished cascading project deletions on every shard"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command arguments."""
+        parser.add_argument(
+            "--job",
+            type=int,
+            help="Run only this ProjectDeletionJob id.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Number of tasks tombstoned per transaction.",
+        )
+
+    def handle(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        """Command entry point."""
+
+        start_time: datetime = datetime.now()
+
+        alias: str
+        for alias in get_shard_aliases():
+            # Job ids are per shard
+            prefix: str = f"[{alias}] " if is_sharding_enabled() else ""
+            with use_shard(alias):
+                job_ids: list[int] = list(
+                    ProjectDeletionJob.objects.exclude(
+                        status=ProjectDeletionJob.STATUS_DONE,
+                    ).order_by("id").values_list("id", flat=True)
+                )
+                if kwargs["job"] is not None:
+                    job_ids = [job_id for job_id in job_ids if job_id == kwargs["job"]]
+
+                job_id: int
+                for job_id in job_ids:
+                    job: Optional[ProjectDeletionJob] = run_project_deletion_job(
+                        job_id=job_id,
+                        batch_size=kwargs["batch_size"],
+                    )
+                    if job is None:
+                        self.stdout.write(f"{prefix}Job {job_id} is running elsewhere, skipped.")
+                        continue
+                    self.stdout.write(
+                        f"{prefix}Job {job.id}: project {job.project_id}, "
+                        f"{job.tasks_deleted} tasks and {job.user_tasks_deleted} assignments deleted."
+                    )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "The whole process took: {} seconds".format(
+                    (datetime.now() - start_time).total_seconds()
+                )
+            )
+        )
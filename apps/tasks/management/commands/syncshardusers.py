@@ -0,0 +1,49 @@
+# Python modules
+from typing import Any
+
+# Django modules
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import DEFAULT_DB_ALIAS
+
+# Project modules
+from apps.auths.models import CustomUser
+from apps.tasks.sharding import get_shard_aliases, is_sharding_enabled, mirror_users
+
+
+class Command(BaseCommand):
+    help = "Copy every user from default into the shard databases"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command arguments."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of users copied at once.",
+        )
+
+    def handle(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        """Command entry point."""
+
+        if not is_sharding_enabled():
+            self.stdout.write("No shards configured, see PROJECT_SHARD_NAMES.")
+            return
+
+        batch_size: int = kwargs["batch_size"]
+        # Ids of both sides, so copies of hard deleted users go too
+        user_ids: list[int] = sorted({
+            user_id
+            for alias in get_shard_aliases()
+            for user_id in CustomUser._base_manager.using(alias).values_list("id", flat=True)
+        })
+
+        start: int
+        for start in range(0, len(user_ids), batch_size):
+            mirror_users(user_ids[start:start + batch_size])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Mirrored {CustomUser._base_manager.using(DEFAULT_DB_ALIAS).count()} users "
+                f"into {len(get_shard_aliases()) - 1} shards."
+            )
+        )
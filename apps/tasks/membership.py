@@ -0,0 +1,80 @@
+# Python modules
+from typing import Any, Iterable, Optional
+
+# Django modules
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.db import transaction
+
+# Project modules
+from apps.tasks.models import Project
+from apps.tasks.sharding import get_current_shard, shard_querysets
+
+MEMBERSHIP_KEY_PREFIX = "project-membership:"
+# Request attribute holding the per request memo
+REQUEST_MEMO_ATTR = "_project_membership_memo"
+
+
+def get_membership_cache() -> BaseCache:
+    """Get the cache backend shared by every worker."""
+    return caches[settings.PROJECT_MEMBERSHIP_CACHE["ALIAS"]]
+
+
+def get_user_project_ids(user_id: int, request: Optional[Any] = None) -> frozenset[int]:
+    """
+    Get the ids of the projects a user is a member of.
+
+    Looked up in the request memo first, then in the shared cache and
+    only then in the database.
+
+    Parameters:
+        user_id: int
+            The CustomUser id.
+        request: Optional[Any]
+            Request used as a per request memo.
+
+    Returns:
+        frozenset[int]
+            Project ids.
+    """
+    memo: Optional[dict[int, frozenset[int]]] = None
+    if request is not None:
+        memo = getattr(request, REQUEST_MEMO_ATTR, None)
+        if memo is None:
+            memo = {}
+            setattr(request, REQUEST_MEMO_ATTR, memo)
+        if user_id in memo:
+            return memo[user_id]
+
+    cache: BaseCache = get_membership_cache()
+    key: str = f"{MEMBERSHIP_KEY_PREFIX}{user_id}"
+    project_ids: Optional[frozenset[int]] = cache.get(key)
+    if project_ids is None:
+        # Memberships live next to their projects, on every shard
+        project_ids = frozenset(
+            project_id
+            for queryset in shard_querysets(
+                Project.users.through.objects.filter(
+                    **{Project.users.field.m2m_reverse_field_name(): user_id}
+                )
+            )
+            for project_id in queryset.values_list("project_id", flat=True)
+        )
+        cache.set(key, project_ids, timeout=settings.PROJECT_MEMBERSHIP_CACHE["TIMEOUT"])
+
+    if memo is not None:
+        memo[user_id] = project_ids
+    return project_ids
+
+
+def invalidate_user_memberships(user_ids: Iterable[int]) -> None:
+    """
+    Drop the cached membership sets of the given users once the transaction commits.
+
+    Parameters:
+        user_ids: Iterable[int]
+            CustomUser ids.
+    """
+    keys: list[str] = [f"{MEMBERSHIP_KEY_PREFIX}{user_id}" for user_id in set(user_ids)]
+    if keys:
+        transaction.on_commit(lambda: get_membership_cache().delete_many(keys), using=get_current_shard())
@@ -0,0 +1,35 @@
+# Generated by Django 5.0 on 2026-10-18 04:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0003_project_project_updated_at_id_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'status', 'id'], name='task_project_status_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'updated_at', 'id'], name='task_project_updated_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'status', 'updated_at', 'id'], name='task_proj_status_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'parent', 'id'], name='task_project_parent_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usertask',
+            index=models.Index(fields=['user', 'task'], name='usertask_user_task_idx'),
+        ),
+    ]
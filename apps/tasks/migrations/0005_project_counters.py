@@ -0,0 +1,64 @@
+# Generated by Django 5.0 on 2026-10-18 04:11
+
+from django.db import migrations, models
+from django.db.models import Count
+
+STATUS_COUNTER_FIELDS = {
+    1: 'tasks_todo_count',
+    2: 'tasks_in_progress_count',
+    3: 'tasks_done_count',
+}
+
+
+def fill_project_counters(apps, schema_editor):
+    Project = apps.get_model('tasks', 'Project')
+    Task = apps.get_model('tasks', 'Task')
+    db_alias = schema_editor.connection.alias
+    counters = {}
+
+    for row in Project.users.through.objects.using(db_alias).values('project_id').annotate(count=Count('id')):
+        counters.setdefault(row['project_id'], {})['members_count'] = row['count']
+
+    for row in Task.objects.using(db_alias).filter(deleted_at__isnull=True).values('project_id', 'status').annotate(count=Count('id')):
+        project_counters = counters.setdefault(row['project_id'], {})
+        project_counters[STATUS_COUNTER_FIELDS[row['status']]] = row['count']
+        project_counters['tasks_count'] = project_counters.get('tasks_count', 0) + row['count']
+
+    for project_id, values in counters.items():
+        Project.objects.using(db_alias).filter(id=project_id).update(**values)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_task_task_project_status_id_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='members_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='tasks_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='tasks_done_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='tasks_in_progress_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='tasks_todo_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(fill_project_counters, migrations.RunPython.noop),
+    ]
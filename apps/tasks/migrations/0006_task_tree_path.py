@@ -0,0 +1,64 @@
+# Generated by Django 5.0 on 2026-10-18 04:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+PATH_SEGMENT_LEN = 10
+PATH_SEPARATOR = '/'
+
+
+def fill_task_paths(apps, schema_editor):
+    Task = apps.get_model('tasks', 'Task')
+    db_alias = schema_editor.connection.alias
+    parents = dict(Task.objects.using(db_alias).values_list('id', 'parent_id'))
+    paths = {}
+
+    def get_path(task_id):
+        # Iterative walk up to the first ancestor with a known path
+        chain = []
+        while task_id not in paths:
+            chain.append(task_id)
+            task_id = parents[task_id]
+            if task_id is None:
+                break
+        path = ''
+        if task_id is not None:
+            path = paths[task_id] + f'{task_id:0{PATH_SEGMENT_LEN}d}{PATH_SEPARATOR}'
+        for ancestor_id in reversed(chain):
+            paths[ancestor_id] = path
+            path += f'{ancestor_id:0{PATH_SEGMENT_LEN}d}{PATH_SEPARATOR}'
+        return paths[chain[0]] if chain else paths[task_id]
+
+    tasks = []
+    for task in Task.objects.using(db_alias).only('id').iterator():
+        task.path = get_path(task.id)
+        task.depth = task.path.count(PATH_SEPARATOR)
+        if task.path:
+            tasks.append(task)
+    Task.objects.using(db_alias).bulk_update(tasks, ['path', 'depth'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_project_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='depth',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='path',
+            field=models.CharField(blank=True, default='', editable=False, max_length=704),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'path', 'id'], name='task_project_path_id_idx'),
+        ),
+        migrations.RunPython(fill_task_paths, migrations.RunPython.noop),
+    ]
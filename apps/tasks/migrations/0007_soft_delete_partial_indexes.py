@@ -0,0 +1,71 @@
+# Generated by Django 5.0 on 2026-10-18 04:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0006_task_tree_path'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='usertask',
+            name='unique_task_user',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='project_updated_at_id_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_project_status_id_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_project_updated_id_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_proj_status_updated_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_project_parent_id_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='usertask',
+            name='usertask_user_task_idx',
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['updated_at', 'id'], name='project_updated_at_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['project', 'status', 'id'], name='task_project_status_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['project', 'updated_at', 'id'], name='task_project_updated_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['project', 'status', 'updated_at', 'id'], name='task_proj_status_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['project', 'parent', 'id'], name='task_project_parent_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usertask',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['user', 'task'], name='usertask_user_task_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='usertask',
+            constraint=models.UniqueConstraint(condition=models.Q(('deleted_at__isnull', True)), fields=('task', 'user'), name='unique_task_user'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0 on 2026-10-18 04:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0007_soft_delete_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectDeletionJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('status', models.IntegerField(choices=[(1, 'Pending'), (2, 'Running'), (3, 'Done')], default=1)),
+                ('last_task_id', models.PositiveIntegerField(default=0)),
+                ('tasks_deleted', models.PositiveIntegerField(default=0)),
+                ('user_tasks_deleted', models.PositiveIntegerField(default=0)),
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='deletion_job', to='tasks.project')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'updated_at'], name='projectdeletion_status_idx')],
+            },
+        ),
+    ]
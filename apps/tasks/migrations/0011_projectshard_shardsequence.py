@@ -0,0 +1,29 @@
+# Generated by Django 5.0 on 2026-10-18 04:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0010_task_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectShard',
+            fields=[
+                ('project_id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('alias', models.CharField(max_length=100)),
+                ('moving', models.BooleanField(default=False)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ShardSequence',
+            fields=[
+                ('name', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('last_id', models.BigIntegerField(default=0)),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0 on 2026-10-18 05:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0011_projectshard_shardsequence'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='projectdeletionjob',
+            name='last_task_id',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
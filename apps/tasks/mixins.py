@@ -0,0 +1,269 @@
+# Python modules
+from typing import Any, Optional
+
+# Django modules
+from django.db import router
+from django.db.models import Exists, Model, OuterRef, QuerySet
+from django.http import HttpRequest, HttpResponse
+
+# Django REST Framework modules
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request as DRFRequest
+from rest_framework.response import Response as DRFResponse
+
+# Project modules
+from apps.abstracts.pagination import KeysetPaginator, merge_keyset_rows
+from apps.tasks.models import Project, Task, UserTask
+from apps.tasks.search import search_tasks
+from apps.tasks.sharding import fan_out, is_sharding_enabled, locate_projects, project_shard
+from apps.tasks.serializers import TaskSearchQuerySerializer, TaskSearchResultSerializer
+
+
+class ProjectShardMixin:
+    """
+    ViewSet mixin running detail routes on the shard of their project.
+
+    The "pk" of the URL is the id of a shard_model row: the project
+    itself, or a row whose project is found by asking every shard.
+    """
+
+    shard_model: type[Model] = Project
+
+    def get_shard_project_id(self, pk: Any) -> Optional[int]:
+        """Get the project id of the row of a detail route, if it exists."""
+        if pk is None or not is_sharding_enabled():
+            return None
+        try:
+            pk = int(pk)
+        except (TypeError, ValueError):
+            return None
+        if self.shard_model is Project:
+            return pk
+        return next(iter(locate_projects(self.shard_model, [pk])), None)
+
+    def dispatch(self, request: HttpRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> HttpResponse:
+        """Dispatch inside the shard scope of the route's project."""
+        with project_shard(self.get_shard_project_id(kwargs.get("pk"))):
+            return super().dispatch(request, *args, **kwargs)
+
+
+class ProjectResolverMixin:
+    """
+    ViewSet mixin resolving the project of a detail route in a single query.
+    """
+
+    def get_project(self, request: DRFRequest, pk: Any, error_key: str = "id") -> Project:
+        """
+        Fetch the project with its author and the caller's membership flag.
+
+        The membership flag is an EXISTS subquery annotated as is_member,
+        IsUserInProject reads it instead of querying again. Object
+        permissions of the view are checked before returning.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            pk: Any
+                The Project id from the URL.
+            error_key: str
+                Key of the error message in the 404 response body.
+
+        Returns:
+            Project
+                The Project instance annotated with is_member.
+
+        Raises:
+            NotFound
+                If the project does not exist.
+        """
+        try:
+            project: Project = self.get_project_queryset(request).get(id=pk)
+        except (Project.DoesNotExist, ValueError):
+            raise self.get_project_not_found(pk=pk, error_key=error_key)
+
+        self.check_object_permissions(request=request, obj=project)
+        return project
+
+    async def aget_project(self, request: DRFRequest, pk: Any, error_key: str = "id") -> Project:
+        """Async counterpart of get_project, for AsyncAPIView."""
+        try:
+            project: Project = await self.get_project_queryset(request).aget(id=pk)
+        except (Project.DoesNotExist, ValueError):
+            raise self.get_project_not_found(pk=pk, error_key=error_key)
+
+        await self.acheck_object_permissions(request=request, obj=project)
+        return project
+
+    def get_project_queryset(self, request: DRFRequest) -> QuerySet[Project]:
+        """Get the projects with their author and the caller's is_member flag."""
+        return Project.objects.select_related("author").annotate(
+            is_member=Exists(
+                Project.users.through.objects.filter(
+                    project_id=OuterRef("pk"),
+                    **{Project.users.field.m2m_reverse_field_name(): request.user.id},
+                )
+            )
+        )
+
+    def get_project_not_found(self, pk: Any, error_key: str) -> NotFound:
+        """Build the 404 error of a missing project."""
+        return NotFound(
+            detail={
+                error_key: [f"Project with id={pk} does not exist."]
+            }
+        )
+
+
+class TaskResolverMixin:
+    """
+    ViewSet mixin resolving the task of a detail route in a single query.
+    """
+
+    def get_task(
+        self,
+        request: DRFRequest,
+        pk: Any,
+        queryset: Optional[QuerySet[Task]] = None,
+    ) -> Task:
+        """
+        Fetch the task with the caller's membership flag of its project.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            pk: Any
+                The Task id from the URL.
+            queryset: Optional[QuerySet[Task]]
+                Base queryset, e.g. with select_for_update().
+
+        Returns:
+            Task
+                The Task instance annotated with is_member.
+
+        Raises:
+            NotFound
+                If the task does not exist.
+        """
+        if queryset is None:
+            queryset = Task.objects.all()
+        try:
+            task: Task = queryset.annotate(
+                is_member=Exists(
+                    Project.users.through.objects.filter(
+                        project_id=OuterRef("project_id"),
+                        **{Project.users.field.m2m_reverse_field_name(): request.user.id},
+                    )
+                )
+            ).get(id=pk)
+        except (Task.DoesNotExist, ValueError):
+            raise NotFound(
+                detail={
+                    "id": [f"Task with id={pk} does not exist."]
+                }
+            )
+
+        self.check_object_permissions(request=request, obj=task)
+        return task
+
+
+class TaskFilterMixin:
+    """
+    ViewSet mixin applying the validated task listing filters.
+    """
+
+    def filter_tasks(self, queryset: QuerySet[Task], params: dict[str, Any]) -> QuerySet[Task]:
+        """
+        Apply validated task listing filters to the queryset.
+
+        Parameters:
+            queryset: QuerySet[Task]
+                Tasks of a single project.
+            params: dict
+                Validated data of TaskListQuerySerializer.
+
+        Returns:
+            QuerySet[Task]
+                Filtered queryset.
+        """
+        if params.get("status"):
+            queryset = queryset.filter(status__in=params["status"])
+        if "parent" in params:
+            queryset = queryset.filter(parent_id=params["parent"])
+        if params.get("root"):
+            queryset = queryset.filter(parent__isnull=True)
+        if "assignee" in params:
+            queryset = queryset.filter(
+                Exists(
+                    UserTask.objects.filter(
+                        user_id=params["assignee"],
+                        task_id=OuterRef("pk"),
+                    )
+                )
+            )
+        if "updated_after" in params:
+            queryset = queryset.filter(updated_at__gte=params["updated_after"])
+        if "updated_before" in params:
+            queryset = queryset.filter(updated_at__lt=params["updated_before"])
+        return queryset
+
+
+class TaskSearchMixin:
+    """
+    ViewSet mixin answering full-text task searches.
+    """
+
+    def get_search_response(
+        self,
+        request: DRFRequest,
+        project_id: Optional[int] = None,
+        member_id: Optional[int] = None,
+    ) -> DRFResponse:
+        """
+        Search tasks of a project or of every project of a member.
+
+        Parameters:
+            request: DRFRequest
+                The request object, "q" holds the search input.
+            project_id: Optional[int]
+                Search a single project.
+            member_id: Optional[int]
+                Search every project of this user.
+
+        Returns:
+            DRFResponse
+                A cursor paginated response of ranked results with snippets.
+        """
+        query_serializer: TaskSearchQuerySerializer = TaskSearchQuerySerializer(
+            data=request.query_params
+        )
+        query_serializer.is_valid(raise_exception=True)
+
+        paginator: KeysetPaginator = KeysetPaginator(ordering=("rank", "id"))
+
+        def search(using: str) -> list[dict[str, Any]]:
+            return search_tasks(
+                match=query_serializer.validated_data["q"],
+                limit=paginator.get_page_size(request) + 1,
+                project_id=project_id,
+                member_id=member_id,
+                after=paginator.get_cursor_values(request),
+                using=using,
+            )
+
+        rows: list[dict[str, Any]]
+        if member_id is not None:
+            # The member's projects may be on every shard, bm25 ranks are per shard
+            rows = merge_keyset_rows(pages=fan_out(search), ordering=paginator.ordering, get_value=dict.get)
+        else:
+            rows = search(router.db_for_read(Task))
+        page: list[dict[str, Any]] = paginator.paginate_rows(
+            rows=rows,
+            request=request,
+            get_value=dict.get,
+        )
+
+        serializer: TaskSearchResultSerializer = TaskSearchResultSerializer(
+            instance=page,
+            many=True,
+        )
+        return paginator.get_paginated_response(serializer.data)
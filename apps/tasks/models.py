@@ -1,19 +1,40 @@
 # Python modules + Third party modules
+from typing import Any
 
 # Django modules
+from django.db import router, transaction
 from django.db.models import (
+    Manager,
+    QuerySet,
+    Q,
+    F,
+    Count,
+    OuterRef,
+    Subquery,
+    Value,
     CharField,
     TextField,
+    BooleanField,
     IntegerField,
+    PositiveBigIntegerField,
+    PositiveIntegerField,
+    Model,
+    BigIntegerField,
+    DateTimeField,
     ForeignKey,
+    OneToOneField,
     ManyToManyField,
     UniqueConstraint,
+    Index,
     PROTECT,
     CASCADE,
+    DO_NOTHING,
 )
+from django.db.models.functions import Cast, Coalesce, Concat, LPad, Substr
+from django.utils import timezone
 
 # Project modules
-from apps.abstracts.models import AbstractBaseModel
+from apps.abstracts.models import AbstractBaseModel, SoftDeleteManager, SoftDeleteQuerySet
 from apps.auths.models import CustomUser
 
 
@@ -37,19 +58,164 @@ class Project(AbstractBaseModel):
         blank=True,
         related_name="joined_projects",
     )
+    # Denormalized counters, maintained by apps.tasks.counters
+    members_count = PositiveIntegerField(
+        default=0,
+    )
+    tasks_count = PositiveIntegerField(
+        default=0,
+    )
+    tasks_todo_count = PositiveIntegerField(
+        default=0,
+    )
+    tasks_in_progress_count = PositiveIntegerField(
+        default=0,
+    )
+    tasks_done_count = PositiveIntegerField(
+        default=0,
+    )
+
+    class Meta:
+        """Customization of the model's meta data."""
+
+        indexes = [
+            # Keyset pagination of the project list
+            Index(
+                fields=["updated_at", "id"],
+                name="project_updated_at_id_idx",
+                condition=Q(deleted_at__isnull=True),
+            ),
+        ]
 
     def __repr__(self) -> str:
         """Returns the official string representation of the object."""
         return f"Project(id={self.id}, name={self.name})"
 
+    def save(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        """Give a new project a global id and a shard when sharding is enabled."""
+        if self._state.adding and self.pk is None:
+            # The sharding module imports the models
+            from apps.tasks.sharding import reserve_project_id
+
+            self.pk = reserve_project_id()
+            if self.pk is not None:
+                kwargs["force_insert"] = True
+        super().save(*args, **kwargs)
+
     def __str__(self) -> str:
         """Returns the string representation of the object."""
         return f"Name: {self.name} Author: {self.author.full_name} Users: {self.users.count()}"
 
 
+class TaskQuerySet(SoftDeleteQuerySet):
+    """
+    QuerySet of tasks with materialized path tree lookups.
+    """
+
+    def subtree(self, task: "Task") -> "TaskQuerySet":
+        """
+        Filter the descendants of a task with one index range scan.
+
+        Parameters:
+            task: Task
+                Root of the subtree, not included in the result.
+
+        Returns:
+            TaskQuerySet
+                Every descendant of the task, at any depth.
+        """
+        prefix: str = task.subtree_prefix
+        return self.filter(
+            project_id=task.project_id,
+            path__gte=prefix,
+            path__lt=Task.get_prefix_upper_bound(prefix),
+        )
+
+    def ancestors(self, task: "Task") -> "TaskQuerySet":
+        """
+        Filter the ancestors of a task by the ids stored in its path.
+
+        Parameters:
+            task: Task
+                The Task instance.
+
+        Returns:
+            TaskQuerySet
+                Ancestors ordered from the root down to the parent.
+        """
+        return self.filter(id__in=task.ancestor_ids).order_by("depth")
+
+    def with_descendants_count(self) -> "TaskQuerySet":
+        """
+        Annotate every task with the number of its descendants.
+
+        The count is a correlated subquery over the (project, path)
+        index, so the whole page is still a single query.
+
+        Returns:
+            TaskQuerySet
+                Tasks annotated with descendants_count.
+        """
+        segment: LPad = LPad(
+            Cast(OuterRef("id"), output_field=CharField()),
+            Task.PATH_SEGMENT_LEN,
+            Value("0"),
+        )
+        descendants: QuerySet = Task.objects.filter(
+            project_id=OuterRef("project_id"),
+            path__gte=Concat(OuterRef("path"), segment, Value(Task.PATH_SEPARATOR)),
+            path__lt=Concat(OuterRef("path"), segment, Value(Task.PATH_UPPER_BOUND)),
+        ).order_by().values("project_id").annotate(
+            count=Count("id"),
+        ).values("count")
+
+        return self.annotate(
+            descendants_count=Coalesce(Subquery(descendants), 0),
+        )
+
+    def bulk_create(self, objs: list["Task"], *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> list["Task"]:
+        """
+        Fill the tree position of new tasks, fetching all their parents at once.
+
+        With sharding enabled the tasks get their ids from the global
+        allocator, see apps.tasks.sharding.
+        """
+        from apps.tasks.sharding import allocate_ids
+
+        objs = list(objs)
+        new_objs: list[Task] = [obj for obj in objs if obj.pk is None]
+        task_id: int
+        for obj, task_id in zip(new_objs, allocate_ids(Task, len(new_objs))):
+            obj.pk = task_id
+        parent_ids: set[int] = {
+            obj.parent_id for obj in objs
+            if obj.parent_id is not None and not obj.path
+        }
+        parents: dict[int, tuple[str, int]] = {
+            task_id: (path, depth)
+            for task_id, path, depth in Task._base_manager.db_manager(self.db).filter(
+                id__in=parent_ids,
+            ).values_list("id", "path", "depth")
+        } if parent_ids else {}
+
+        obj: Task
+        for obj in objs:
+            if obj.parent_id in parents:
+                path, depth = parents[obj.parent_id]
+                obj.path = path + Task.build_path_segment(obj.parent_id)
+                obj.depth = depth + 1
+        return super().bulk_create(objs, *args, **kwargs)
+
+
 class Task(AbstractBaseModel):
     """
     Task database (table) model.
+
+    The tree of subtasks is stored as a materialized path: "path" holds
+    the zero padded ids of every ancestor from the root down to the
+    parent, each followed by PATH_SEPARATOR. The descendants of a task
+    are the rows whose path starts with the task's own path plus its
+    segment, which is a plain range on the (project, path) index.
     """
 
     NAME_MAX_LEN = 200
@@ -69,6 +235,11 @@ class Task(AbstractBaseModel):
         STATUS_IN_PROGRESS: STATUS_IN_PROGRESS_LABEL,
         STATUS_DONE: STATUS_DONE_LABEL,
     }
+    PATH_SEGMENT_LEN = 10
+    PATH_SEPARATOR = "/"
+    # The character right after PATH_SEPARATOR, bounds the prefix ranges
+    PATH_UPPER_BOUND = "0"
+    MAX_DEPTH = 64
 
     name = CharField(
         max_length=NAME_MAX_LEN,
@@ -99,6 +270,147 @@ class Task(AbstractBaseModel):
         through_fields=("task", "user"),
         blank=True,
     )
+    # Materialized path of the ancestors, maintained by save() and bulk_create()
+    path = CharField(
+        max_length=(PATH_SEGMENT_LEN + 1) * MAX_DEPTH,
+        default="",
+        blank=True,
+        editable=False,
+    )
+    depth = PositiveIntegerField(
+        default=0,
+        editable=False,
+    )
+
+    objects = SoftDeleteManager.from_queryset(TaskQuerySet)()
+    all_objects = Manager.from_queryset(TaskQuerySet)()
+
+    class Meta:
+        """Customization of the model's meta data."""
+
+        # Filter and sort combinations of the project task listing, live
+        # rows only: tombstones are never listed and must not bloat them
+        indexes = [
+            Index(
+                fields=["project", "status", "id"],
+                name="task_project_status_id_idx",
+                condition=Q(deleted_at__isnull=True),
+            ),
+            Index(
+                fields=["project", "updated_at", "id"],
+                name="task_project_updated_id_idx",
+                condition=Q(deleted_at__isnull=True),
+            ),
+            Index(
+                fields=["project", "status", "updated_at", "id"],
+                name="task_proj_status_updated_idx",
+                condition=Q(deleted_at__isnull=True),
+            ),
+            Index(
+                fields=["project", "parent", "id"],
+                name="task_project_parent_id_idx",
+                condition=Q(deleted_at__isnull=True),
+            ),
+            # Subtree range scans, also used to move soft deleted descendants
+            Index(
+                fields=["project", "path", "id"],
+                name="task_project_path_id_idx",
+            ),
+        ]
+
+    @classmethod
+    def build_path_segment(cls, task_id: int) -> str:
+        """Get the path segment of a task id."""
+        return f"{task_id:0{cls.PATH_SEGMENT_LEN}d}{cls.PATH_SEPARATOR}"
+
+    @classmethod
+    def get_prefix_upper_bound(cls, prefix: str) -> str:
+        """Get the smallest path greater than every path starting with the prefix."""
+        return prefix[:-len(cls.PATH_SEPARATOR)] + cls.PATH_UPPER_BOUND
+
+    @property
+    def subtree_prefix(self) -> str:
+        """Get the path prefix shared by every descendant of the task."""
+        return self.path + self.build_path_segment(self.id)
+
+    @property
+    def ancestor_ids(self) -> list[int]:
+        """Get the ids of the ancestors from the root down to the parent."""
+        return [int(segment) for segment in self.path.split(self.PATH_SEPARATOR) if segment]
+
+    @property
+    def path_parent_id(self) -> int | None:
+        """Get the parent id recorded in the path."""
+        ancestor_ids: list[int] = self.ancestor_ids
+        return ancestor_ids[-1] if ancestor_ids else None
+
+    def set_tree_position(self) -> None:
+        """
+        Compute path and depth from the current parent.
+
+        Raises:
+            ValueError
+                If the parent belongs to another project, is the task
+                itself or one of its descendants, or is too deep.
+        """
+        if self.parent_id is None:
+            self.path = ""
+            self.depth = 0
+            return
+
+        parent: Task = self.parent
+        if parent.project_id != self.project_id:
+            raise ValueError("A task and its parent must belong to the same project.")
+        if not self._state.adding and parent.subtree_prefix.startswith(self.subtree_prefix):
+            raise ValueError("A task can not be moved under itself or its descendants.")
+        if parent.depth + 1 >= self.MAX_DEPTH:
+            raise ValueError(f"Tasks can not be nested deeper than {self.MAX_DEPTH} levels.")
+
+        self.path = parent.subtree_prefix
+        self.depth = parent.depth + 1
+
+    def save(self, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> None:
+        """
+        Save the task so that signal driven counter updates share its transaction.
+
+        A new parent moves the whole subtree: the path prefix and depth
+        of every descendant are rewritten by a single UPDATE.
+        """
+        using: str = kwargs.get("using") or router.db_for_write(Task, instance=self)
+        with transaction.atomic(using=using, savepoint=False):
+            old_prefix: str | None = None
+            old_depth: int = self.depth
+
+            if self._state.adding:
+                if self.pk is None:
+                    from apps.tasks.sharding import allocate_ids
+
+                    task_ids: list[int] = allocate_ids(Task, 1)
+                    if task_ids:
+                        self.pk = task_ids[0]
+                        kwargs["force_insert"] = True
+                self.set_tree_position()
+            elif self.parent_id != self.path_parent_id:
+                old_prefix = self.subtree_prefix
+                self.set_tree_position()
+                if kwargs.get("update_fields") is not None:
+                    kwargs["update_fields"] = {*kwargs["update_fields"], "path", "depth"}
+
+            super().save(*args, **kwargs)
+
+            if old_prefix is not None:
+                Task._base_manager.using(using).filter(
+                    project_id=self.project_id,
+                    path__gte=old_prefix,
+                    path__lt=self.get_prefix_upper_bound(old_prefix),
+                ).update(
+                    path=Concat(
+                        Value(self.subtree_prefix),
+                        Substr("path", len(old_prefix) + 1),
+                    ),
+                    depth=F("depth") + (self.depth - old_depth),
+                    updated_at=timezone.now(),
+                )
 
     def get_status_as_dict(self) -> dict[str, int | str]:
         """
@@ -118,6 +430,10 @@ class Task(AbstractBaseModel):
 class UserTask(AbstractBaseModel):
     """
     UserTask database (table) model.
+
+    Task.assignees joins this table without looking at deleted_at, so
+    rows are soft deleted only together with their task; unassigning a
+    user from a live task removes the row.
     """
 
     task = ForeignKey(
@@ -134,8 +450,217 @@ class UserTask(AbstractBaseModel):
 
         # unique_together = ("task", "user")
         constraints = [
+            # Live rows only, a task can be reassigned after a soft delete
             UniqueConstraint(
                 fields=["task", "user"],
                 name="unique_task_user",
+                condition=Q(deleted_at__isnull=True),
+            ),
+        ]
+        indexes = [
+            # Assignee filter of the project task listing
+            Index(
+                fields=["user", "task"],
+                name="usertask_user_task_idx",
+                condition=Q(deleted_at__isnull=True),
             ),
         ]
+
+
+class ProjectDeletionJob(AbstractBaseModel):
+    """
+    ProjectDeletionJob database (table) model.
+
+    Progress of the cascading soft delete of a project's contents. Tasks
+    are tombstoned in id order, last_task_id is the resume point.
+    """
+
+    STATUS_PENDING = 1
+    STATUS_PENDING_LABEL = "Pending"
+    STATUS_RUNNING = 2
+    STATUS_RUNNING_LABEL = "Running"
+    STATUS_DONE = 3
+    STATUS_DONE_LABEL = "Done"
+    STATUS_CHOICES = {
+        STATUS_PENDING: STATUS_PENDING_LABEL,
+        STATUS_RUNNING: STATUS_RUNNING_LABEL,
+        STATUS_DONE: STATUS_DONE_LABEL,
+    }
+
+    project = OneToOneField(
+        to=Project,
+        on_delete=CASCADE,
+        related_name="deletion_job",
+    )
+    status = IntegerField(
+        default=STATUS_PENDING,
+        choices=STATUS_CHOICES,
+    )
+    last_task_id = PositiveBigIntegerField(
+        default=0,
+    )
+    tasks_deleted = PositiveIntegerField(
+        default=0,
+    )
+    user_tasks_deleted = PositiveIntegerField(
+        default=0,
+    )
+
+    class Meta:
+        """Customization of the model's meta data."""
+
+        indexes = [
+            # Unfinished jobs picked up by runprojectdeletions
+            Index(
+                fields=["status", "updated_at"],
+                name="projectdeletion_status_idx",
+            ),
+        ]
+
+    def __repr__(self) -> str:
+        """Returns the official string representation of the object."""
+        return f"ProjectDeletionJob(id={self.id}, project_id={self.project_id}, status={self.status})"
+
+
+class ArchivedTask(Model):
+    """
+    ArchivedTask database (table) model.
+
+    Cold storage of long finished tasks moved out of tasks_task by
+    apps.tasks.archive; the id is the one the task had while live.
+    """
+
+    id = BigIntegerField(
+        primary_key=True,
+    )
+    project = ForeignKey(
+        to=Project,
+        on_delete=DO_NOTHING,
+        db_constraint=False,
+        related_name="archived_tasks",
+    )
+    # The parent may still be live or archived, no constraint either way
+    parent_id = BigIntegerField(
+        null=True,
+        blank=True,
+    )
+    name = CharField(
+        max_length=Task.NAME_MAX_LEN,
+    )
+    description = TextField(
+        blank=True,
+        default="",
+    )
+    status = IntegerField(
+        choices=Task.STATUS_CHOICES,
+    )
+    created_at = DateTimeField()
+    updated_at = DateTimeField()
+    archived_at = DateTimeField(
+        auto_now_add=True,
+    )
+
+    class Meta:
+        """Customization of the model's meta data."""
+
+        indexes = [
+            # Archived tasks of a project by id
+            Index(
+                fields=["project", "id"],
+                name="archivedtask_project_id_idx",
+            ),
+        ]
+
+    def __repr__(self) -> str:
+        """Returns the official string representation of the object."""
+        return f"ArchivedTask(id={self.id}, project_id={self.project_id})"
+
+    def get_status_as_dict(self) -> dict[str, int | str]:
+        """Get the status of the task as a dictionary."""
+        return {
+            "id": self.status,
+            "label": Task.STATUS_CHOICES[self.status],
+        }
+
+
+class ArchivedUserTask(Model):
+    """
+    ArchivedUserTask database (table) model.
+
+    Assignments of an archived task.
+    """
+
+    task = ForeignKey(
+        to=ArchivedTask,
+        on_delete=CASCADE,
+        related_name="assignments",
+    )
+    user = ForeignKey(
+        to=CustomUser,
+        on_delete=DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+
+    class Meta:
+        """Customization of the model's meta data."""
+
+        constraints = [
+            UniqueConstraint(
+                fields=["task", "user"],
+                name="unique_archived_task_user",
+            ),
+        ]
+
+
+class ProjectShard(Model):
+    """
+    ProjectShard database (table) model.
+
+    Shard map of the sharding mode, kept on the default database: the
+    alias holding a project and its tasks. Projects without a row live
+    on default. "moving" is set while rebalanceproject copies the
+    project, writes to it are refused meanwhile.
+    """
+
+    ALIAS_MAX_LEN = 100
+
+    project_id = BigIntegerField(
+        primary_key=True,
+    )
+    alias = CharField(
+        max_length=ALIAS_MAX_LEN,
+    )
+    moving = BooleanField(
+        default=False,
+    )
+    updated_at = DateTimeField(
+        auto_now=True,
+    )
+
+    def __repr__(self) -> str:
+        """Returns the official string representation of the object."""
+        return f"ProjectShard(project_id={self.project_id}, alias={self.alias}, moving={self.moving})"
+
+
+class ShardSequence(Model):
+    """
+    ShardSequence database (table) model.
+
+    Last id handed out per sharded model, kept on the default database,
+    so rows keep their ids when their project moves between shards.
+    """
+
+    NAME_MAX_LEN = 100
+
+    name = CharField(
+        max_length=NAME_MAX_LEN,
+        primary_key=True,
+    )
+    last_id = BigIntegerField(
+        default=0,
+    )
+
+    def __repr__(self) -> str:
+        """Returns the official string representation of the object."""
+        return f"ShardSequence(name={self.name}, last_id={self.last_id})"
@@ -1,13 +1,17 @@
 # Python modules
 from typing import Any
 
+# Django modules
+from asgiref.sync import sync_to_async
+
 # Django REST Framework modules
 from rest_framework.permissions import BasePermission
 from rest_framework.request import Request as DRFRequest
 from rest_framework.viewsets import ViewSet
 
 # Project modules
-from apps.tasks.models import Project
+from apps.tasks.membership import get_user_project_ids
+from apps.tasks.models import Project, Task
 
 
 class IsUserInProject(BasePermission):
@@ -17,19 +21,42 @@ class IsUserInProject(BasePermission):
 
     message = "Forbidden! You are not a member of this project."
 
-    def has_object_permission(self, request: DRFRequest, view: ViewSet, obj: Project | int) -> bool:
+    def has_object_permission(self, request: DRFRequest, view: ViewSet, obj: Project | Task | int) -> bool:
         """
         Check if the user is part of the project.
+
+        Projects and tasks resolved by ProjectResolverMixin and
+        TaskResolverMixin carry an is_member
+        annotation; otherwise membership sets cached per user (see
+        apps.tasks.membership) are used, so the check costs no queries
+        in the steady state.
         """
-        project_id: Any = obj.id if isinstance(obj, Project) else obj
+        if request.user.id is None:
+            return False
+
+        is_member: Any = getattr(obj, "is_member", None)
+        if isinstance(is_member, bool):
+            return is_member
+
+        project_id: Any = obj
+        if isinstance(obj, Project):
+            project_id = obj.id
+        elif isinstance(obj, Task):
+            project_id = obj.project_id
 
         if not isinstance(project_id, int):
             return False
 
-        return Project.objects.filter(
-            users__id=request.user.id,
-            id=project_id
-        ).exists()
+        return project_id in get_user_project_ids(
+            user_id=request.user.id,
+            request=request,
+        )
+
+    async def ahas_object_permission(self, request: DRFRequest, view: ViewSet, obj: Project | Task | int) -> bool:
+        """Async counterpart of has_object_permission, for AsyncAPIView."""
+        if isinstance(getattr(obj, "is_member", None), bool):
+            return self.has_object_permission(request, view, obj)
+        return await sync_to_async(self.has_object_permission)(request, view, obj)
 
     # def has_permission(self, request, view):
     #     return super().has_permission(request, view)
\ No newline at end of file
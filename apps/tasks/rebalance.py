@@ -0,0 +1,213 @@
+# Python modules
+from typing import Any, Iterator, Optional
+from itertools import islice
+from time import sleep
+
+# Django modules
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Field, Model, QuerySet
+
+# Project modules
+from apps.abstracts.models import delete_rows
+from apps.tasks.caching import invalidate_projects
+from apps.tasks.models import (
+    ArchivedTask,
+    ArchivedUserTask,
+    Project,
+    ProjectDeletionJob,
+    ProjectShard,
+    Task,
+    UserTask,
+)
+from apps.tasks.sharding import get_shard_aliases, mirror_users, shard_map
+
+# Rows of a project per sharded table, parents before children: the
+# lookup finding them, the copy order and whether the id is global.
+# Rows with a per-shard id get a new one on the target shard.
+MOVE_PLAN: tuple[tuple[type[Model], str, tuple[str, ...], bool], ...] = (
+    (Project, "id", ("id",), True),
+    (Project.users.through, "project_id", ("id",), False),
+    (ProjectDeletionJob, "project_id", ("id",), False),
+    (Task, "project_id", ("depth", "id"), True),
+    (UserTask, "task__project_id", ("id",), False),
+    (ArchivedTask, "project_id", ("id",), True),
+    (ArchivedUserTask, "task__project_id", ("id",), False),
+)
+
+
+def get_project_placement(project_id: int) -> str:
+    """Get the shard of a project from the shard map itself, bypassing the cache."""
+    return ProjectShard.objects.using(DEFAULT_DB_ALIAS).filter(
+        project_id=project_id,
+    ).values_list("alias", flat=True).first() or DEFAULT_DB_ALIAS
+
+
+def iter_batches(queryset: QuerySet, batch_size: int) -> Iterator[list[Model]]:
+    """Stream the rows of a queryset in lists of at most batch_size."""
+    rows: Iterator[Model] = queryset.iterator(chunk_size=batch_size)
+    while batch := list(islice(rows, batch_size)):
+        yield batch
+
+
+def copy_rows(queryset: QuerySet, target: str, keep_ids: bool, batch_size: int) -> int:
+    """
+    Insert rows into another database as they are, one transaction per batch.
+
+    The INSERTs are raw, like loaddata: auto_now fields keep their values
+    and no signal is sent.
+
+    Parameters:
+        queryset: QuerySet
+            Ordered rows to copy, parents before children.
+        target: str
+            Database alias receiving the rows.
+        keep_ids: bool
+            Copy the ids too, otherwise the target numbers the rows.
+        batch_size: int
+            Maximum number of rows per transaction.
+
+    Returns:
+        int
+            Number of copied rows.
+    """
+    model: type[Model] = queryset.model
+    fields: list[Field] = [
+        field for field in model._meta.concrete_fields
+        if keep_ids or not field.primary_key
+    ]
+    copied: int = 0
+
+    batch: list[Model]
+    for batch in iter_batches(queryset, batch_size):
+        size: int = connections[target].ops.bulk_batch_size(fields, batch) or len(batch)
+        with transaction.atomic(using=target):
+            start: int
+            for start in range(0, len(batch), size):
+                model._base_manager.using(target)._insert(
+                    batch[start:start + size],
+                    fields=fields,
+                    raw=True,
+                    using=target,
+                )
+        copied += len(batch)
+    return copied
+
+
+def delete_project_rows(project_id: int, alias: str, batch_size: int) -> int:
+    """
+    Delete every row of a project from one shard with raw DELETEs, children first.
+
+    Parameters:
+        project_id: int
+            The Project id.
+        alias: str
+            Database alias of the shard.
+        batch_size: int
+            Maximum number of rows per transaction.
+
+    Returns:
+        int
+            Number of deleted rows.
+    """
+    deleted: int = 0
+
+    model: type[Model]
+    lookup: str
+    ordering: tuple[str, ...]
+    for model, lookup, ordering, _ in reversed(MOVE_PLAN):
+        rows: QuerySet = model._base_manager.using(alias).filter(**{lookup: project_id})
+        while True:
+            with transaction.atomic(using=alias):
+                ids: list[int] = list(
+                    rows.order_by(*(f"-{field}" for field in ordering)).values_list("pk", flat=True)[:batch_size]
+                )
+                if not ids:
+                    break
+                deleted += delete_rows(model._base_manager.using(alias).filter(pk__in=ids), using=alias)
+    return deleted
+
+
+def move_project(
+    project_id: int,
+    target: str,
+    batch_size: int,
+    pause: Optional[float] = None,
+) -> dict[str, Any]:
+    """
+    Move a project and all its rows to another shard.
+
+    The project is flagged as moving, so writes to it are refused with
+    ProjectShardMoving while it is copied; reads keep being served from
+    the source. Once the copy is done the shard map points to the
+    target and, after every process had the time to notice, the source
+    rows are deleted. A move interrupted halfway can be run again: rows
+    left on the target by a previous attempt are removed first.
+
+    Parameters:
+        project_id: int
+            The Project id.
+        target: str
+            Database alias of the destination shard.
+        batch_size: int
+            Maximum number of rows copied or deleted per transaction.
+        pause: Optional[float]
+            Seconds waited after each change of the shard map, by default
+            PROJECT_SHARDING["MAP_CACHE_TIMEOUT"].
+
+    Returns:
+        dict[str, Any]
+            Source alias and number of copied rows by model label.
+    """
+    if target not in get_shard_aliases():
+        raise ValueError(f"'{target}' is not a shard database.")
+    if pause is None:
+        pause = settings.PROJECT_SHARDING["MAP_CACHE_TIMEOUT"]
+
+    source: str = get_project_placement(project_id)
+    if not Project._base_manager.using(source).filter(id=project_id).exists():
+        raise Project.DoesNotExist(f"Project {project_id} was not found on '{source}'.")
+    copied: dict[str, int] = {}
+    if source == target:
+        return {"source": source, "copied": copied}
+
+    shard_map.set_placement(project_id, source, moving=True)
+    try:
+        sleep(pause)
+        delete_project_rows(project_id, target, batch_size)
+
+        project: Project = Project._base_manager.using(source).get(id=project_id)
+        mirror_users({
+            project.author_id,
+            *project.users.through._base_manager.using(source).filter(
+                project_id=project_id,
+            ).values_list("customuser_id", flat=True),
+            *UserTask._base_manager.using(source).filter(
+                task__project_id=project_id,
+            ).values_list("user_id", flat=True),
+            *ArchivedUserTask._base_manager.using(source).filter(
+                task__project_id=project_id,
+            ).values_list("user_id", flat=True),
+        })
+
+        model: type[Model]
+        lookup: str
+        ordering: tuple[str, ...]
+        keep_ids: bool
+        for model, lookup, ordering, keep_ids in MOVE_PLAN:
+            copied[model._meta.label] = copy_rows(
+                queryset=model._base_manager.using(source).filter(**{lookup: project_id}).order_by(*ordering),
+                target=target,
+                keep_ids=keep_ids,
+                batch_size=batch_size,
+            )
+    except BaseException:
+        shard_map.set_placement(project_id, source, moving=False)
+        raise
+
+    shard_map.set_placement(project_id, target, moving=False)
+    # Processes still reading the source from their cache get its rows meanwhile
+    sleep(pause)
+    delete_project_rows(project_id, source, batch_size)
+    invalidate_projects({project_id})
+    return {"source": source, "copied": copied}
@@ -0,0 +1,126 @@
+# Python modules
+from typing import Any, Optional
+
+# Django modules
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+# Project modules
+from apps.abstracts.fts import build_fts_schema_sql, create_fts_schema, rebuild_fts_index
+from apps.tasks.models import Project, Task
+
+FTS_TABLE = "tasks_task_fts"
+SNIPPET_START = "["
+SNIPPET_END = "]"
+SNIPPET_ELLIPSIS = "…"
+SNIPPET_TOKENS = 12
+# bm25() column weights: a hit in the name counts more than in the description
+NAME_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+SCHEMA_SQL = build_fts_schema_sql(
+    fts_table=FTS_TABLE,
+    content_table="tasks_task",
+    columns=("name", "description"),
+    options="tokenize='unicode61 remove_diacritics 2'",
+)
+
+
+def create_search_schema(connection: BaseDatabaseWrapper) -> None:
+    """Create the FTS5 task index and its triggers when missing."""
+    create_fts_schema(connection, SCHEMA_SQL)
+
+
+def rebuild_search_index(connection: BaseDatabaseWrapper) -> None:
+    """Rebuild the FTS5 task index from tasks_task."""
+    rebuild_fts_index(connection, FTS_TABLE, SCHEMA_SQL)
+
+
+def search_tasks(
+    match: str,
+    limit: int,
+    project_id: Optional[int] = None,
+    member_id: Optional[int] = None,
+    after: Optional[list[Any]] = None,
+    using: str = "default",
+) -> list[dict[str, Any]]:
+    """
+    Find live tasks by relevance with a single FTS5 query.
+
+    Results are ordered by (rank, id), where rank is bm25() (lower is
+    better), so pages can be fetched with a keyset cursor.
+
+    Parameters:
+        match: str
+            Expression from build_match_expression.
+        limit: int
+            Maximum number of rows.
+        project_id: Optional[int]
+            Search a single project.
+        member_id: Optional[int]
+            Search every project of this user.
+        after: Optional[list]
+            (rank, id) of the last row of the previous page.
+        using: str
+            Database alias.
+
+    Returns:
+        list[dict]
+            Rows with id, project, name, status, rank and snippets.
+    """
+    assert (project_id is None) != (member_id is None), (
+        "search_tasks requires exactly one of project_id and member_id."
+    )
+    task_table: str = Task._meta.db_table
+    project_table: str = Project._meta.db_table
+    params: list[Any] = [
+        NAME_WEIGHT, DESCRIPTION_WEIGHT,
+        SNIPPET_START, SNIPPET_END, SNIPPET_ELLIPSIS, SNIPPET_TOKENS,
+        SNIPPET_START, SNIPPET_END, SNIPPET_ELLIPSIS, SNIPPET_TOKENS,
+        match,
+    ]
+
+    if project_id is not None:
+        scope: str = "t.project_id = %s"
+        params.append(project_id)
+    else:
+        through = Project.users.through
+        scope = (
+            f"t.project_id IN (SELECT project_id FROM {through._meta.db_table} "
+            f"WHERE {through._meta.get_field(Project.users.field.m2m_reverse_field_name()).column} = %s)"
+        )
+        params.append(member_id)
+
+    keyset: str = ""
+    if after is not None:
+        keyset = "WHERE rank > %s OR (rank = %s AND id > %s)"
+        params.extend([after[0], after[0], after[1]])
+    params.append(limit)
+
+    sql: str = f"""
+        SELECT * FROM (
+            SELECT
+                t.id AS id,
+                t.project_id AS project,
+                t.name AS name,
+                t.status AS status,
+                bm25({FTS_TABLE}, %s, %s) AS rank,
+                snippet({FTS_TABLE}, 0, %s, %s, %s, %s) AS name_snippet,
+                snippet({FTS_TABLE}, 1, %s, %s, %s, %s) AS description_snippet
+            FROM {FTS_TABLE}
+            JOIN {task_table} t ON t.id = {FTS_TABLE}.rowid
+            JOIN {project_table} p ON p.id = t.project_id
+            WHERE {FTS_TABLE} MATCH %s
+                AND {scope}
+                AND t.deleted_at IS NULL
+                AND p.deleted_at IS NULL
+        )
+        {keyset}
+        ORDER BY rank, id
+        LIMIT %s
+    """
+
+    with connections[using].cursor() as cursor:
+        cursor.execute(sql, params)
+        columns: list[str] = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
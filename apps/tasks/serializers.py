@@ -1,14 +1,36 @@
+# Python modules
+from typing import Any, Optional
+
+# Django modules
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models import Max
+
 # Django REST Framework modules
 from rest_framework.serializers import (
+    Serializer,
+    ListSerializer,
     ModelSerializer,
+    CharField,
     SerializerMethodField,
     IntegerField,
-    Field
+    FloatField,
+    BooleanField,
+    ChoiceField,
+    DateTimeField,
+    ListField,
+    PrimaryKeyRelatedField,
+    Field,
+    ValidationError,
 )
 
 # Project modules
-from apps.tasks.models import Project, Task
-from apps.abstracts.serializers import CustomUserForeignSerializer
+from apps.tasks.counters import TASK_STATUS_COUNTER_FIELDS
+from apps.auths.models import CustomUser
+from apps.tasks.models import ArchivedTask, Project, Task
+from apps.abstracts.fts import build_match_expression
+from apps.abstracts.serializers import CustomUserForeignSerializer, DynamicFieldsSerializerMixin
 
 
 class CurrentPKURLDefault:
@@ -41,15 +63,28 @@ class ProjectBaseSerializer(ModelSerializer):
         fields = "__all__"
 
 
-class ProjectListSerializer(ProjectBaseSerializer):
+class ProjectListSerializer(DynamicFieldsSerializerMixin, ProjectBaseSerializer):
     """
     Serializer for listing Project instances.
     """
 
-    users_count = SerializerMethodField(
-        method_name="get_users_count",
+    expandable_fields = {
+        "author": (CustomUserForeignSerializer, {}),
+    }
+    method_field_sources = {
+        "tasks_status_counts": tuple(TASK_STATUS_COUNTER_FIELDS.values()),
+    }
+
+    users_count = IntegerField(
+        source="members_count",
+        read_only=True,
+    )
+    tasks_status_counts = SerializerMethodField(
+        method_name="get_tasks_status_counts",
+    )
+    author = PrimaryKeyRelatedField(
+        read_only=True,
     )
-    author = CustomUserForeignSerializer()
 
     class Meta:
         """
@@ -61,21 +96,30 @@ class ProjectListSerializer(ProjectBaseSerializer):
             "name",
             "author",
             "users_count",
+            "tasks_count",
+            "tasks_status_counts",
         )
 
-    def get_users_count(self, obj: Project) -> int:
+    def get_tasks_status_counts(self, obj: Project) -> list[dict[str, int | str]]:
         """
-        Get the count of users associated with the project.
+        Get the number of live tasks per status from the stored counters.
 
         Parameters:
             obj: Project
                 The Project instance.
 
         Returns:
-            int
-                The count of users.
+            list
+                Status id, label and task count for every status.
         """
-        return getattr(obj, "users_count", 0)
+        return [
+            {
+                "id": status,
+                "label": Task.STATUS_CHOICES[status],
+                "count": getattr(obj, field),
+            }
+            for status, field in TASK_STATUS_COUNTER_FIELDS.items()
+        ]
 
 
 class ProjectCreateSerializer(ProjectBaseSerializer):
@@ -96,6 +140,97 @@ class ProjectCreateSerializer(ProjectBaseSerializer):
         )
 
 
+class ProjectAsyncCreateSerializer(Serializer):
+    """
+    Serializer for creating Project instances from async views.
+
+    Same input, output and errors as ProjectCreateSerializer, but
+    is_valid() needs no database: the referenced users are checked by
+    avalidate_users() with a single async query.
+    """
+
+    id = IntegerField(
+        read_only=True,
+    )
+    name = CharField(
+        max_length=Project.NAME_MAX_LEN,
+    )
+    author = IntegerField()
+    users = ListField(
+        child=IntegerField(),
+        required=False,
+    )
+
+    class Meta:
+        """
+        Customize the serializer's metadata.
+        """
+        fields = (
+            "id",
+            "name",
+            "author",
+            "users",
+        )
+
+    async def avalidate_users(self) -> None:
+        """
+        Check that the author and the members are live users.
+
+        Raises:
+            ValidationError
+                With the PrimaryKeyRelatedField message of the first missing id.
+        """
+        author_id: int = self.validated_data["author"]
+        user_ids: list[int] = self.validated_data.get("users", [])
+        found: set[int] = {
+            user_id async for user_id in CustomUser.objects.filter(
+                id__in={author_id, *user_ids},
+            ).values_list("id", flat=True)
+        }
+
+        message: str = PrimaryKeyRelatedField.default_error_messages["does_not_exist"]
+        errors: dict[str, list[str]] = {}
+        if author_id not in found:
+            errors["author"] = [message.format(pk_value=author_id)]
+        missing: list[int] = [user_id for user_id in user_ids if user_id not in found]
+        if missing:
+            errors["users"] = [message.format(pk_value=missing[0])]
+        if errors:
+            raise ValidationError(errors)
+
+    async def asave(self, project_id: Optional[int] = None) -> Project:
+        """
+        Create the project and its members, with a reserved id if given.
+
+        The async ORM has no transactions, so both writes run in one
+        transaction in a worker thread: a failure leaves no project
+        without its members.
+        """
+        self.instance = await sync_to_async(self.create_project)(project_id)
+        return self.instance
+
+    def create_project(self, project_id: Optional[int]) -> Project:
+        """Create the project and its members in one transaction, see asave()."""
+        with transaction.atomic(using=router.db_for_write(Project)):
+            project: Project = Project.objects.create(
+                id=project_id,
+                name=self.validated_data["name"],
+                author_id=self.validated_data["author"],
+            )
+            if self.validated_data.get("users"):
+                project.users.set(self.validated_data["users"])
+        return project
+
+    def to_representation(self, instance: Project) -> dict[str, Any]:
+        """Represent the project without loading its relations."""
+        return {
+            "id": instance.id,
+            "name": instance.name,
+            "author": instance.author_id,
+            "users": list(dict.fromkeys(self.validated_data.get("users", []))),
+        }
+
+
 class ProjectUpdateSerializer(ProjectBaseSerializer):
     """
     Serializer for updating Project instances.
@@ -139,12 +274,22 @@ class TaskBaseSerializer(ModelSerializer):
         return obj.get_status_as_dict()
 
 
-class TaskListSerializer(TaskBaseSerializer):
+class TaskListSerializer(DynamicFieldsSerializerMixin, TaskBaseSerializer):
     """
     Serializer for listing Task instances.
     """
 
-    assignees = CustomUserForeignSerializer(many=True)
+    expandable_fields = {
+        "assignees": (CustomUserForeignSerializer, {"many": True}),
+    }
+    method_field_sources = {
+        "status": ("status",),
+    }
+
+    assignees = PrimaryKeyRelatedField(
+        many=True,
+        read_only=True,
+    )
 
     class Meta:
         """
@@ -158,7 +303,6 @@ class TaskListSerializer(TaskBaseSerializer):
             "status",
             "project",
             # "subtasks",
-            "project",
             "assignees",
         )
 
@@ -192,3 +336,495 @@ class TaskCreateSerializer(TaskBaseSerializer):
             "id",
             "project",
         )
+
+    def validate_parent(self, value: Task | None) -> Task | None:
+        """Validates that the parent belongs to the same project and is not too deep."""
+        if value is None:
+            return value
+        if value.project_id != int(self.context["pk"]):
+            raise ValidationError(
+                f"Task with id={value.id} does not exist in this project."
+            )
+        if value.depth + 1 >= Task.MAX_DEPTH:
+            raise ValidationError(
+                f"Tasks can not be nested deeper than {Task.MAX_DEPTH} levels."
+            )
+        return value
+
+
+class TaskTreeSerializer(TaskBaseSerializer):
+    """
+    Serializer for Task instances of subtree and ancestor listings.
+    """
+
+    class Meta:
+        """
+        Customize the serializer's metadata.
+        """
+        model = Task
+        fields = (
+            "id",
+            "name",
+            "status",
+            "parent",
+            "depth",
+        )
+
+
+class TaskChildSerializer(TaskTreeSerializer):
+    """
+    Serializer for child Task instances with their descendant counts.
+    """
+
+    descendants_count = IntegerField(
+        read_only=True,
+    )
+
+    class Meta:
+        """
+        Customize the serializer's metadata.
+        """
+        model = Task
+        fields = (
+            *TaskTreeSerializer.Meta.fields,
+            "descendants_count",
+        )
+
+
+class TaskMoveSerializer(Serializer):
+    """
+    Serializer for reparenting a Task instance.
+    """
+
+    parent = IntegerField(
+        allow_null=True,
+        min_value=1,
+    )
+
+    class Meta:
+        """
+        Customize the serializer's metadata.
+        """
+        fields = (
+            "parent",
+        )
+
+    def validate_parent(self, value: int | None) -> Task | None:
+        """
+        Resolve the new parent and reject cycles and too deep subtrees.
+
+        Cycles are detected by comparing materialized paths, the new
+        parent must not lie inside the moved task's subtree.
+
+        Parameters:
+            value: int | None
+                Id of the new parent, None moves the task to the root.
+
+        Returns:
+            Task | None
+                The new parent.
+        """
+        task: Task = self.context["task"]
+        if value is None:
+            return None
+
+        try:
+            parent: Task = Task.objects.select_for_update().get(
+                id=value,
+                project_id=task.project_id,
+            )
+        except Task.DoesNotExist:
+            raise ValidationError(
+                f"Task with id={value} does not exist in this project."
+            )
+
+        if parent.subtree_prefix.startswith(task.subtree_prefix):
+            raise ValidationError(
+                "A task can not be moved under itself or its descendants."
+            )
+
+        deepest: int = Task.objects.subtree(task).aggregate(
+            deepest=Max("depth"),
+        )["deepest"] or task.depth
+        if parent.depth + 1 + deepest - task.depth >= Task.MAX_DEPTH:
+            raise ValidationError(
+                f"Tasks can not be nested deeper than {Task.MAX_DEPTH} levels."
+            )
+        return parent
+
+
+class ArchivedTaskSerializer(ModelSerializer):
+    """
+    Serializer for ArchivedTask instances.
+    """
+
+    status = SerializerMethodField(
+        method_name="get_status",
+    )
+    parent = IntegerField(
+        source="parent_id",
+        read_only=True,
+    )
+    assignees = SerializerMethodField(
+        method_name="get_assignees",
+    )
+
+    class Meta:
+        """
+        Customize the serializer's metadata.
+        """
+        model = ArchivedTask
+        fields = (
+            "id",
+            "name",
+            "description",
+            "status",
+            "project",
+            "parent",
+            "assignees",
+            "created_at",
+            "updated_at",
+            "archived_at",
+        )
+
+    def get_status(self, obj: ArchivedTask) -> dict[str, int | str]:
+        """Get the status of the archived task as a dictionary."""
+        return obj.get_status_as_dict()
+
+    def get_assignees(self, obj: ArchivedTask) -> list[int]:
+        """Get the ids of the users assigned when the task was archived."""
+        return [assignment.user_id for assignment in obj.assignments.all()]
+
+
+class TaskSearchQuerySerializer(Serializer):
+    """
+    Serializer for validating task search query parameters.
+    """
+
+    QUERY_MAX_LEN = 200
+
+    q = CharField(
+        max_length=QUERY_MAX_LEN,
+        help_text="Words to find in task names and descriptions, the last one as a prefix.",
+    )
+
+    class Meta:
+        """
+        Customize the serializer's metadata.
+        """
+        fields = (
+            "q",
+        )
+
+    def validate_q(self, value: str) -> str:
+        """Validates the search input and turns it into an FTS5 MATCH expression."""
+        match: str | None = build_match_expression(value)
+        if match is None:
+            raise ValidationError("Enter at least one word.")
+        return match
+
+
+class TaskSearchResultSerializer(Serializer):
+    """
+    Serializer for ranked task search results.
+    """
+
+    id = IntegerField()
+    project = IntegerField()
+    name = CharField()
+    status = SerializerMethodField(
+        method_name="get_status",
+    )
+    rank = FloatField()
+    name_snippet = CharField()
+    description_snippet = CharField()
+
+    class Meta:
+        """
+        Customize the serializer's metadata.
+        """
+        fields = (
+            "id",
+            "project",
+            "name",
+            "status",
+            "rank",
+            "name_snippet",
+            "description_snippet",
+        )
+
+    def get_status(self, obj: dict[str, Any]) -> dict[str, int | str]:
+        """Get the status of the found task as a dictionary."""
+        return {
+            "id": obj["status"],
+            "label": Task.STATUS_CHOICES[obj["status"]],
+        }
+
+
+class TaskListQuerySerializer(Serializer):
+    """
+    Serializer for validating task listing query parameters.
+    """
+
+    # Whitelisted orderings, each ends with the unique "id" for keyset pagination
+    ORDERINGS = {
+        "id": ("id",),
+        "-id": ("-id",),
+        "status": ("status", "id"),
+        "-status": ("-status", "-id"),
+        "updated_at": ("updated_at", "id"),
+        "-updated_at": ("-updated_at", "-id"),
+    }
+
+    status = ListField(
+        child=ChoiceField(choices=Task.STATUS_CHOICES),
+        required=False,
+    )
+    parent = IntegerField(
+        required=False,
+        min_value=1,
+    )
+    root = BooleanField(
+        required=False,
+        help_text="Only tasks without a parent.",
+    )
+    assignee = IntegerField(
+        required=False,
+        min_value=1,
+    )
+    updated_after = DateTimeField(
+        required=False,
+    )
+    updated_before = DateTimeField(
+        required=False,
+    )
+    ordering = ChoiceField(
+        choices=tuple(ORDERINGS),
+        default="id",
+    )
+
+    class Meta:
+        """
+        Customize the serializer's metadata.
+        """
+        fields = (
+            "status",
+            "parent",
+            "root",
+            "assignee",
+            "updated_after",
+            "updated_before",
+            "ordering",
+        )
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Validates the combination of query parameters."""
+        if attrs.get("root") and "parent" in attrs:
+            raise ValidationError(
+                detail={
+                    "root": ["Can not be combined with 'parent'."]
+                }
+            )
+        return super().validate(attrs)
+
+
+class TaskBulkCreateListSerializer(ListSerializer):
+    """
+    List serializer validating cross-item references of a task batch at once.
+    """
+
+    def validate(self, attrs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Check parents and assignees of every item with one query each.
+
+        Parameters:
+            attrs: list
+                Validated items.
+
+        Returns:
+            list
+                The same items.
+        """
+        project_id: int = int(self.context["pk"])
+        parent_ids: set[int] = {item["parent"] for item in attrs if item.get("parent")}
+        assignee_ids: set[int] = {user_id for item in attrs for user_id in item["assignees"]}
+
+        parent_depths: dict[int, int] = dict(
+            Task.objects.filter(
+                project_id=project_id,
+                id__in=parent_ids,
+            ).values_list("id", "depth")
+        ) if parent_ids else {}
+        existing_users: set[int] = set(
+            CustomUser.objects.filter(
+                id__in=assignee_ids,
+                is_active=True,
+            ).values_list("id", flat=True)
+        ) if assignee_ids else set()
+
+        errors: list[dict[str, list[str]]] = []
+        item: dict[str, Any]
+        for item in attrs:
+            item_errors: dict[str, list[str]] = {}
+            if item.get("parent") and item["parent"] not in parent_depths:
+                item_errors["parent"] = [
+                    f"Task with id={item['parent']} does not exist in this project."
+                ]
+            elif item.get("parent") and parent_depths[item["parent"]] + 1 >= Task.MAX_DEPTH:
+                item_errors["parent"] = [
+                    f"Tasks can not be nested deeper than {Task.MAX_DEPTH} levels."
+                ]
+            missing_users: list[int] = [
+                user_id for user_id in item["assignees"] if user_id not in existing_users
+            ]
+            if missing_users:
+                item_errors["assignees"] = [
+                    f"Active user with id={user_id} does not exist." for user_id in missing_users
+                ]
+            errors.append(item_errors)
+
+        if any(errors):
+            raise ValidationError(detail=errors)
+        return attrs
+
+
+class TaskBulkCreateSerializer(Serializer):
+    """
+    Serializer for a single item of a bulk task creation.
+    """
+
+    name = CharField(
+        max_length=Task.NAME_MAX_LEN,
+    )
+    description = CharField(
+        required=False,
+        allow_blank=True,
+        default="",
+    )
+    status = ChoiceField(
+        choices=Task.STATUS_CHOICES,
+        default=Task.STATUS_TODO,
+    )
+    parent = IntegerField(
+        required=False,
+        allow_null=True,
+        min_value=1,
+    )
+    assignees = ListField(
+        child=IntegerField(min_value=1),
+        required=False,
+        default=list,
+    )
+
+    class Meta:
+        """
+        Customize the serializer's metadata.
+        """
+        list_serializer_class = TaskBulkCreateListSerializer
+        fields = (
+            "name",
+            "description",
+            "status",
+            "parent",
+            "assignees",
+        )
+
+
+
+class TaskBulkFilterSerializer(TaskListQuerySerializer):
+    """
+    Serializer for the task filter of a bulk update.
+    """
+
+    project = IntegerField(
+        min_value=1,
+    )
+
+    class Meta:
+        """
+        Customize the serializer's metadata.
+        """
+        fields = (
+            "project",
+            *TaskListQuerySerializer.Meta.fields,
+        )
+
+
+class TaskBulkUpdateSerializer(Serializer):
+    """
+    Serializer for bulk task status transitions and reassignments.
+    """
+
+    ids = ListField(
+        child=IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=settings.TASK_BULK_OPERATIONS["MAX_ITEMS"],
+    )
+    filter = TaskBulkFilterSerializer(
+        required=False,
+    )
+    status = ChoiceField(
+        choices=Task.STATUS_CHOICES,
+        required=False,
+    )
+    assign = ListField(
+        child=IntegerField(min_value=1),
+        required=False,
+        default=list,
+    )
+    unassign = ListField(
+        child=IntegerField(min_value=1),
+        required=False,
+        default=list,
+    )
+
+    class Meta:
+        """
+        Customize the serializer's metadata.
+        """
+        fields = (
+            "ids",
+            "filter",
+            "status",
+            "assign",
+            "unassign",
+        )
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Validates the target selection and the requested changes."""
+        if ("ids" in attrs) == ("filter" in attrs):
+            raise ValidationError(
+                detail={
+                    "non_field_errors": ["Provide exactly one of 'ids' or 'filter'."]
+                }
+            )
+        if "status" not in attrs and not attrs["assign"] and not attrs["unassign"]:
+            raise ValidationError(
+                detail={
+                    "non_field_errors": ["Nothing to change, provide 'status', 'assign' or 'unassign'."]
+                }
+            )
+        if set(attrs["assign"]) & set(attrs["unassign"]):
+            raise ValidationError(
+                detail={
+                    "assign": ["Users can not be assigned and unassigned at once."]
+                }
+            )
+
+        user_ids: set[int] = set(attrs["assign"])
+        if user_ids:
+            existing: set[int] = set(
+                CustomUser.objects.filter(
+                    id__in=user_ids,
+                    is_active=True,
+                ).values_list("id", flat=True)
+            )
+            missing: list[int] = sorted(user_ids - existing)
+            if missing:
+                raise ValidationError(
+                    detail={
+                        "assign": [f"Active user with id={user_id} does not exist." for user_id in missing]
+                    }
+                )
+        return super().validate(attrs)
@@ -0,0 +1,421 @@
+# Python modules
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Optional, TypeVar
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar, Token
+from threading import Lock
+from time import monotonic
+
+# Django modules
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, transaction
+from django.db.models import F, Max, Model, QuerySet
+from django.utils.translation import gettext_lazy as _
+
+# Django REST Framework modules
+from rest_framework.exceptions import APIException
+from rest_framework.status import HTTP_503_SERVICE_UNAVAILABLE
+
+# Project modules
+from apps.abstracts.cache import LRUCache
+from apps.abstracts.models import delete_rows
+from apps.auths.models import CustomUser
+from apps.tasks.models import (
+    ArchivedTask,
+    ArchivedUserTask,
+    Project,
+    ProjectDeletionJob,
+    ProjectShard,
+    ShardSequence,
+    Task,
+    UserTask,
+)
+
+T = TypeVar("T")
+
+# Every table holding rows of a single project, parents before children
+SHARDED_MODELS: tuple[type[Model], ...] = (
+    Project,
+    Project.users.through,
+    ProjectDeletionJob,
+    Task,
+    UserTask,
+    ArchivedTask,
+    ArchivedUserTask,
+)
+
+
+def get_shard_aliases() -> list[str]:
+    """Get default followed by the DATABASES entries flagged with "SHARD"."""
+    return [DEFAULT_DB_ALIAS] + [
+        alias for alias, database in settings.DATABASES.items()
+        if database.get("SHARD")
+    ]
+
+
+def is_sharding_enabled() -> bool:
+    """Check whether any database besides default holds projects."""
+    return len(get_shard_aliases()) > 1
+
+
+class ProjectShardMoving(APIException):
+    """The project is being copied to another shard, writes are refused."""
+
+    status_code = HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = _("The project is being moved, retry in a few seconds.")
+    default_code = "project_moving"
+
+
+class ShardMap:
+    """
+    Placement of projects on shards, read through a per-process cache.
+
+    ProjectShard rows are the source of truth. A process trusts a cached
+    placement for PROJECT_SHARDING["MAP_CACHE_TIMEOUT"] seconds, which is
+    how long rebalanceproject waits after each change of the map.
+    """
+
+    def __init__(self) -> None:
+        self._placements: Optional[LRUCache] = None
+
+    @property
+    def placements(self) -> LRUCache:
+        """Get the cache of (alias, moving, expires_at) by project id."""
+        if self._placements is None:
+            self._placements = LRUCache(max_entries=settings.PROJECT_SHARDING["MAP_CACHE_MAX_ENTRIES"])
+        return self._placements
+
+    def _remember(self, project_id: int, alias: str, moving: bool) -> tuple[str, bool]:
+        self.placements.set(
+            project_id,
+            (alias, moving, monotonic() + settings.PROJECT_SHARDING["MAP_CACHE_TIMEOUT"]),
+        )
+        return alias, moving
+
+    def _get_cached(self, project_id: int) -> Optional[tuple[str, bool]]:
+        cached: Optional[tuple[str, bool, float]] = self.placements.get(project_id)
+        if cached is None or cached[2] <= monotonic():
+            return None
+        return cached[0], cached[1]
+
+    def _get_queryset(self, project_id: int) -> QuerySet:
+        return ProjectShard.objects.using(DEFAULT_DB_ALIAS).filter(
+            project_id=project_id,
+        ).values_list("alias", "moving")
+
+    def get_placement(self, project_id: int) -> tuple[str, bool]:
+        """
+        Get the shard of a project and whether it is being moved.
+
+        Parameters:
+            project_id: int
+                The Project id.
+
+        Returns:
+            tuple[str, bool]
+                Database alias, default for projects without a ProjectShard
+                row, and the moving flag.
+        """
+        placement: Optional[tuple[str, bool]] = self._get_cached(project_id)
+        if placement is None:
+            placement = self._remember(project_id, *(self._get_queryset(project_id).first() or (DEFAULT_DB_ALIAS, False)))
+        return placement
+
+    async def aget_placement(self, project_id: int) -> tuple[str, bool]:
+        """Async counterpart of get_placement."""
+        placement: Optional[tuple[str, bool]] = self._get_cached(project_id)
+        if placement is None:
+            placement = self._remember(project_id, *(await self._get_queryset(project_id).afirst() or (DEFAULT_DB_ALIAS, False)))
+        return placement
+
+    def assign(self, project_id: int) -> str:
+        """Place a new project on the shard picked by its id."""
+        aliases: list[str] = get_shard_aliases()
+        alias: str = aliases[project_id % len(aliases)]
+        ProjectShard.objects.using(DEFAULT_DB_ALIAS).create(project_id=project_id, alias=alias)
+        self._remember(project_id, alias, False)
+        return alias
+
+    def set_placement(self, project_id: int, alias: str, moving: bool) -> None:
+        """Record where a project lives, other processes notice within the cache timeout."""
+        ProjectShard.objects.using(DEFAULT_DB_ALIAS).update_or_create(
+            project_id=project_id,
+            defaults={"alias": alias, "moving": moving},
+        )
+        self._remember(project_id, alias, moving)
+
+
+shard_map: ShardMap = ShardMap()
+
+
+class IdAllocator:
+    """
+    Global ids of sharded rows, handed out in blocks per process.
+
+    Each ShardSequence row is bumped by PROJECT_SHARDING["ID_BLOCK_SIZE"]
+    with a single UPDATE, the first block of a model starts above the
+    highest id found on any shard.
+    """
+
+    def __init__(self) -> None:
+        self._blocks: dict[str, tuple[int, int]] = {}
+        self._lock: Lock = Lock()
+
+    def allocate(self, model: type[Model], count: int) -> list[int]:
+        """
+        Get unused ids of a model.
+
+        Parameters:
+            model: type[Model]
+                Sharded model.
+            count: int
+                Number of ids.
+
+        Returns:
+            list[int]
+                Increasing ids, unique across shards.
+        """
+        name: str = model._meta.label
+        ids: list[int] = []
+        with self._lock:
+            while len(ids) < count:
+                next_id, end = self._blocks.get(name, (0, 0))
+                if next_id >= end:
+                    next_id, end = self._reserve(
+                        model=model,
+                        size=max(settings.PROJECT_SHARDING["ID_BLOCK_SIZE"], count - len(ids)),
+                    )
+                taken: int = min(end - next_id, count - len(ids))
+                ids.extend(range(next_id, next_id + taken))
+                self._blocks[name] = (next_id + taken, end)
+        return ids
+
+    def _reserve(self, model: type[Model], size: int) -> tuple[int, int]:
+        """Reserve the next block of ids, returning [start, end)."""
+        name: str = model._meta.label
+        sequences: QuerySet[ShardSequence] = ShardSequence.objects.using(DEFAULT_DB_ALIAS)
+        while True:
+            with transaction.atomic(using=DEFAULT_DB_ALIAS):
+                # The UPDATE takes the write lock before the row is read back
+                if sequences.filter(name=name).update(last_id=F("last_id") + size):
+                    end: int = sequences.get(name=name).last_id + 1
+                    return end - size, end
+            try:
+                highest: int = max(
+                    model._base_manager.using(alias).aggregate(highest=Max("pk"))["highest"] or 0
+                    for alias in get_shard_aliases()
+                )
+                sequences.create(name=name, last_id=highest)
+            except IntegrityError:
+                # Created by another process meanwhile
+                pass
+
+
+id_allocator: IdAllocator = IdAllocator()
+
+
+def allocate_ids(model: type[Model], count: int) -> list[int]:
+    """Get global ids of new rows, none when sharding is disabled."""
+    if not count or not is_sharding_enabled():
+        return []
+    return id_allocator.allocate(model=model, count=count)
+
+
+def reserve_project_id() -> Optional[int]:
+    """Get the id of a new project and place it on a shard, None when sharding is disabled."""
+    if not is_sharding_enabled():
+        return None
+    project_id: int = id_allocator.allocate(model=Project, count=1)[0]
+    shard_map.assign(project_id)
+    return project_id
+
+
+class ShardScope:
+    """Shard the current request or task works on."""
+
+    def __init__(self, alias: str, project_id: Optional[int] = None) -> None:
+        self.alias: str = alias
+        self.project_id: Optional[int] = project_id
+
+
+_scope: ContextVar[Optional[ShardScope]] = ContextVar("shard_scope", default=None)
+
+
+def get_current_shard() -> Optional[str]:
+    """Get the alias of the current shard scope, if any."""
+    scope: Optional[ShardScope] = _scope.get()
+    return scope.alias if scope is not None else None
+
+
+@contextmanager
+def use_shard(alias: Optional[str], project_id: Optional[int] = None) -> Iterator[None]:
+    """Route sharded models without an instance hint to a shard inside the block."""
+    if alias is None:
+        yield
+        return
+    token: Token = _scope.set(ShardScope(alias=alias, project_id=project_id))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+@contextmanager
+def project_shard(project_id: Optional[int]) -> Iterator[None]:
+    """Work on the shard of a project inside the block, a no-op without sharding."""
+    if project_id is None or not is_sharding_enabled():
+        yield
+        return
+    with use_shard(shard_map.get_placement(project_id)[0], project_id=project_id):
+        yield
+
+
+@asynccontextmanager
+async def aproject_shard(project_id: Optional[int]) -> AsyncIterator[None]:
+    """Async counterpart of project_shard."""
+    if project_id is None or not is_sharding_enabled():
+        yield
+        return
+    placement: tuple[str, bool] = await shard_map.aget_placement(project_id)
+    with use_shard(placement[0], project_id=project_id):
+        yield
+
+
+def fan_out(func: Callable[[str], T]) -> list[T]:
+    """Call a function with every shard alias, one after the other."""
+    return [func(alias) for alias in get_shard_aliases()]
+
+
+def shard_querysets(queryset: QuerySet) -> list[QuerySet]:
+    """Get a queryset per shard, or the queryset itself without sharding."""
+    if not is_sharding_enabled():
+        return [queryset]
+    return [queryset.using(alias) for alias in get_shard_aliases()]
+
+
+def locate_projects(model: type[Model], ids: Iterable[int]) -> set[int]:
+    """
+    Find the projects of rows of a sharded model by id, on every shard.
+
+    Parameters:
+        model: type[Model]
+            Sharded model with a project_id column, e.g. Task.
+        ids: Iterable[int]
+            Row ids.
+
+    Returns:
+        set[int]
+            Project ids of the rows found.
+    """
+    ids = list(ids)
+    return {
+        project_id
+        for queryset in shard_querysets(model._base_manager.filter(id__in=ids))
+        for project_id in queryset.order_by().values_list("project_id", flat=True).distinct()
+    }
+
+
+def mirror_users(user_ids: Iterable[int]) -> None:
+    """
+    Copy users from default into every other shard.
+
+    Shards keep a read only copy of the referenced CustomUser rows, so
+    joins and foreign keys of their projects and tasks work locally.
+    Hard deleted users are removed from the copies.
+
+    Parameters:
+        user_ids: Iterable[int]
+            CustomUser ids.
+    """
+    user_ids = list(user_ids)
+    if not user_ids or not is_sharding_enabled():
+        return
+    users: list[CustomUser] = list(CustomUser._base_manager.using(DEFAULT_DB_ALIAS).filter(id__in=user_ids))
+    found: set[int] = {user.id for user in users}
+    fields: list[str] = [
+        field.name for field in CustomUser._meta.concrete_fields
+        if not field.primary_key
+    ]
+    alias: str
+    for alias in get_shard_aliases()[1:]:
+        CustomUser._base_manager.using(alias).bulk_create(
+            users,
+            update_conflicts=True,
+            unique_fields=["id"],
+            update_fields=fields,
+        )
+        delete_rows(
+            CustomUser._base_manager.using(alias).filter(
+                id__in=[user_id for user_id in user_ids if user_id not in found],
+            ),
+            using=alias,
+        )
+
+
+def get_instance_project_id(instance: Model) -> Optional[int]:
+    """Get the project id of a sharded row without a query, if known."""
+    if isinstance(instance, Project):
+        return instance.pk
+    return getattr(instance, "project_id", None)
+
+
+class ProjectShardRouter:
+    """
+    Route the rows of a project to its shard.
+
+    Without "SHARD" databases every call returns None, leaving the
+    decision to the next router. Otherwise sharded models follow, in
+    order, the project of the instance hint, the database the instance
+    was loaded from and the current ShardScope, then default. Users
+    read for a sharded instance come from that shard's copy, so
+    select_related() and prefetches stay on one database; every other
+    CustomUser read and write goes to default.
+    """
+
+    def __init__(self) -> None:
+        self._enabled: bool = is_sharding_enabled()
+        self._sharded: frozenset[type[Model]] = frozenset(SHARDED_MODELS)
+
+    def _get_shard(self, model: type[Model], hints: dict[str, Any], write: bool) -> Optional[str]:
+        instance: Optional[Model] = hints.get("instance")
+        sharded_instance: bool = instance is not None and type(instance) in self._sharded
+        project_id: Optional[int] = get_instance_project_id(instance) if sharded_instance else None
+        alias: Optional[str] = None
+
+        if project_id is not None:
+            alias, moving = shard_map.get_placement(project_id)
+        elif sharded_instance and instance._state.db is not None:
+            return instance._state.db
+        else:
+            scope: Optional[ShardScope] = _scope.get()
+            if scope is None:
+                return DEFAULT_DB_ALIAS
+            alias, project_id = scope.alias, scope.project_id
+            moving = project_id is not None and write and shard_map.get_placement(project_id)[1]
+
+        if write and moving:
+            raise ProjectShardMoving()
+        return alias
+
+    def db_for_read(self, model: type[Model], **hints: dict[str, Any]) -> Optional[str]:
+        """Get the shard of a sharded model, or of a user read for a sharded row."""
+        if not self._enabled:
+            return None
+        if model in self._sharded:
+            return self._get_shard(model, hints, write=False)
+
+        instance: Optional[Model] = hints.get("instance")
+        if model is CustomUser and instance is not None and type(instance) in self._sharded:
+            return instance._state.db
+        return None
+
+    def db_for_write(self, model: type[Model], **hints: dict[str, Any]) -> Optional[str]:
+        """Get the shard of a sharded model, refusing writes to a moving project."""
+        if not self._enabled or model not in self._sharded:
+            return None
+        return self._get_shard(model, hints, write=True)
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: dict[str, Any]) -> Optional[bool]:
+        """Users are copied into every shard."""
+        if self._enabled and CustomUser in (type(obj1), type(obj2)):
+            return True
+        return None
@@ -0,0 +1,237 @@
+# Python modules
+from typing import Any, Optional
+from collections import Counter
+from datetime import datetime
+
+# Django modules
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Model
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save
+from django.dispatch import receiver
+
+# Project modules
+from apps.abstracts.models import post_soft_delete
+from apps.auths.models import CustomUser
+from apps.tasks.caching import invalidate_projects
+from apps.tasks.counters import (
+    apply_members_delta,
+    apply_task_status_deltas,
+    get_task_counter_state,
+    recount_projects,
+)
+from apps.tasks.membership import invalidate_user_memberships
+from apps.tasks.models import Project, Task, UserTask
+from apps.tasks.sharding import is_sharding_enabled, mirror_users
+
+
+@receiver(post_init, sender=Task)
+def remember_task_counter_state(sender: type[Task], instance: Task, **kwargs: dict[str, Any]) -> None:
+    """Remember the loaded status and liveness to diff them on save."""
+    instance._counter_state = get_task_counter_state(instance)
+
+
+@receiver(post_save, sender=Task)
+def update_project_task_counters(
+    sender: type[Task],
+    instance: Task,
+    created: bool,
+    update_fields: Optional[frozenset[str]],
+    **kwargs: dict[str, Any]
+) -> None:
+    """Apply the task's status / soft delete transition to its project counters."""
+    if update_fields is not None and not {"status", "deleted_at"} & update_fields:
+        return
+
+    old_state: Optional[tuple[int, bool]] = None if created else instance._counter_state
+    new_state: Optional[tuple[int, bool]] = get_task_counter_state(instance)
+    instance._counter_state = new_state
+
+    if new_state is None or (old_state is None and not created):
+        # Previous state is unknown (deferred fields), count from scratch
+        recount_projects([instance.project_id])
+        return
+
+    deltas: Counter[int] = Counter()
+    if old_state is not None and old_state[1]:
+        deltas[old_state[0]] -= 1
+    if new_state[1]:
+        deltas[new_state[0]] += 1
+    apply_task_status_deltas(project_id=instance.project_id, status_deltas=deltas)
+
+
+@receiver(m2m_changed, sender=Project.users.through)
+def update_project_members_count(
+    sender: type[Model],
+    instance: Model,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[set[int]],
+    **kwargs: dict[str, Any]
+) -> None:
+    """Keep Project.members_count in sync with the Project.users relation."""
+    if action == "pre_clear" and reverse:
+        # Remember the projects the user leaves, pk_set is empty on clear
+        instance._cleared_project_ids = list(
+            sender.objects.filter(
+                **{Project.users.field.m2m_reverse_field_name(): instance.pk}
+            ).values_list("project_id", flat=True)
+        )
+        return
+
+    if action == "post_add":
+        # Django only reports the ids that were actually inserted
+        if reverse:
+            for project_id in pk_set:
+                apply_members_delta(project_id=project_id, delta=1)
+        else:
+            apply_members_delta(project_id=instance.pk, delta=len(pk_set))
+    elif action == "post_remove":
+        recount_projects(pk_set if reverse else [instance.pk])
+    elif action == "post_clear":
+        recount_projects(
+            getattr(instance, "_cleared_project_ids", []) if reverse else [instance.pk]
+        )
+
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_project_responses(sender: type[Project], instance: Project, **kwargs: dict[str, Any]) -> None:
+    """Invalidate cached responses after a project changes."""
+    invalidate_projects([instance.pk])
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_task_responses(sender: type[Task], instance: Task, **kwargs: dict[str, Any]) -> None:
+    """Invalidate cached responses of the task's project."""
+    invalidate_projects([instance.project_id])
+
+
+@receiver(post_save, sender=UserTask)
+@receiver(post_delete, sender=UserTask)
+def invalidate_user_task_responses(sender: type[UserTask], instance: UserTask, **kwargs: dict[str, Any]) -> None:
+    """Invalidate cached responses of the project of the assigned task."""
+    if UserTask.task.is_cached(instance):
+        invalidate_projects([instance.task.project_id])
+        return
+    invalidate_projects(
+        Task._base_manager.filter(id=instance.task_id).values_list("project_id", flat=True)
+    )
+
+
+@receiver(post_soft_delete, sender=Project)
+def invalidate_soft_deleted_project_responses(
+    sender: type[Project],
+    deleted_at: datetime,
+    using: str,
+    **kwargs: dict[str, Any]
+) -> None:
+    """Invalidate cached responses of projects soft deleted in bulk."""
+    invalidate_projects(
+        Project._base_manager.using(using).filter(deleted_at=deleted_at).values_list("id", flat=True)
+    )
+
+
+@receiver(post_soft_delete, sender=Task)
+def update_soft_deleted_task_projects(
+    sender: type[Task],
+    deleted_at: datetime,
+    using: str,
+    **kwargs: dict[str, Any]
+) -> None:
+    """Recount and invalidate the projects of tasks soft deleted in bulk."""
+    project_ids: list[int] = list(
+        Task._base_manager.using(using).filter(
+            deleted_at=deleted_at,
+        ).order_by().values_list("project_id", flat=True).distinct()
+    )
+    recount_projects(project_ids)
+    invalidate_projects(project_ids)
+
+
+@receiver(post_soft_delete, sender=UserTask)
+def invalidate_soft_deleted_user_task_responses(
+    sender: type[UserTask],
+    deleted_at: datetime,
+    using: str,
+    **kwargs: dict[str, Any]
+) -> None:
+    """Invalidate cached responses of the projects of assignments soft deleted in bulk."""
+    invalidate_projects(
+        Task._base_manager.using(using).filter(
+            id__in=UserTask._base_manager.using(using).filter(
+                deleted_at=deleted_at,
+            ).values("task_id"),
+        ).order_by().values_list("project_id", flat=True).distinct()
+    )
+
+
+@receiver(m2m_changed, sender=Project.users.through)
+def invalidate_project_members_responses(
+    sender: type[Model],
+    instance: Model,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[set[int]],
+    **kwargs: dict[str, Any]
+) -> None:
+    """Invalidate cached responses after project members change."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        invalidate_projects([instance.pk])
+    elif action == "post_clear":
+        invalidate_projects(getattr(instance, "_cleared_project_ids", []))
+    else:
+        invalidate_projects(pk_set)
+
+
+@receiver(m2m_changed, sender=Project.users.through)
+def invalidate_project_memberships(
+    sender: type[Model],
+    instance: Model,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[set[int]],
+    **kwargs: dict[str, Any]
+) -> None:
+    """Drop cached membership sets of the users joining or leaving projects."""
+    if action == "pre_clear" and not reverse:
+        # Remember the users leaving the project, pk_set is empty on clear
+        instance._cleared_user_ids = list(
+            sender.objects.filter(project_id=instance.pk).values_list(
+                Project.users.field.m2m_reverse_field_name(), flat=True
+            )
+        )
+    elif action in ("post_add", "post_remove", "post_clear"):
+        if reverse:
+            invalidate_user_memberships([instance.pk])
+        elif action == "post_clear":
+            invalidate_user_memberships(getattr(instance, "_cleared_user_ids", []))
+        else:
+            invalidate_user_memberships(pk_set)
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def mirror_changed_user(sender: type[CustomUser], instance: CustomUser, **kwargs: dict[str, Any]) -> None:
+    """Copy a changed user into the shards once default commits."""
+    if is_sharding_enabled():
+        user_id: int = instance.pk
+        transaction.on_commit(lambda: mirror_users([user_id]), using=DEFAULT_DB_ALIAS)
+
+
+@receiver(post_soft_delete, sender=CustomUser)
+def mirror_soft_deleted_users(
+    sender: type[CustomUser],
+    deleted_at: datetime,
+    using: str,
+    **kwargs: dict[str, Any]
+) -> None:
+    """Copy the users of a QuerySet soft delete into the shards."""
+    if is_sharding_enabled():
+        user_ids: list[int] = list(
+            CustomUser._base_manager.using(using).filter(deleted_at=deleted_at).values_list("id", flat=True)
+        )
+        transaction.on_commit(lambda: mirror_users(user_ids), using=using)
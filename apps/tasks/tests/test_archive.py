@@ -0,0 +1,72 @@
+# Python modules
+from typing import Callable
+from datetime import datetime, timedelta
+from io import StringIO
+
+# Django modules
+from django.core.management import call_command
+from django.utils import timezone
+
+# Project modules
+from apps.auths.models import CustomUser
+from apps.tasks.archive import archive_done_tasks, purge_deleted_tasks, purge_deleted_user_tasks
+from apps.tasks.models import ArchivedTask, ArchivedUserTask, Project, Task, UserTask
+from apps.tasks.sharding import project_shard, shard_map
+
+
+class TestArchiveDoneTasks:
+    def test_old_done_subtree_moves_to_the_archive(self, project: Project, user: CustomUser) -> None:
+        root: Task = Task.objects.create(name="Root", project=project, status=Task.STATUS_DONE)
+        child: Task = Task.objects.create(name="Child", project=project, parent=root, status=Task.STATUS_DONE)
+        recent: Task = Task.objects.create(name="Recent", project=project, status=Task.STATUS_DONE)
+        UserTask.objects.create(task=child, user=user)
+        Task.objects.exclude(id=recent.id).update(updated_at=timezone.now() - timedelta(days=2))
+
+        archived: int = archive_done_tasks(cutoff=timezone.now() - timedelta(days=1), batch_size=1)
+
+        assert archived == 2
+        assert list(Task.all_objects.values_list("id", flat=True)) == [recent.id]
+        assert set(ArchivedTask.objects.values_list("id", flat=True)) == {root.id, child.id}
+        assert list(ArchivedUserTask.objects.values_list("task_id", "user_id")) == [(child.id, user.id)]
+        assert not UserTask.all_objects.exists()
+        project.refresh_from_db()
+        assert (project.tasks_count, project.tasks_done_count) == (1, 1)
+
+
+class TestPurgeDeleted:
+    def test_old_tombstones_are_removed(self, project: Project, user: CustomUser) -> None:
+        now: datetime = timezone.now()
+        tasks: list[Task] = [Task.objects.create(name=f"Task {index}", project=project) for index in range(3)]
+        UserTask.objects.bulk_create([UserTask(task=task, user=user) for task in tasks])
+        Task.objects.filter(id=tasks[0].id).update(deleted_at=now - timedelta(days=2))
+        UserTask.objects.filter(task=tasks[1]).update(deleted_at=now - timedelta(days=2))
+        Task.objects.filter(id=tasks[2].id).update(deleted_at=now)
+
+        assert purge_deleted_tasks(cutoff=now - timedelta(days=1), batch_size=10) == 1
+        assert purge_deleted_user_tasks(cutoff=now - timedelta(days=1), batch_size=10) == 1
+        assert set(Task.all_objects.values_list("id", flat=True)) == {tasks[1].id, tasks[2].id}
+        assert list(UserTask.all_objects.values_list("task_id", flat=True)) == [tasks[2].id]
+
+
+class TestArchiveTasksCommand:
+    def test_every_shard_is_archived(
+        self,
+        sharded: str,
+        user: CustomUser,
+        project_factory: Callable[..., Project],
+    ) -> None:
+        aliases: dict[str, Project] = {}
+        while len(aliases) < 2:
+            project: Project = project_factory(author=user)
+            aliases.setdefault(shard_map.get_placement(project.id)[0], project)
+        for project in aliases.values():
+            with project_shard(project.id):
+                Task.objects.create(name="Done", project=project, status=Task.STATUS_DONE)
+                Task.objects.update(updated_at=timezone.now() - timedelta(days=400))
+
+        call_command("archivetasks", stdout=StringIO())
+
+        alias: str
+        for alias in aliases:
+            assert not Task.all_objects.using(alias).exists()
+            assert ArchivedTask.objects.using(alias).count() == 1
@@ -0,0 +1,34 @@
+# Python modules
+from asgiref.sync import async_to_sync
+
+# Django modules
+from django.db import IntegrityError
+
+# Pytest modules
+import pytest
+
+# Project modules
+from apps.auths.models import CustomUser
+from apps.tasks.models import Project
+from apps.tasks.serializers import ProjectAsyncCreateSerializer
+
+
+def create_project(**data: dict) -> Project:
+    serializer: ProjectAsyncCreateSerializer = ProjectAsyncCreateSerializer(data=data)
+    assert serializer.is_valid(), serializer.errors
+    return async_to_sync(serializer.asave)()
+
+
+class TestProjectAsyncCreate:
+    def test_project_is_created_with_its_members(self, user: CustomUser) -> None:
+        project: Project = create_project(name="Async", author=user.id, users=[user.id])
+
+        assert list(project.users.values_list("id", flat=True)) == [user.id]
+        assert Project.objects.get(id=project.id).members_count == 1
+
+    def test_failed_membership_leaves_no_project(self, user: CustomUser) -> None:
+        # avalidate_users() is skipped, the missing user fails the foreign key
+        with pytest.raises(IntegrityError):
+            create_project(name="Async", author=user.id, users=[user.id + 1000])
+
+        assert not Project.all_objects.exists()
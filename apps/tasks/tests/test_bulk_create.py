@@ -0,0 +1,86 @@
+# Python modules
+from typing import Any, Callable
+
+# Django modules
+from django.conf import settings
+from django.test import override_settings
+from django.urls import reverse
+
+# Django REST Framework modules
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+# Pytest modules
+import pytest
+
+# Project modules
+from apps.auths.models import CustomUser
+from apps.tasks.models import Project, Task, UserTask
+
+
+def bulk_create(user: CustomUser, project: Project, items: Any) -> Response:
+    client: APIClient = APIClient()
+    client.force_authenticate(user)
+    return client.post(reverse("project-tasks_bulk", kwargs={"pk": project.id}), items, format="json")
+
+
+class TestTaskBulkCreate:
+    def test_items_are_created_with_parents_and_assignees(self, project: Project, user: CustomUser) -> None:
+        parent: Task = Task.objects.create(name="Parent", project=project)
+        other: CustomUser = CustomUser.objects.create(email="other@example.com", full_name="Other")
+
+        response: Response = bulk_create(user, project, [
+            {"name": "First", "parent": parent.id, "assignees": [other.id]},
+            {"name": "Second", "status": Task.STATUS_DONE},
+        ])
+
+        assert response.status_code == 201
+        assert response.data["count"] == 2
+        first, second = Task.objects.in_bulk(response.data["ids"]).values()
+        assert (first.name, first.parent_id, first.depth) == ("First", parent.id, 1)
+        assert set(UserTask.objects.filter(task=first).values_list("user_id", flat=True)) == {user.id, other.id}
+        assert list(UserTask.objects.filter(task=second).values_list("user_id", flat=True)) == [user.id]
+        assert Project.objects.get(id=project.id).tasks_done_count == 1
+
+    def test_batch_over_the_cap_is_rejected(self, project: Project, user: CustomUser) -> None:
+        with override_settings(TASK_BULK_OPERATIONS={**settings.TASK_BULK_OPERATIONS, "MAX_ITEMS": 2}):
+            response: Response = bulk_create(user, project, [{"name": f"Task {index}"} for index in range(3)])
+            assert response.status_code == 400
+            assert not Task.objects.exists()
+
+            assert bulk_create(user, project, [{"name": "Task 0"}, {"name": "Task 1"}]).status_code == 201
+
+    @pytest.mark.parametrize("items", [[], {"name": "Not a list"}])
+    def test_empty_or_non_list_body_is_rejected(self, project: Project, user: CustomUser, items: Any) -> None:
+        assert bulk_create(user, project, items).status_code == 400
+
+    def test_invalid_fields_are_reported_per_item(self, project: Project, user: CustomUser) -> None:
+        response: Response = bulk_create(user, project, [
+            {"name": "Valid"},
+            {"name": ""},
+            {"name": "Bad status", "status": 9},
+        ])
+
+        assert response.status_code == 400
+        assert [set(errors) for errors in response.data] == [set(), {"name"}, {"status"}]
+        assert not Task.objects.exists()
+
+    def test_invalid_references_reject_the_whole_batch(
+        self,
+        project: Project,
+        project_factory: Callable[..., Project],
+        user: CustomUser,
+    ) -> None:
+        foreign: Task = Task.objects.create(name="Foreign", project=project_factory(author=user, name="Other"))
+        inactive: CustomUser = CustomUser.objects.create(email="gone@example.com", full_name="Gone", is_active=False)
+
+        response: Response = bulk_create(user, project, [
+            {"name": "Valid"},
+            {"name": "Foreign parent", "parent": foreign.id},
+            {"name": "Inactive assignee", "assignees": [inactive.id]},
+        ])
+
+        assert response.status_code == 400
+        # Cross-item checks run on the validated list, their errors are listed per item too
+        assert [set(errors) for errors in response.data["non_field_errors"]] == [set(), {"parent"}, {"assignees"}]
+        assert not Task.objects.filter(project_id=project.id).exists()
@@ -0,0 +1,61 @@
+# Django modules
+from django.conf import settings
+from django.test import override_settings
+from django.urls import reverse
+
+# Django REST Framework modules
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+# Project modules
+from apps.auths.models import CustomUser
+from apps.tasks.models import Project, Task, UserTask
+
+
+def bulk_update(user: CustomUser, **data: dict) -> Response:
+    client: APIClient = APIClient()
+    client.force_authenticate(user)
+    return client.post(reverse("task-bulk_update"), data, format="json")
+
+
+class TestTaskBulkUpdate:
+    def test_assigned_counts_only_new_assignments(self, project: Project, user: CustomUser) -> None:
+        tasks: list[Task] = [Task.objects.create(name=f"Task {index}", project=project) for index in range(3)]
+        other: CustomUser = CustomUser.objects.create(email="other@example.com", full_name="Other")
+        UserTask.objects.create(task=tasks[0], user=user)
+
+        response: Response = bulk_update(user, ids=[task.id for task in tasks], assign=[user.id, other.id])
+
+        assert response.status_code == 200
+        assert response.data["assigned"] == 5
+        assert UserTask.objects.filter(task__project=project).count() == 6
+
+    def test_unassign_deletes_the_rows(self, project: Project, user: CustomUser) -> None:
+        tasks: list[Task] = [Task.objects.create(name=f"Task {index}", project=project) for index in range(2)]
+        UserTask.objects.bulk_create([UserTask(task=task, user=user) for task in tasks])
+
+        response: Response = bulk_update(user, ids=[tasks[0].id], unassign=[user.id], status=Task.STATUS_DONE)
+
+        assert response.data["unassigned"] == 1 and response.data["status_updated"] == 1
+        assert list(UserTask.all_objects.values_list("task_id", flat=True)) == [tasks[1].id]
+        assert Project.objects.get(id=project.id).tasks_done_count == 1
+
+    def test_filter_matching_more_than_the_cap_is_rejected(self, project: Project, user: CustomUser) -> None:
+        for index in range(3):
+            Task.objects.create(name=f"Task {index}", project=project)
+
+        with override_settings(TASK_BULK_OPERATIONS={**settings.TASK_BULK_OPERATIONS, "MAX_ITEMS": 2}):
+            response: Response = bulk_update(user, filter={"project": project.id}, status=Task.STATUS_DONE)
+            assert response.status_code == 400
+            assert list(response.data) == ["filter"]
+            assert not Task.objects.filter(status=Task.STATUS_DONE).exists()
+
+            response = bulk_update(
+                user,
+                filter={"project": project.id, "status": [Task.STATUS_TODO]},
+                status=Task.STATUS_DONE,
+            )
+            assert response.status_code == 400
+
+        response = bulk_update(user, filter={"project": project.id}, status=Task.STATUS_DONE)
+        assert response.status_code == 200 and response.data["matched"] == 3
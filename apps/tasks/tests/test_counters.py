@@ -0,0 +1,77 @@
+# Python modules
+from io import StringIO
+
+# Django modules
+from django.core.management import call_command
+
+# Project modules
+from apps.auths.models import CustomUser
+from apps.tasks.counters import reconcile_projects
+from apps.tasks.models import Project, Task
+
+
+def get_counters(project: Project) -> tuple[int, int, int, int, int]:
+    project = Project.all_objects.get(id=project.id)
+    return (
+        project.members_count,
+        project.tasks_count,
+        project.tasks_todo_count,
+        project.tasks_in_progress_count,
+        project.tasks_done_count,
+    )
+
+
+class TestTaskCounters:
+    def test_create_status_change_and_soft_delete(self, project: Project) -> None:
+        todo: Task = Task.objects.create(name="Todo", project=project)
+        done: Task = Task.objects.create(name="Done", project=project, status=Task.STATUS_DONE)
+        assert get_counters(project)[1:] == (2, 1, 0, 1)
+
+        todo.status = Task.STATUS_IN_PROGRESS
+        todo.save()
+        assert get_counters(project)[1:] == (2, 0, 1, 1)
+
+        done.delete()
+        assert get_counters(project)[1:] == (1, 0, 1, 0)
+
+    def test_bulk_soft_delete_recounts(self, project: Project) -> None:
+        Task.objects.bulk_create([Task(name=f"Task {index}", project=project) for index in range(3)])
+        Task.objects.filter(project=project).delete()
+        assert get_counters(project)[1:] == (0, 0, 0, 0)
+
+    def test_status_update_of_unloaded_fields_recounts(self, project: Project) -> None:
+        task: Task = Task.objects.create(name="Todo", project=project)
+        deferred: Task = Task.objects.only("id", "project_id").get(id=task.id)
+        deferred.status = Task.STATUS_DONE
+        deferred.save(update_fields=["status"])
+        assert get_counters(project)[1:] == (1, 0, 0, 1)
+
+
+class TestMemberCounters:
+    def test_add_remove_and_clear(self, project: Project, user: CustomUser) -> None:
+        others: list[CustomUser] = [
+            CustomUser.objects.create(email=f"member{index}@example.com", full_name="Member")
+            for index in range(2)
+        ]
+        project.users.add(user, *others)
+        assert get_counters(project)[0] == 3
+
+        project.users.remove(others[0])
+        assert get_counters(project)[0] == 2
+
+        others[1].joined_projects.clear()
+        assert get_counters(project)[0] == 1
+
+
+class TestReconcile:
+    def test_drifted_counters_are_fixed(self, project: Project) -> None:
+        Task.objects.create(name="Todo", project=project)
+        Project.objects.filter(id=project.id).update(tasks_count=7, tasks_todo_count=0)
+
+        assert [drifted.id for drifted in reconcile_projects(Project.objects.filter(id=project.id))] == [project.id]
+        assert get_counters(project) == (1, 1, 1, 0, 0)
+
+    def test_command(self, project: Project) -> None:
+        Project.objects.filter(id=project.id).update(members_count=5)
+        call_command("reconcileprojectcounters", stdout=StringIO())
+        assert get_counters(project)[0] == 1
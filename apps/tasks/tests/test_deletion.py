@@ -0,0 +1,154 @@
+# Python modules
+from typing import Callable
+from io import StringIO
+from threading import Event, Thread
+from time import sleep
+
+# Django modules
+from django.conf import settings
+from django.core.management import call_command
+from django.db import OperationalError, connections, transaction
+from django.test import override_settings
+
+# Pytest modules
+import pytest
+
+# Project modules
+from apps.auths.models import CustomUser
+from apps.tasks import deletion
+from apps.tasks.deletion import run_project_deletion_job, schedule_project_deletion, start_project_deletion
+from apps.tasks.models import Project, ProjectDeletionJob, Task, UserTask
+from apps.tasks.sharding import project_shard, shard_map
+
+
+def create_tasks(project: Project, user: CustomUser, count: int) -> list[Task]:
+    tasks: list[Task] = [Task.objects.create(name=f"Task {index}", project=project) for index in range(count)]
+    UserTask.objects.bulk_create([UserTask(task=task, user=user) for task in tasks])
+    return tasks
+
+
+def deletion_settings(**overrides: dict) -> override_settings:
+    return override_settings(PROJECT_DELETION={
+        **settings.PROJECT_DELETION,
+        "RUN_IN_BACKGROUND": False,
+        **overrides,
+    })
+
+
+class TestProjectDeletionJob:
+    def test_cascade_tombstones_tasks_and_assignments(self, project: Project, user: CustomUser) -> None:
+        create_tasks(project, user, count=7)
+
+        with deletion_settings(BATCH_SIZE=3):
+            job: ProjectDeletionJob = schedule_project_deletion(project)
+            run_project_deletion_job(job.id)
+
+        job.refresh_from_db()
+        assert job.status == ProjectDeletionJob.STATUS_DONE
+        assert (job.tasks_deleted, job.user_tasks_deleted) == (7, 7)
+        assert not Task.objects.filter(project_id=project.id).exists()
+        assert not UserTask.objects.filter(task__project_id=project.id).exists()
+        assert Project.all_objects.get(id=project.id).tasks_count == 0
+
+    def test_runs_while_another_thread_writes(self, project: Project, user: CustomUser) -> None:
+        create_tasks(project, user, count=30)
+        other: Project = Project.objects.create(name="Other", author=user)
+        stop: Event = Event()
+
+        def write() -> None:
+            try:
+                while not stop.is_set():
+                    with transaction.atomic():
+                        Project.objects.filter(id=other.id).update(name="Other")
+                        sleep(0.01)
+                    sleep(0.002)
+            finally:
+                connections.close_all()
+
+        with deletion_settings(BATCH_SIZE=2, RETRY_BACKOFF=0.05):
+            job: ProjectDeletionJob = schedule_project_deletion(project)
+            writer: Thread = Thread(target=write)
+            writer.start()
+            try:
+                start_project_deletion(job.id, project.id).join(timeout=60)
+            finally:
+                stop.set()
+                writer.join()
+
+        job.refresh_from_db()
+        assert job.status == ProjectDeletionJob.STATUS_DONE
+        assert (job.tasks_deleted, job.user_tasks_deleted) == (30, 30)
+        assert not Task.objects.filter(project_id=project.id).exists()
+
+    def test_locked_run_is_released_and_retried(
+        self,
+        project: Project,
+        user: CustomUser,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        create_tasks(project, user, count=3)
+        failures: list[int] = [1]
+
+        def process_batch(**kwargs: dict) -> bool:
+            if failures:
+                failures.pop()
+                raise OperationalError("database is locked")
+            return process_project_deletion_batch(**kwargs)
+
+        process_project_deletion_batch = deletion.process_project_deletion_batch
+        monkeypatch.setattr(deletion, "process_project_deletion_batch", process_batch)
+
+        with deletion_settings(RETRY_BACKOFF=0):
+            job: ProjectDeletionJob = schedule_project_deletion(project)
+            with pytest.raises(OperationalError):
+                run_project_deletion_job(job.id)
+            job.refresh_from_db()
+            assert job.status == ProjectDeletionJob.STATUS_PENDING
+
+            failures.append(1)
+            start_project_deletion(job.id, project.id).join(timeout=60)
+
+        job.refresh_from_db()
+        assert job.status == ProjectDeletionJob.STATUS_DONE
+        assert job.tasks_deleted == 3
+
+
+class TestShardedProjectDeletion:
+    @pytest.fixture
+    def projects(
+        self,
+        sharded: str,
+        user: CustomUser,
+        project_factory: Callable[..., Project],
+    ) -> dict[str, Project]:
+        """A project with tasks on each shard, placed by id."""
+        projects: dict[str, Project] = {}
+        while len(projects) < 2:
+            project: Project = project_factory(author=user)
+            projects.setdefault(shard_map.get_placement(project.id)[0], project)
+        for project in projects.values():
+            with project_shard(project.id):
+                create_tasks(project, user, count=3)
+        return projects
+
+    def test_background_job_runs_on_the_project_shard(self, sharded: str, projects: dict[str, Project]) -> None:
+        project: Project = projects[sharded]
+
+        with deletion_settings():
+            job: ProjectDeletionJob = schedule_project_deletion(project)
+            start_project_deletion(job.id, project.id).join(timeout=60)
+
+        assert ProjectDeletionJob.objects.using(sharded).get(id=job.id).status == ProjectDeletionJob.STATUS_DONE
+        assert not Task.objects.using(sharded).filter(project_id=project.id).exists()
+        assert not ProjectDeletionJob.objects.using("default").exists()
+
+    def test_command_runs_the_jobs_of_every_shard(self, projects: dict[str, Project]) -> None:
+        with deletion_settings():
+            for project in projects.values():
+                schedule_project_deletion(project)
+            call_command("runprojectdeletions", stdout=StringIO())
+
+        alias: str
+        for alias, project in projects.items():
+            job: ProjectDeletionJob = ProjectDeletionJob.objects.using(alias).get(project_id=project.id)
+            assert (job.status, job.tasks_deleted) == (ProjectDeletionJob.STATUS_DONE, 3)
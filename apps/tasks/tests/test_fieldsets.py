@@ -0,0 +1,75 @@
+# Python modules
+from typing import Any
+
+# Django modules
+from django.urls import reverse
+
+# Django REST Framework modules
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+# Pytest modules
+import pytest
+
+# Project modules
+from apps.auths.models import CustomUser
+from apps.tasks.models import Project, Task, UserTask
+
+
+def get(user: CustomUser, url: str, **params: Any) -> Response:
+    client: APIClient = APIClient()
+    client.force_authenticate(user)
+    return client.get(url, params)
+
+
+class TestSparseFieldsets:
+    def test_fields_narrow_the_task_payload(self, project: Project, user: CustomUser) -> None:
+        Task.objects.create(name="Task", project=project)
+
+        response: Response = get(user, reverse("project-tasks", kwargs={"pk": project.id}), fields="id,name")
+
+        assert response.status_code == 200
+        assert [set(item) for item in response.data["results"]] == [{"id", "name"}]
+
+    def test_fields_narrow_the_project_payload(self, project: Project, user: CustomUser) -> None:
+        response: Response = get(user, reverse("project-list"), fields="id,tasks_status_counts")
+
+        assert response.status_code == 200
+        assert [set(item) for item in response.data["results"]] == [{"id", "tasks_status_counts"}]
+        assert response.data["results"][0]["id"] == project.id
+
+    def test_expand_replaces_ids_with_objects(self, project: Project, user: CustomUser) -> None:
+        UserTask.objects.create(task=Task.objects.create(name="Task", project=project), user=user)
+        url: str = reverse("project-tasks", kwargs={"pk": project.id})
+
+        assert get(user, url, fields="assignees").data["results"] == [{"assignees": [user.id]}]
+
+        expanded: dict[str, Any] = get(user, url, fields="assignees", expand="assignees").data["results"][0]
+        assert [assignee["id"] for assignee in expanded["assignees"]] == [user.id]
+        assert expanded["assignees"][0]["email"] == user.email
+
+        author: Any = get(user, reverse("project-list"), expand="author").data["results"][0]["author"]
+        assert author["id"] == user.id
+
+    @pytest.mark.parametrize(
+        argnames=["url_name", "params", "error_key"],
+        argvalues=[
+            ("project-tasks", {"fields": "id,secret"}, "fields"),
+            ("project-tasks", {"expand": "project"}, "expand"),
+            ("project-list", {"fields": "password"}, "fields"),
+            ("project-list", {"expand": "users"}, "expand"),
+        ],
+    )
+    def test_unknown_fields_are_rejected(
+        self,
+        project: Project,
+        user: CustomUser,
+        url_name: str,
+        params: dict[str, str],
+        error_key: str,
+    ) -> None:
+        url: str = reverse(url_name, kwargs={"pk": project.id}) if url_name == "project-tasks" else reverse(url_name)
+        response: Response = get(user, url, **params)
+
+        assert response.status_code == 400
+        assert list(response.data) == [error_key]
@@ -0,0 +1,66 @@
+# Django modules
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+# Django REST Framework modules
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+# Pytest modules
+import pytest
+
+# Project modules
+from apps.auths.models import CustomUser
+from apps.tasks.models import Project, Task
+
+
+def get_archived(user: CustomUser, project_id: int) -> tuple[Response, list[str]]:
+    """Call a member only project action, return the response and its SQL."""
+    client: APIClient = APIClient()
+    client.force_authenticate(user)
+    with CaptureQueriesContext(connection) as queries:
+        response: Response = client.get(reverse("project-tasks_archived", kwargs={"pk": project_id}))
+    return response, [query["sql"] for query in queries.captured_queries]
+
+
+class TestProjectMembership:
+    def test_non_member_is_refused_after_one_query(self, project: Project) -> None:
+        stranger: CustomUser = CustomUser.objects.create(email="stranger@example.com", full_name="Stranger")
+
+        response, queries = get_archived(stranger, project.id)
+
+        assert response.status_code == 403
+        assert len(queries) == 1
+        assert "EXISTS" in queries[0]
+
+    def test_member_passes_on_the_same_query(self, project: Project, user: CustomUser) -> None:
+        response, queries = get_archived(user, project.id)
+
+        assert response.status_code == 200
+        # The project lookup with is_member, then the page of archived tasks
+        assert "EXISTS" in queries[0]
+        assert not any("tasks_project_users" in query for query in queries[1:])
+
+    def test_missing_project_is_not_found(self, user: CustomUser, db: None) -> None:
+        response, queries = get_archived(user, 999999)
+
+        assert response.status_code == 404
+        assert len(queries) == 1
+
+    @pytest.mark.parametrize(
+        argnames=["url_name", "data"],
+        argvalues=[
+            ("project-create_task", {"name": "Task"}),
+            ("project-tasks_bulk", [{"name": "Task"}]),
+        ],
+    )
+    def test_membership_guards_writes(self, project: Project, url_name: str, data: object) -> None:
+        stranger: CustomUser = CustomUser.objects.create(email="stranger@example.com", full_name="Stranger")
+        client: APIClient = APIClient()
+        client.force_authenticate(stranger)
+
+        response: Response = client.post(reverse(url_name, kwargs={"pk": project.id}), data, format="json")
+
+        assert response.status_code == 403
+        assert not Task.objects.filter(project_id=project.id).exists()
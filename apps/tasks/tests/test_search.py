@@ -0,0 +1,84 @@
+# Python modules
+from io import StringIO
+from typing import Any, Callable
+
+# Django modules
+from django.core.management import call_command
+from django.db import connection
+from django.urls import reverse
+
+# Django REST Framework modules
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+# Project modules
+from apps.abstracts.fts import build_match_expression
+from apps.auths.models import CustomUser
+from apps.tasks.models import Project, Task
+from apps.tasks.search import FTS_TABLE, search_tasks
+
+
+def find(project: Project, text: str) -> list[int]:
+    rows: list[dict[str, Any]] = search_tasks(match=build_match_expression(text), limit=10, project_id=project.id)
+    return [row["id"] for row in rows]
+
+
+class TestSearchIndexTriggers:
+    def test_index_follows_inserts_updates_and_deletes(self, project: Project) -> None:
+        task: Task = Task.objects.create(name="Renew certificate", description="Before expiry", project=project)
+        assert find(project, "certificate") == [task.id]
+        assert find(project, "expir") == [task.id]
+
+        task.name = "Rotate keys"
+        task.save()
+        assert find(project, "certificate") == []
+        assert find(project, "rotate") == [task.id]
+
+        task.delete()
+        assert find(project, "rotate") == []
+
+        Task.all_objects.filter(id=task.id).hard_delete()
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT count(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH 'rotate'")
+            assert cursor.fetchone()[0] == 0
+
+    def test_name_hits_rank_first(self, project: Project) -> None:
+        in_description: Task = Task.objects.create(name="Deploy", description="Update the invoice template", project=project)
+        in_name: Task = Task.objects.create(name="Invoice export", project=project)
+        assert find(project, "invoice") == [in_name.id, in_description.id]
+
+    def test_rebuild_command_backfills_the_index(self, project: Project) -> None:
+        task: Task = Task.objects.create(name="Backfilled", project=project)
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('delete-all')")
+        assert find(project, "backfilled") == []
+
+        call_command("rebuildtasksearch", stdout=StringIO())
+        assert find(project, "backfilled") == [task.id]
+
+
+class TestSearchEndpoints:
+    def test_results_of_the_callers_projects_with_snippets(
+        self,
+        project: Project,
+        project_factory: Callable[..., Project],
+        user: CustomUser,
+    ) -> None:
+        task: Task = Task.objects.create(name="Quarterly report", project=project)
+        stranger: CustomUser = CustomUser.objects.create(email="stranger@example.com", full_name="Stranger")
+        Task.objects.create(name="Quarterly budget", project=project_factory(author=stranger))
+        client: APIClient = APIClient()
+        client.force_authenticate(user)
+
+        response: Response = client.get(reverse("task-search"), {"q": "quarter"})
+        assert response.status_code == 200
+        assert [result["id"] for result in response.data["results"]] == [task.id]
+        assert response.data["results"][0]["name_snippet"] == "[Quarterly] report"
+
+        response = client.get(reverse("project-tasks_search", kwargs={"pk": project.id}), {"q": "report"})
+        assert [result["id"] for result in response.data["results"]] == [task.id]
+
+    def test_query_without_words_is_rejected(self, user: CustomUser) -> None:
+        client: APIClient = APIClient()
+        client.force_authenticate(user)
+        assert client.get(reverse("task-search"), {"q": "  *  "}).status_code == 400
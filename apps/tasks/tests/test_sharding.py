@@ -0,0 +1,116 @@
+# Python modules
+from io import StringIO
+from pathlib import Path
+from typing import Callable
+import json
+
+# Django modules
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS
+from django.urls import reverse
+
+# Django REST Framework modules
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+# Pytest modules
+import pytest
+
+# Project modules
+from apps.auths.models import CustomUser
+from apps.tasks.models import Project, ProjectShard, Task, UserTask
+from apps.tasks.rebalance import move_project
+from apps.tasks.sharding import ProjectShardMoving, project_shard, shard_map
+
+
+@pytest.fixture
+def projects(sharded: str, user: CustomUser, project_factory: Callable[..., Project]) -> dict[str, Project]:
+    """A project of the user on each shard, with a task assigned to the user."""
+    projects: dict[str, Project] = {}
+    while len(projects) < 2:
+        project: Project = project_factory(author=user)
+        projects.setdefault(shard_map.get_placement(project.id)[0], project)
+    for project in projects.values():
+        with project_shard(project.id):
+            UserTask.objects.create(task=Task.objects.create(name="Task", project=project), user=user)
+    return projects
+
+
+class TestProjectShardRouter:
+    def test_project_rows_are_stored_on_its_shard(self, sharded: str, projects: dict[str, Project]) -> None:
+        alias: str
+        project: Project
+        for alias, project in projects.items():
+            other: str = sharded if alias == DEFAULT_DB_ALIAS else DEFAULT_DB_ALIAS
+            assert ProjectShard.objects.get(project_id=project.id).alias == alias
+            assert Task.objects.using(alias).filter(project_id=project.id).count() == 1
+            assert not Task.objects.using(other).filter(project_id=project.id).exists()
+            assert UserTask.objects.using(alias).filter(task__project_id=project.id).count() == 1
+
+    def test_ids_are_unique_across_shards(self, sharded: str, projects: dict[str, Project]) -> None:
+        task_ids: list[int] = [
+            task_id for alias in projects
+            for task_id in Task.objects.using(alias).values_list("id", flat=True)
+        ]
+        assert len(set(task_ids)) == len(task_ids) == 2
+
+    def test_instances_route_to_the_database_they_came_from(self, sharded: str, projects: dict[str, Project]) -> None:
+        task: Task = Task.objects.using(sharded).get(project_id=projects[sharded].id)
+        task.name = "Renamed"
+        task.save()
+        assert Task.objects.using(sharded).get(id=task.id).name == "Renamed"
+        assert task.project.id == projects[sharded].id
+
+    def test_writes_to_a_moving_project_are_refused(self, sharded: str, projects: dict[str, Project]) -> None:
+        project: Project = projects[sharded]
+        shard_map.set_placement(project.id, sharded, moving=True)
+
+        with project_shard(project.id):
+            assert Task.objects.filter(project_id=project.id).count() == 1
+            with pytest.raises(ProjectShardMoving):
+                Task.objects.create(name="Refused", project=project)
+
+
+class TestShardedViews:
+    def test_list_and_detail_span_every_shard(self, projects: dict[str, Project], user: CustomUser) -> None:
+        client: APIClient = APIClient()
+        client.force_authenticate(user)
+
+        response: Response = client.get(reverse("project-list"))
+        assert response.status_code == 200
+        assert {item["id"] for item in response.data["results"]} == {project.id for project in projects.values()}
+
+        for project in projects.values():
+            response = client.get(reverse("project-tasks", kwargs={"pk": project.id}))
+            assert response.status_code == 200
+            assert len(response.data["results"]) == 1
+
+
+class TestShardedCommands:
+    def test_export_reads_every_shard(self, sharded: str, projects: dict[str, Project], tmp_path: Path) -> None:
+        output: str = str(tmp_path / "tasks.ndjson")
+        call_command("exporttasks", output=output, fields="id,project", stderr=StringIO())
+        with open(output) as lines:
+            exported: list[int] = [json.loads(line)["project"] for line in lines]
+        assert sorted(exported) == sorted(project.id for project in projects.values())
+
+    def test_export_of_a_project_reads_its_shard(self, sharded: str, projects: dict[str, Project], tmp_path: Path) -> None:
+        project: Project = projects[sharded]
+        output: str = str(tmp_path / "tasks.ndjson")
+        call_command("exporttasks", project=project.id, output=output, fields="id,project", stderr=StringIO())
+        with open(output) as lines:
+            assert [json.loads(line)["project"] for line in lines] == [project.id]
+
+
+class TestMoveProject:
+    def test_rows_follow_the_project(self, sharded: str, projects: dict[str, Project]) -> None:
+        project: Project = projects[DEFAULT_DB_ALIAS]
+
+        result: dict = move_project(project.id, target=sharded, batch_size=1, pause=0)
+
+        assert result["source"] == DEFAULT_DB_ALIAS
+        assert shard_map.get_placement(project.id) == (sharded, False)
+        assert Task.objects.using(sharded).filter(project_id=project.id).count() == 1
+        assert UserTask.objects.using(sharded).filter(task__project_id=project.id).count() == 1
+        assert not Project.all_objects.using(DEFAULT_DB_ALIAS).filter(id=project.id).exists()
+        assert not Task.all_objects.using(DEFAULT_DB_ALIAS).filter(project_id=project.id).exists()
@@ -0,0 +1,75 @@
+# Python modules
+from typing import Callable
+
+# Django modules
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+# Django REST Framework modules
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+# Project modules
+from apps.abstracts.models import post_soft_delete
+from apps.auths.models import CustomUser
+from apps.tasks.models import Project, Task, UserTask
+
+
+class TestSoftDelete:
+    def test_queryset_delete_is_a_single_update(self, project: Project) -> None:
+        Task.objects.bulk_create([Task(name=f"Task {index}", project=project) for index in range(3)])
+        received: list[dict] = []
+
+        def receive(**kwargs: dict) -> None:
+            received.append(kwargs)
+
+        post_soft_delete.connect(receive, sender=Task)
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                count: int
+                count, _ = Task.objects.filter(project=project).delete()
+        finally:
+            post_soft_delete.disconnect(receive, sender=Task)
+
+        assert count == 3
+        assert [query["sql"].split()[0] for query in queries.captured_queries][0] == "UPDATE"
+        assert len(received) == 1
+        assert Task.all_objects.filter(deleted_at=received[0]["deleted_at"]).count() == 3
+
+    def test_managers_hide_soft_deleted_rows(self, project: Project) -> None:
+        live: Task = Task.objects.create(name="Live", project=project)
+        gone: Task = Task.objects.create(name="Gone", project=project)
+        gone.delete()
+
+        assert list(Task.objects.values_list("id", flat=True)) == [live.id]
+        assert set(Task.all_objects.values_list("id", flat=True)) == {live.id, gone.id}
+        assert Task.all_objects.get(id=gone.id).deleted_at is not None
+
+    def test_hard_delete_removes_rows(self, project: Project) -> None:
+        task: Task = Task.objects.create(name="Task", project=project)
+        Task.all_objects.filter(id=task.id).hard_delete()
+        assert not Task.all_objects.exists()
+
+    def test_soft_deleted_assignment_does_not_block_a_new_one(self, project: Project, user: CustomUser) -> None:
+        task: Task = Task.objects.create(name="Task", project=project)
+        UserTask.objects.create(task=task, user=user)
+        UserTask.objects.filter(task=task).delete()
+
+        UserTask.objects.create(task=task, user=user)
+        assert UserTask.all_objects.filter(task=task, user=user).count() == 2
+
+    def test_soft_deleted_project_is_not_listed(
+        self,
+        project_factory: Callable[..., Project],
+        user: CustomUser,
+    ) -> None:
+        kept: Project = project_factory(author=user, name="Kept")
+        project_factory(author=user, name="Deleted").delete()
+        client: APIClient = APIClient()
+        client.force_authenticate(user)
+
+        response: Response = client.get(reverse("project-list"))
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.data["results"]] == [kept.id]
@@ -0,0 +1,102 @@
+# Python modules
+from datetime import datetime, timedelta
+from typing import Any
+
+# Django modules
+from django.urls import reverse
+from django.utils import timezone
+
+# Django REST Framework modules
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+# Pytest modules
+import pytest
+
+# Project modules
+from apps.auths.models import CustomUser
+from apps.tasks.models import Project, Task, UserTask
+
+
+def list_tasks(user: CustomUser, project: Project, **params: Any) -> Response:
+    client: APIClient = APIClient()
+    client.force_authenticate(user)
+    return client.get(reverse("project-tasks", kwargs={"pk": project.id}), params)
+
+
+def ids(response: Response) -> list[int]:
+    return [item["id"] for item in response.data["results"]]
+
+
+@pytest.fixture
+def tasks(project: Project, user: CustomUser) -> dict[str, Task]:
+    """A small tree of tasks in different statuses, "doing" is assigned to the user."""
+    root: Task = Task.objects.create(name="Root", project=project, status=Task.STATUS_DONE)
+    doing: Task = Task.objects.create(name="Doing", project=project, status=Task.STATUS_IN_PROGRESS, parent=root)
+    todo: Task = Task.objects.create(name="Todo", project=project, status=Task.STATUS_TODO, parent=root)
+    UserTask.objects.create(task=doing, user=user)
+    return {"root": root, "doing": doing, "todo": todo}
+
+
+class TestTaskListingFilters:
+    def test_status_parent_root_and_assignee(self, project: Project, user: CustomUser, tasks: dict[str, Task]) -> None:
+        response: Response = list_tasks(user, project, status=[Task.STATUS_TODO, Task.STATUS_DONE])
+        assert response.status_code == 200
+        assert ids(response) == [tasks["root"].id, tasks["todo"].id]
+
+        assert ids(list_tasks(user, project, parent=tasks["root"].id)) == [tasks["doing"].id, tasks["todo"].id]
+        assert ids(list_tasks(user, project, root=True)) == [tasks["root"].id]
+        assert ids(list_tasks(user, project, assignee=user.id)) == [tasks["doing"].id]
+
+    def test_updated_range(self, project: Project, user: CustomUser, tasks: dict[str, Task]) -> None:
+        moment: datetime = timezone.now() - timedelta(days=1)
+        Task.objects.filter(id=tasks["root"].id).update(updated_at=moment - timedelta(days=1))
+
+        assert ids(list_tasks(user, project, updated_before=moment.isoformat())) == [tasks["root"].id]
+        assert ids(list_tasks(user, project, updated_after=moment.isoformat())) == [tasks["doing"].id, tasks["todo"].id]
+
+    @pytest.mark.parametrize(
+        argnames=["params", "error_key"],
+        argvalues=[
+            ({"ordering": "name"}, "ordering"),
+            ({"status": 9}, "status"),
+            ({"parent": 0}, "parent"),
+            ({"root": True, "parent": 1}, "root"),
+        ],
+    )
+    def test_invalid_parameters_are_rejected(
+        self,
+        project: Project,
+        user: CustomUser,
+        params: dict[str, Any],
+        error_key: str,
+    ) -> None:
+        response: Response = list_tasks(user, project, **params)
+        assert response.status_code == 400
+        assert list(response.data) == [error_key]
+
+
+class TestTaskListingOrderingAndPages:
+    def test_orderings(self, project: Project, user: CustomUser, tasks: dict[str, Task]) -> None:
+        assert ids(list_tasks(user, project, ordering="-id")) == [tasks["todo"].id, tasks["doing"].id, tasks["root"].id]
+        assert ids(list_tasks(user, project, ordering="status")) == [tasks["todo"].id, tasks["doing"].id, tasks["root"].id]
+        assert ids(list_tasks(user, project, ordering="-status")) == [tasks["root"].id, tasks["doing"].id, tasks["todo"].id]
+
+    @pytest.mark.parametrize("ordering", ["id", "-status", "updated_at"])
+    def test_pages_follow_the_next_link(self, project: Project, user: CustomUser, ordering: str) -> None:
+        created: list[Task] = [
+            Task.objects.create(name=f"Task {index}", project=project, status=index % 3 + 1)
+            for index in range(5)
+        ]
+        expected: list[int] = ids(list_tasks(user, project, ordering=ordering, page_size=50))
+        assert sorted(expected) == sorted(task.id for task in created)
+
+        client: APIClient = APIClient()
+        client.force_authenticate(user)
+        response: Response = list_tasks(user, project, ordering=ordering, page_size=2)
+        seen: list[int] = ids(response)
+        while response.data["next"] is not None:
+            response = client.get(response.data["next"])
+            assert len(response.data["results"]) <= 2
+            seen += ids(response)
+        assert seen == expected
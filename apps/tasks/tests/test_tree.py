@@ -0,0 +1,169 @@
+# Python modules
+from typing import Any, Callable
+
+# Django modules
+from django.urls import reverse
+
+# Django REST Framework modules
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+# Pytest modules
+import pytest
+
+# Project modules
+from apps.auths.models import CustomUser
+from apps.tasks.models import Project, Task
+
+
+def create_chain(project: Project, length: int) -> list[Task]:
+    """Create tasks nested in each other, the first one is the root."""
+    tasks: list[Task] = []
+    index: int
+    for index in range(length):
+        tasks.append(
+            Task.objects.create(name=f"Level {index}", project=project, parent=tasks[-1] if tasks else None)
+        )
+    return tasks
+
+
+def move(user: CustomUser, task: Task, parent: Task | None) -> Response:
+    client: APIClient = APIClient()
+    client.force_authenticate(user)
+    return client.post(
+        reverse("task-move", kwargs={"pk": task.id}),
+        {"parent": parent.id if parent is not None else None},
+        format="json",
+    )
+
+
+class TestTreePosition:
+    def test_roots_and_children_get_path_and_depth(self, project: Project) -> None:
+        root, child, grandchild = create_chain(project, 3)
+
+        assert (root.path, root.depth) == ("", 0)
+        assert (child.path, child.depth) == (Task.build_path_segment(root.id), 1)
+        assert grandchild.path == Task.build_path_segment(root.id) + Task.build_path_segment(child.id)
+        assert grandchild.depth == 2
+        assert grandchild.ancestor_ids == [root.id, child.id]
+
+    def test_bulk_create_fills_paths_from_the_parents(self, project: Project) -> None:
+        root, child = create_chain(project, 2)
+
+        created: list[Task] = Task.objects.bulk_create([
+            Task(name="Under root", project=project, parent=root),
+            Task(name="Under child", project=project, parent=child),
+        ])
+
+        stored: dict[str, tuple[str, int]] = {
+            name: (path, depth)
+            for name, path, depth in Task.objects.filter(
+                id__in=[task.id for task in created],
+            ).values_list("name", "path", "depth")
+        }
+        assert stored["Under root"] == (root.subtree_prefix, 1)
+        assert stored["Under child"] == (child.subtree_prefix, 2)
+
+    def test_parent_from_another_project_is_rejected(
+        self,
+        project: Project,
+        project_factory: Callable[..., Project],
+        user: CustomUser,
+    ) -> None:
+        other: Task = Task.objects.create(name="Elsewhere", project=project_factory(author=user))
+        with pytest.raises(ValueError):
+            Task.objects.create(name="Child", project=project, parent=other)
+
+
+class TestTreeQueries:
+    def test_subtree_ancestors_and_descendant_counts(self, project: Project) -> None:
+        root, child, grandchild = create_chain(project, 3)
+        sibling: Task = Task.objects.create(name="Sibling", project=project, parent=root)
+
+        assert set(Task.objects.subtree(root).values_list("id", flat=True)) == {child.id, grandchild.id, sibling.id}
+        assert list(Task.objects.subtree(child).values_list("id", flat=True)) == [grandchild.id]
+        assert list(Task.objects.ancestors(grandchild).values_list("id", flat=True)) == [root.id, child.id]
+
+        counts: dict[int, int] = dict(Task.objects.with_descendants_count().values_list("id", "descendants_count"))
+        assert counts == {root.id: 3, child.id: 1, grandchild.id: 0, sibling.id: 0}
+
+    def test_subtree_range_stops_at_the_segment_boundary(self, project: Project) -> None:
+        # Ids 1 and 10 share the digits "1" and "10", only the padded segments tell them apart
+        first: Task = Task.objects.create(id=1, name="First", project=project)
+        tenth: Task = Task.objects.create(id=10, name="Tenth", project=project)
+        under_first: Task = Task.objects.create(name="Under first", project=project, parent=first)
+        under_tenth: Task = Task.objects.create(name="Under tenth", project=project, parent=tenth)
+        # A path whose first segment merely starts with the digits of first's segment
+        lookalike: Task = Task.objects.create(name="Lookalike", project=project)
+        Task.objects.filter(id=lookalike.id).update(path="00000000010/", depth=1)
+
+        assert first.subtree_prefix == "0000000001/"
+        assert list(Task.objects.subtree(first).values_list("id", flat=True)) == [under_first.id]
+        assert list(Task.objects.subtree(tenth).values_list("id", flat=True)) == [under_tenth.id]
+
+        counts: dict[int, int] = dict(Task.objects.with_descendants_count().values_list("id", "descendants_count"))
+        assert counts[first.id] == 1 and counts[tenth.id] == 1
+
+
+class TestMoveTask:
+    def test_move_rewrites_the_whole_subtree(self, project: Project, user: CustomUser) -> None:
+        root, child, grandchild, leaf = create_chain(project, 4)
+        target: Task = Task.objects.create(name="Target", project=project)
+        Task.objects.create(name="Under target", project=project, parent=target)
+
+        response: Response = move(user, child, target)
+        assert response.status_code == 200
+
+        rows: dict[int, tuple[str, int]] = {
+            task_id: (path, depth)
+            for task_id, path, depth in Task.objects.values_list("id", "path", "depth")
+        }
+        assert rows[child.id] == (target.subtree_prefix, 1)
+        assert rows[grandchild.id] == (target.subtree_prefix + Task.build_path_segment(child.id), 2)
+        assert rows[leaf.id] == (
+            target.subtree_prefix + Task.build_path_segment(child.id) + Task.build_path_segment(grandchild.id),
+            3,
+        )
+        assert not Task.objects.subtree(root).exists()
+        assert Task.objects.subtree(target).count() == 4
+
+    def test_move_to_the_root(self, project: Project, user: CustomUser) -> None:
+        root, child, grandchild = create_chain(project, 3)
+
+        assert move(user, child, None).status_code == 200
+        assert Task.objects.values_list("path", "depth").get(id=child.id) == ("", 0)
+        assert Task.objects.values_list("path", "depth").get(id=grandchild.id) == (Task.build_path_segment(child.id), 1)
+
+    @pytest.mark.parametrize("target_index", [1, 3])
+    def test_move_under_itself_or_a_descendant_is_rejected(
+        self,
+        project: Project,
+        user: CustomUser,
+        target_index: int,
+    ) -> None:
+        tasks: list[Task] = create_chain(project, 4)
+        paths: list[tuple[Any, ...]] = list(Task.objects.order_by("id").values_list("path", "depth"))
+
+        response: Response = move(user, tasks[1], tasks[target_index])
+        assert response.status_code == 400
+        assert "parent" in response.data
+        assert list(Task.objects.order_by("id").values_list("path", "depth")) == paths
+
+    def test_move_deeper_than_the_limit_is_rejected(
+        self,
+        project: Project,
+        user: CustomUser,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(Task, "MAX_DEPTH", 4)
+        chain: list[Task] = create_chain(project, 3)
+        other_root, other_child = create_chain(project, 2)
+
+        # Depths 0..2 plus a subtree two levels deep would end at depth 4
+        response: Response = move(user, other_root, chain[2])
+        assert response.status_code == 400
+        assert Task.objects.values_list("depth", flat=True).get(id=other_child.id) == 1
+
+        # The single task fits at depth 3
+        assert move(user, other_child, chain[2]).status_code == 200
+        assert Task.objects.values_list("depth", flat=True).get(id=other_child.id) == 3
@@ -5,7 +5,8 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 # Project modules
-from apps.tasks.views import ProjectViewSet
+from apps.tasks.async_views import AsyncProjectDetailView, AsyncProjectListView
+from apps.tasks.views import ArchivedTaskViewSet, ProjectViewSet, TaskViewSet
 
 
 router: DefaultRouter = DefaultRouter(
@@ -17,7 +18,20 @@ router.register(
     viewset=ProjectViewSet,
     basename="project",
 )
+router.register(
+    prefix="tasks",
+    viewset=TaskViewSet,
+    basename="task",
+)
+router.register(
+    prefix="archived-tasks",
+    viewset=ArchivedTaskViewSet,
+    basename="archived_task",
+)
 
 urlpatterns = [
+    # Served on the event loop under ASGI, same contracts as the ProjectViewSet actions
+    path("v1/async/projects", AsyncProjectListView.as_view(), name="project-async-list"),
+    path("v1/async/projects/<int:pk>", AsyncProjectDetailView.as_view(), name="project-async-detail"),
     path("v1/", include(router.urls)),
 ]
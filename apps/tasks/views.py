@@ -1,10 +1,15 @@
 # Python modules
-from typing import Any
+from typing import Any, Callable, Optional
+from collections import Counter, defaultdict
+from datetime import datetime
 
 # Django modules
+from django.conf import settings
 from django.shortcuts import render
-from django.http import HttpRequest, HttpResponse
-from django.db.models import QuerySet, Count
+from django.utils import timezone
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.db import router, transaction
+from django.db.models import QuerySet
 
 # Django REST Framework
 from rest_framework.viewsets import ViewSet
@@ -16,12 +21,28 @@ from rest_framework.status import (
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
     HTTP_400_BAD_REQUEST,
-    HTTP_404_NOT_FOUND,
 )
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 
 # Project modules
-from apps.tasks.models import Project, Task, UserTask
+from apps.abstracts.cache import response_cache
+from apps.abstracts.exports import ndjson_response
+from apps.abstracts.models import delete_rows
+from apps.abstracts.pagination import KeysetPaginator
+from apps.abstracts.replicas import ReplicaReadMixin
+from apps.tasks.caching import PROJECTS_SCOPE, invalidate_projects, project_scope
+from apps.tasks.counters import apply_task_status_deltas
+from apps.tasks.deletion import schedule_project_deletion
+from apps.tasks.membership import get_user_project_ids
+from apps.tasks.mixins import (
+    ProjectResolverMixin,
+    ProjectShardMixin,
+    TaskFilterMixin,
+    TaskResolverMixin,
+    TaskSearchMixin,
+)
+from apps.tasks.models import ArchivedTask, Project, Task, UserTask
 from apps.tasks.permissions import IsUserInProject
 from apps.tasks.serializers import (
     ProjectBaseSerializer,
@@ -29,7 +50,23 @@ from apps.tasks.serializers import (
     ProjectCreateSerializer,
     ProjectUpdateSerializer,
     TaskListSerializer,
+    TaskListQuerySerializer,
     TaskCreateSerializer,
+    TaskBulkCreateSerializer,
+    TaskBulkCreateListSerializer,
+    TaskBulkUpdateSerializer,
+    TaskTreeSerializer,
+    TaskChildSerializer,
+    TaskMoveSerializer,
+    ArchivedTaskSerializer,
+)
+from apps.tasks.sharding import (
+    is_sharding_enabled,
+    locate_projects,
+    project_shard,
+    reserve_project_id,
+    shard_map,
+    shard_querysets,
 )
 
 def hello_view(
@@ -61,14 +98,80 @@ def hello_view(
     )
 
 
-class ProjectViewSet(ViewSet):
+class ProjectViewSet(
+    ProjectShardMixin,
+    ReplicaReadMixin,
+    ProjectResolverMixin,
+    TaskFilterMixin,
+    TaskSearchMixin,
+    ViewSet,
+):
     """
     ViewSet for handling Project-related endpoints.
     """
 
     # permission_classes = (IsAuthenticated,)
     serializer_class = ProjectBaseSerializer
+    # Exports stream after the request's routing scope ended, they read from default
+    replica_read_actions = ("list", "retrieve", "get_tasks", "search_tasks", "archived_tasks")
+
+    def get_permissions(self) -> list[Any]:
+        """Only members may fetch a single project."""
+        if self.action == "retrieve":
+            return [IsAuthenticated(), IsUserInProject()]
+        return super().get_permissions()
+
+    def get_cached_data(
+        self,
+        request: DRFRequest,
+        endpoint: str,
+        scopes: tuple[str, ...],
+        compute: Callable[[], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """
+        Get response data from the response cache, computing it on a miss.
 
+        Parameters:
+            request: DRFRequest
+                The request object, its absolute URL varies the cache key.
+            endpoint: str
+                Name of the cached endpoint.
+            scopes: tuple[str, ...]
+                Invalidation scopes the response depends on.
+            compute: Callable
+                Producer of the response data.
+
+        Returns:
+            dict
+                Response data.
+        """
+        return response_cache.get_or_compute(
+            key=response_cache.build_key(
+                endpoint=endpoint,
+                scopes=scopes,
+                variant=request.build_absolute_uri(),
+            ),
+            compute=compute,
+        )
+
+    def get_list_queryset(self, context: dict[str, Any]) -> QuerySet[Project]:
+        """
+        Get the projects queryset used by the listing and export endpoints.
+
+        Parameters:
+            context: dict
+                Serializer context with the requested fieldset.
+
+        Returns:
+            QuerySet[Project]
+                Projects loading only what the fieldset needs, counters
+                are read from the stored columns.
+        """
+        return ProjectListSerializer.optimize_queryset(
+            queryset=Project.objects.all(),
+            context=context,
+            required_fields=("updated_at",),
+        )
 
     def list(
         self,
@@ -84,22 +187,70 @@ class ProjectViewSet(ViewSet):
                 The request object.
             *args: list
                 Additional positional arguments.
-                Additional positional arguments.
             **kwargs: dict
                 Additional keyword arguments.
         
         Returns:
             DRFResponse
-                A response containing list of projects.
+                A response containing a page of projects and the next page link.
+        """
+
+        def get_page_data() -> dict[str, Any]:
+            context: dict[str, Any] = ProjectListSerializer.get_fieldset_context(request)
+            projects: QuerySet[Project] = self.get_list_queryset(context=context)
+
+            paginator: KeysetPaginator = KeysetPaginator(
+                ordering=("-updated_at", "-id")
+            )
+            page: list[Project] = paginator.paginate_querysets(
+                querysets=shard_querysets(projects),
+                request=request
+            )
+
+            serializer: ProjectListSerializer = ProjectListSerializer(
+                page,
+                many=True,
+                context=context,
+            )
+            return paginator.get_paginated_data(
+                data=serializer.data
+            )
+
+        return DRFResponse(
+            data=self.get_cached_data(
+                request=request,
+                endpoint="projects.list",
+                scopes=(PROJECTS_SCOPE,),
+                compute=get_page_data,
+            ),
+            status=HTTP_200_OK
+        )
+
+    def retrieve(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
         """
+        Handle GET requests to fetch a project.
 
-        all_projects: QuerySet[Project] = Project.objects.select_related("author").annotate(
-            users_count=Count("users", distinct=True)
-        ).all()
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: list
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+
+        Returns:
+            DRFResponse
+                A response containing the project, "?fields=" and "?expand=" apply.
+        """
+        project: Project = self.get_project(
+            request=request,
+            pk=kwargs["pk"],
+            error_key="pk",
+        )
 
         serializer: ProjectListSerializer = ProjectListSerializer(
-            all_projects,
-            many=True
+            project,
+            context=ProjectListSerializer.get_fieldset_context(request),
         )
 
         return DRFResponse(
@@ -133,12 +284,15 @@ class ProjectViewSet(ViewSet):
                 status=HTTP_400_BAD_REQUEST
             )
         
-        serializer.save()
+        # With sharding the id and shard are known before the insert
+        project_id: Optional[int] = reserve_project_id()
+        with project_shard(project_id):
+            serializer.save(id=project_id)
 
-        return DRFResponse(
-            data=serializer.data,
-            status=HTTP_201_CREATED
-        )
+            return DRFResponse(
+                data=serializer.data,
+                status=HTTP_201_CREATED
+            )
 
     def partial_update(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
         """
@@ -156,15 +310,11 @@ class ProjectViewSet(ViewSet):
             DRFResponse
                 A response indicating the result of the update operation.
         """
-        try:
-            project: Project = Project.objects.get(id=kwargs["pk"])
-        except Project.DoesNotExist:
-            return DRFResponse(
-                data={
-                    "pk": [f"Project with id={kwargs['pk']} does not exist."]
-                },
-                status=HTTP_404_NOT_FOUND
-            )
+        project: Project = self.get_project(
+            request=request,
+            pk=kwargs["pk"],
+            error_key="pk",
+        )
 
         serializer: ProjectUpdateSerializer = ProjectUpdateSerializer(
             data=request.data,
@@ -185,6 +335,10 @@ class ProjectViewSet(ViewSet):
         """
         Handle DELETE requests to delete a project.
 
+        The project is soft deleted right away; its tasks and assignments
+        are tombstoned afterwards in batches (see apps.tasks.deletion),
+        so the request takes the same time for any project size.
+
         Parameters:
             request: DRFRequest
                 The request object.
@@ -197,17 +351,13 @@ class ProjectViewSet(ViewSet):
             DRFResponse
                 A response indicating the result of the deletion operation.
         """
-        try:
-            project: Project = Project.objects.get(id=kwargs["pk"])
-        except Project.DoesNotExist:
-            return DRFResponse(
-                data={
-                    "pk": [f"Project with id={kwargs['pk']} does not exist."]
-                },
-                status=HTTP_404_NOT_FOUND
-            )
+        project: Project = self.get_project(
+            request=request,
+            pk=kwargs["pk"],
+            error_key="pk",
+        )
 
-        project.delete()
+        schedule_project_deletion(project)
 
         return DRFResponse(
             status=HTTP_204_NO_CONTENT
@@ -233,28 +383,199 @@ class ProjectViewSet(ViewSet):
                 Additional keyword arguments.
         Returns:
             DRFResponse
-                A response containing list of tasks for the specified project.
+                A response containing a page of filtered tasks for the specified project.
         """
-        try:
-            project: Project = Project.objects.get(id=kwargs["pk"])
-        except Project.DoesNotExist:
-            return DRFResponse(
-                data={
-                    "id": [f"Project with id={kwargs['pk']} does not exist."]
-                },
-                status=HTTP_404_NOT_FOUND
+        project: Project = self.get_project(request=request, pk=kwargs["pk"])
+
+        query_serializer: TaskListQuerySerializer = TaskListQuerySerializer(
+            data=request.query_params
+        )
+        query_serializer.is_valid(raise_exception=True)
+        params: dict[str, Any] = query_serializer.validated_data
+
+        def get_page_data() -> dict[str, Any]:
+            ordering: tuple[str, ...] = TaskListQuerySerializer.ORDERINGS[params["ordering"]]
+            context: dict[str, Any] = TaskListSerializer.get_fieldset_context(request)
+
+            tasks: QuerySet[Task] = self.filter_tasks(
+                queryset=TaskListSerializer.optimize_queryset(
+                    queryset=Task.objects.filter(project_id=project.id),
+                    context=context,
+                    required_fields=[field.lstrip("-") for field in ordering],
+                ),
+                params=params,
             )
 
-        self.check_object_permissions(request=request, obj=project)
+            paginator: KeysetPaginator = KeysetPaginator(
+                ordering=ordering
+            )
+            page: list[Task] = paginator.paginate_queryset(
+                queryset=tasks,
+                request=request
+            )
+            return paginator.get_paginated_data(
+                data=TaskListSerializer(
+                    page,
+                    many=True,
+                    context=context,
+                ).data
+            )
 
         return DRFResponse(
-            data=TaskListSerializer(
-                project.tasks.prefetch_related("assignees").all(),
-                many=True,
-            ).data,
+            data=self.get_cached_data(
+                request=request,
+                endpoint="projects.tasks",
+                scopes=(project_scope(project.id),),
+                compute=get_page_data,
+            ),
             status=HTTP_200_OK
         )
 
+    @action(
+        methods=("GET",),
+        detail=False,
+        url_name="export",
+        url_path="export",
+    )
+    def export(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> StreamingHttpResponse:
+        """
+        Handle GET requests to stream all projects as NDJSON.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: list
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+        Returns:
+            StreamingHttpResponse
+                A response streaming one JSON document per project.
+        """
+        context: dict[str, Any] = ProjectListSerializer.get_fieldset_context(request)
+
+        return ndjson_response(
+            # One shard after the other, each by id
+            queryset=[
+                queryset.order_by("id")
+                for queryset in shard_querysets(self.get_list_queryset(context=context))
+            ],
+            serializer_class=ProjectListSerializer,
+            filename="projects.ndjson",
+            context=context,
+        )
+
+    @action(
+        methods=("GET",),
+        detail=True,
+        url_name="tasks_export",
+        url_path="tasks/export",
+    )
+    def export_tasks(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> StreamingHttpResponse:
+        """
+        Handle GET requests to stream the tasks of a specific project as NDJSON.
+
+        Accepts the same filters as the tasks listing; the ordering is
+        always by id and the whole result is streamed without pagination.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: list
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+        Returns:
+            StreamingHttpResponse
+                A response streaming one JSON document per task.
+        """
+        project: Project = self.get_project(request=request, pk=kwargs["pk"])
+
+        query_serializer: TaskListQuerySerializer = TaskListQuerySerializer(
+            data=request.query_params
+        )
+        query_serializer.is_valid(raise_exception=True)
+        context: dict[str, Any] = TaskListSerializer.get_fieldset_context(request)
+
+        tasks: QuerySet[Task] = self.filter_tasks(
+            queryset=TaskListSerializer.optimize_queryset(
+                queryset=Task.objects.filter(project_id=project.id),
+                context=context,
+            ),
+            params=query_serializer.validated_data,
+        )
+
+        return ndjson_response(
+            # Streamed after the shard scope of the request ended
+            queryset=tasks.using(router.db_for_read(Task)).order_by("id"),
+            serializer_class=TaskListSerializer,
+            filename=f"project-{project.id}-tasks.ndjson",
+            context=context,
+        )
+
+    @action(
+        methods=("GET",),
+        detail=True,
+        url_name="tasks_search",
+        url_path="tasks/search",
+        permission_classes=(IsAuthenticated, IsUserInProject,),
+    )
+    def search_tasks(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """
+        Handle GET requests to search the tasks of a specific project.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: list
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+        Returns:
+            DRFResponse
+                A cursor paginated response of ranked results with snippets.
+        """
+        project: Project = self.get_project(request=request, pk=kwargs["pk"])
+
+        return self.get_search_response(request=request, project_id=project.id)
+
+    @action(
+        methods=("GET",),
+        detail=True,
+        url_name="tasks_archived",
+        url_path="tasks/archived",
+        permission_classes=(IsAuthenticated, IsUserInProject,),
+    )
+    def archived_tasks(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """
+        Handle GET requests to list the archived tasks of a specific project.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: list
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+        Returns:
+            DRFResponse
+                A cursor paginated response of the archived tasks.
+        """
+        project: Project = self.get_project(request=request, pk=kwargs["pk"])
+
+        paginator: KeysetPaginator = KeysetPaginator(ordering=("id",))
+        page: list[ArchivedTask] = paginator.paginate_queryset(
+            queryset=ArchivedTask.objects.filter(
+                project_id=project.id,
+            ).prefetch_related("assignments"),
+            request=request,
+        )
+        serializer: ArchivedTaskSerializer = ArchivedTaskSerializer(
+            instance=page,
+            many=True,
+        )
+        return paginator.get_paginated_response(serializer.data)
+
     @action(
         methods=("POST",),
         detail=True,
@@ -277,17 +598,7 @@ class ProjectViewSet(ViewSet):
             DRFResponse
                 A response indicating the result of the task creation operation.
         """
-        try:
-            project: Project = Project.objects.get(id=kwargs["pk"])
-        except Project.DoesNotExist:
-            return DRFResponse(
-                data={
-                    "id": [f"Project with id={kwargs['pk']} does not exist."]
-                },
-                status=HTTP_404_NOT_FOUND
-            )
-
-        self.check_object_permissions(request=request, obj=project)
+        project: Project = self.get_project(request=request, pk=kwargs["pk"])
 
 
         serializer: TaskCreateSerializer = TaskCreateSerializer(
@@ -300,20 +611,483 @@ class ProjectViewSet(ViewSet):
 
         serializer.is_valid(raise_exception=True)
 
-        task: Task = serializer.save()
-        UserTask.objects.create(
-            task_id=task.id,
-            user_id=request.user.id,
-        )
+        with transaction.atomic(using=router.db_for_write(Task)):
+            task: Task = serializer.save()
+            UserTask.objects.create(
+                task=task,
+                user_id=request.user.id,
+            )
 
         return DRFResponse(
             data=serializer.data,
             status=HTTP_201_CREATED
         )
 
+    @action(
+        methods=("POST",),
+        detail=True,
+        url_name="tasks_bulk",
+        url_path="tasks/bulk",
+        permission_classes=(IsAuthenticated, IsUserInProject,),
+    )
+    def bulk_create_tasks(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """
+        Handle POST requests to create many tasks for a specific project.
+
+        The body is a list of task payloads. The batch is validated as a
+        whole (errors are reported per item, in input order) and then
+        inserted with bulk_create in a single transaction, together with
+        the creator's and assignees' UserTask rows.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: list
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+        Returns:
+            DRFResponse
+                A response containing the ids of the created tasks.
+        """
+        project: Project = self.get_project(request=request, pk=kwargs["pk"])
+
+        serializer: TaskBulkCreateListSerializer = TaskBulkCreateSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=settings.TASK_BULK_OPERATIONS["MAX_ITEMS"],
+            context={
+                "pk": project.id,
+                "request": request,
+            }
+        )
+        serializer.is_valid(raise_exception=True)
+        items: list[dict[str, Any]] = serializer.validated_data
+        batch_size: int = settings.TASK_BULK_OPERATIONS["BATCH_SIZE"]
+
+        with transaction.atomic(using=router.db_for_write(Task)):
+            tasks: list[Task] = Task.objects.bulk_create(
+                [
+                    Task(
+                        name=item["name"],
+                        description=item["description"],
+                        status=item["status"],
+                        parent_id=item.get("parent"),
+                        project_id=project.id,
+                    )
+                    for item in items
+                ],
+                batch_size=batch_size,
+            )
+            UserTask.objects.bulk_create(
+                [
+                    UserTask(task_id=task.id, user_id=user_id)
+                    for task, item in zip(tasks, items)
+                    for user_id in {request.user.id, *item["assignees"]}
+                ],
+                batch_size=batch_size,
+                ignore_conflicts=True,
+            )
+            # bulk_create sends no signals, apply their effects for the whole batch
+            apply_task_status_deltas(
+                project_id=project.id,
+                status_deltas=Counter(task.status for task in tasks),
+            )
+            invalidate_projects([project.id])
+
+        return DRFResponse(
+            data={
+                "count": len(tasks),
+                "ids": [task.id for task in tasks],
+            },
+            status=HTTP_201_CREATED
+        )
+
 
-class TaskViewSet(ViewSet):
+class TaskViewSet(ProjectShardMixin, TaskResolverMixin, TaskFilterMixin, TaskSearchMixin, ViewSet):
     """
     ViewSet for handling Task-related endpoints.
     """
-    pass
+
+    permission_classes = (IsAuthenticated,)
+    shard_model = Task
+
+    @action(
+        methods=("POST",),
+        detail=False,
+        url_name="bulk_update",
+        url_path="bulk-update",
+    )
+    def bulk_update(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """
+        Handle POST requests to change the status and assignees of many tasks.
+
+        Tasks are selected either by "ids" or by a "filter" on a single
+        project, both at most TASK_BULK_OPERATIONS["MAX_ITEMS"] tasks.
+        The caller must be a member of every touched project,
+        which is checked once for the whole selection. Status changes are
+        applied with a single UPDATE, assignments with bulk inserts and
+        deletes of UserTask rows.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: list
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+        Returns:
+            DRFResponse
+                A response containing the affected counts.
+        """
+        serializer: TaskBulkUpdateSerializer = TaskBulkUpdateSerializer(
+            data=request.data
+        )
+        serializer.is_valid(raise_exception=True)
+        data: dict[str, Any] = serializer.validated_data
+
+        tasks: QuerySet[Task]
+        if "ids" in data:
+            tasks = Task.objects.filter(id__in=data["ids"])
+        else:
+            tasks = self.filter_tasks(
+                queryset=Task.objects.filter(project_id=data["filter"]["project"]),
+                params=data["filter"],
+            )
+
+        batch_size: int = settings.TASK_BULK_OPERATIONS["BATCH_SIZE"]
+        result: dict[str, int] = {
+            "matched": 0,
+            "status_updated": 0,
+            "assigned": 0,
+            "unassigned": 0,
+        }
+
+        # With sharding the selected tasks must share a database, the transaction spans one
+        shard_project_id: Optional[int] = None
+        if is_sharding_enabled():
+            selected_project_ids: set[int] = (
+                {data["filter"]["project"]} if "filter" in data else locate_projects(Task, data["ids"])
+            )
+            if len({shard_map.get_placement(project_id)[0] for project_id in selected_project_ids}) > 1:
+                raise ValidationError(
+                    detail={"ids": ["Tasks of projects stored in different databases can not be updated at once."]}
+                )
+            shard_project_id = next(iter(selected_project_ids), None)
+
+        with project_shard(shard_project_id), transaction.atomic(using=router.db_for_write(Task)):
+            # "ids" is capped by the serializer, a filter is cut one row past the cap
+            max_items: int = settings.TASK_BULK_OPERATIONS["MAX_ITEMS"]
+            rows: list[tuple[int, int, int]] = list(
+                tasks.order_by().values_list("id", "project_id", "status")[:max_items + 1]
+            )
+            project_ids: set[int] = {project_id for _, project_id, _ in rows}
+            if not project_ids <= get_user_project_ids(user_id=request.user.id, request=request):
+                raise PermissionDenied(IsUserInProject.message)
+            if len(rows) > max_items:
+                raise ValidationError(
+                    detail={"filter": [f"The filter matches more than {max_items} tasks, narrow it down."]}
+                )
+
+            task_ids: list[int] = [task_id for task_id, _, _ in rows]
+            result["matched"] = len(task_ids)
+            # The filter may depend on the columns being changed, so every
+            # step works on the ids materialized above, a batch at a time
+            batches: list[list[int]] = [
+                task_ids[start:start + batch_size]
+                for start in range(0, len(task_ids), batch_size)
+            ]
+
+            if "status" in data:
+                status: int = data["status"]
+                deltas: dict[int, Counter[int]] = defaultdict(Counter)
+                for _, project_id, old_status in rows:
+                    if old_status != status:
+                        deltas[project_id][old_status] -= 1
+                        deltas[project_id][status] += 1
+
+                now: datetime = timezone.now()
+                batch: list[int]
+                for batch in batches:
+                    result["status_updated"] += Task.objects.filter(
+                        id__in=batch,
+                    ).exclude(
+                        status=status,
+                    ).update(
+                        status=status,
+                        updated_at=now,
+                    )
+                for project_id, status_deltas in deltas.items():
+                    apply_task_status_deltas(project_id=project_id, status_deltas=status_deltas)
+
+            if data["assign"]:
+                for batch in batches:
+                    # Only the missing pairs are inserted, they are the assigned count.
+                    # SQLite refuses the insert if another writer changed the
+                    # database since this read, instead of counting a conflict
+                    assigned: set[tuple[int, int]] = set(
+                        UserTask.objects.filter(
+                            task_id__in=batch,
+                            user_id__in=data["assign"],
+                        ).values_list("task_id", "user_id")
+                    )
+                    new_user_tasks: list[UserTask] = [
+                        UserTask(task_id=task_id, user_id=user_id)
+                        for task_id in batch
+                        for user_id in data["assign"]
+                        if (task_id, user_id) not in assigned
+                    ]
+                    UserTask.objects.bulk_create(new_user_tasks, batch_size=batch_size)
+                    result["assigned"] += len(new_user_tasks)
+
+            if data["unassign"]:
+                using: str = router.db_for_write(UserTask)
+                for batch in batches:
+                    # A single DELETE, per row deletion signals would cost a query each
+                    result["unassigned"] += delete_rows(
+                        UserTask.objects.filter(
+                            task_id__in=batch,
+                            user_id__in=data["unassign"],
+                        ),
+                        using=using,
+                    )
+
+            invalidate_projects(project_ids)
+
+        return DRFResponse(
+            data=result,
+            status=HTTP_200_OK
+        )
+
+    @action(
+        methods=("GET",),
+        detail=False,
+        url_name="search",
+        url_path="search",
+    )
+    def search(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """
+        Handle GET requests to search the tasks of every project of the caller.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: list
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+        Returns:
+            DRFResponse
+                A cursor paginated response of ranked results with snippets.
+        """
+        return self.get_search_response(request=request, member_id=request.user.id)
+
+    @action(
+        methods=("GET",),
+        detail=True,
+        url_name="subtree",
+        url_path="subtree",
+        permission_classes=(IsAuthenticated, IsUserInProject,),
+    )
+    def subtree(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """
+        Handle GET requests to list every descendant of a task.
+
+        The descendants are a single range scan of the materialized path
+        index. Pages are ordered by path, so every task comes after its
+        parent and siblings are grouped together.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: list
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+        Returns:
+            DRFResponse
+                A cursor paginated response of the descendants.
+        """
+        task: Task = self.get_task(request=request, pk=kwargs["pk"])
+
+        paginator: KeysetPaginator = KeysetPaginator(ordering=("path", "id"))
+        page: list[Task] = paginator.paginate_queryset(
+            queryset=Task.objects.subtree(task).only(*TaskTreeSerializer.Meta.fields, "path"),
+            request=request,
+        )
+        serializer: TaskTreeSerializer = TaskTreeSerializer(
+            instance=page,
+            many=True,
+        )
+        return paginator.get_paginated_response(serializer.data)
+
+    @action(
+        methods=("GET",),
+        detail=True,
+        url_name="ancestors",
+        url_path="ancestors",
+        permission_classes=(IsAuthenticated, IsUserInProject,),
+    )
+    def ancestors(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """
+        Handle GET requests to list the ancestors of a task (breadcrumbs).
+
+        The ancestor ids are read from the task's path, so they are
+        fetched by primary key in one query.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: list
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+        Returns:
+            DRFResponse
+                A response containing the ancestors from the root down.
+        """
+        task: Task = self.get_task(request=request, pk=kwargs["pk"])
+
+        serializer: TaskTreeSerializer = TaskTreeSerializer(
+            instance=Task.objects.ancestors(task).only(*TaskTreeSerializer.Meta.fields),
+            many=True,
+        )
+        return DRFResponse(
+            data=serializer.data,
+            status=HTTP_200_OK
+        )
+
+    @action(
+        methods=("GET",),
+        detail=True,
+        url_name="children",
+        url_path="children",
+        permission_classes=(IsAuthenticated, IsUserInProject,),
+    )
+    def children(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """
+        Handle GET requests to list the direct children of a task.
+
+        Every child carries the number of its own descendants, counted
+        by a correlated subquery in the same query.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: list
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+        Returns:
+            DRFResponse
+                A cursor paginated response of the children.
+        """
+        task: Task = self.get_task(request=request, pk=kwargs["pk"])
+
+        paginator: KeysetPaginator = KeysetPaginator(ordering=("id",))
+        page: list[Task] = paginator.paginate_queryset(
+            queryset=Task.objects.filter(
+                project_id=task.project_id,
+                parent_id=task.id,
+            ).only(
+                *TaskTreeSerializer.Meta.fields, "path", "project_id",
+            ).with_descendants_count(),
+            request=request,
+        )
+        serializer: TaskChildSerializer = TaskChildSerializer(
+            instance=page,
+            many=True,
+        )
+        return paginator.get_paginated_response(serializer.data)
+
+    @action(
+        methods=("POST",),
+        detail=True,
+        url_name="move",
+        url_path="move",
+        permission_classes=(IsAuthenticated, IsUserInProject,),
+    )
+    def move(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """
+        Handle POST requests to move a task (with its subtree) to a new parent.
+
+        Moving under the task itself or one of its descendants is
+        rejected by comparing paths; the descendants are rewritten by a
+        single UPDATE.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: list
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+        Returns:
+            DRFResponse
+                A response containing the moved task.
+        """
+        with transaction.atomic(using=router.db_for_write(Task)):
+            task: Task = self.get_task(
+                request=request,
+                pk=kwargs["pk"],
+                queryset=Task.objects.select_for_update(),
+            )
+            serializer: TaskMoveSerializer = TaskMoveSerializer(
+                data=request.data,
+                context={
+                    "task": task,
+                    "request": request,
+                }
+            )
+            serializer.is_valid(raise_exception=True)
+
+            task.parent = serializer.validated_data["parent"]
+            task.save(update_fields=["parent", "updated_at"])
+
+        return DRFResponse(
+            data=TaskTreeSerializer(instance=task).data,
+            status=HTTP_200_OK
+        )
+
+
+class ArchivedTaskViewSet(ProjectShardMixin, ViewSet):
+    """
+    ViewSet for handling ArchivedTask-related endpoints.
+    """
+
+    permission_classes = (IsAuthenticated, IsUserInProject,)
+    shard_model = ArchivedTask
+
+    def retrieve(self, request: DRFRequest, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> DRFResponse:
+        """
+        Handle GET requests to fetch an archived task by its original id.
+
+        Parameters:
+            request: DRFRequest
+                The request object.
+            *args: list
+                Additional positional arguments.
+            **kwargs: dict
+                Additional keyword arguments.
+        Returns:
+            DRFResponse
+                A response containing the archived task.
+        """
+        try:
+            task: ArchivedTask = ArchivedTask.objects.prefetch_related(
+                "assignments"
+            ).get(id=kwargs["pk"])
+        except (ArchivedTask.DoesNotExist, ValueError):
+            raise NotFound(
+                detail={
+                    "pk": [f"Archived task with id={kwargs['pk']} does not exist."]
+                }
+            )
+
+        self.check_object_permissions(request=request, obj=task.project_id)
+
+        return DRFResponse(
+            data=ArchivedTaskSerializer(instance=task).data,
+            status=HTTP_200_OK
+        )
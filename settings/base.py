@@ -13,6 +13,10 @@ ROOT_URLCONF = 'settings.urls'
 WSGI_APPLICATION = 'settings.wsgi.application'
 ASGI_APPLICATION = "settings.asgi.application"
 AUTH_USER_MODEL = "auths.CustomUser"
+DATABASE_ROUTERS = [
+    "apps.tasks.sharding.ProjectShardRouter",
+    "apps.abstracts.replicas.ReplicaRouter",
+]
 
 # ----------------------------------------------
 # Apps
@@ -26,10 +30,12 @@ DJANGO_AND_THIRD_PARTY_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'rest_framework_simplejwt',
+]
+# Installed by settings.env.local only
+DEV_TOOLS_APPS = [
     'drf_spectacular',
     'debug_toolbar',
     'django_extensions',
-    
 ]
 PROJECT_APPS = [
     "apps.tasks.apps.TasksConfig",
@@ -43,13 +49,13 @@ INSTALLED_APPS = DJANGO_AND_THIRD_PARTY_APPS + PROJECT_APPS
 #
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'apps.abstracts.replicas.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'debug_toolbar.middleware.DebugToolbarMiddleware',
 ]
 TEMPLATES = [
     {
@@ -81,6 +87,24 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# ----------------------------------------------
+# Caches
+#
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Shared by every worker process on the host
+    "shared": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.path.join(BASE_DIR, ".cache", "shared"),
+        "TIMEOUT": 300,
+        "OPTIONS": {
+            "MAX_ENTRIES": 20000,
+        },
+    },
+}
+
 # ----------------------------------------------
 # Internationalization
 #
@@ -96,6 +120,7 @@ STATIC_URL = "static/"
 STATIC_ROOT = os.path.join(BASE_DIR, 'static')
 MEDIA_URL = "media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+OPENAPI_SCHEMA_DIR = os.path.join(BASE_DIR, 'openapi')
 
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
@@ -1,5 +1,5 @@
 # Project modules
-from decouple import config
+from decouple import Csv, config
 from datetime import timedelta
 
 # ----------------------------------------------
@@ -18,9 +18,179 @@ SECRET_KEY = config("SECRET_KEY", cast=str)
 REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.AllowAny"],
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.auths.authentication.CachedJWTAuthentication",
     ),
-    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+}
+
+# ----------------------------------------------
+# Keyset pagination
+#
+KEYSET_PAGINATION = {
+    "PAGE_SIZE": config("KEYSET_PAGE_SIZE", default=50, cast=int),
+    "MAX_PAGE_SIZE": config("KEYSET_MAX_PAGE_SIZE", default=200, cast=int),
+}
+
+# ----------------------------------------------
+# NDJSON exports
+#
+NDJSON_EXPORT_CHUNK_SIZE = config("NDJSON_EXPORT_CHUNK_SIZE", default=2000, cast=int)
+
+# ----------------------------------------------
+# Response cache
+#
+RESPONSE_CACHE = {
+    "ALIAS": "shared",
+    "TIMEOUT": config("RESPONSE_CACHE_TIMEOUT", default=300, cast=int),
+    "LOCAL_MAX_ENTRIES": config("RESPONSE_CACHE_LOCAL_MAX_ENTRIES", default=1000, cast=int),
+    "LOCK_TIMEOUT": 10,
+    "LOCK_WAIT": 5.0,
+    "LOCK_POLL_INTERVAL": 0.02,
+}
+
+# ----------------------------------------------
+# Project membership cache
+#
+PROJECT_MEMBERSHIP_CACHE = {
+    "ALIAS": "shared",
+    "TIMEOUT": config("PROJECT_MEMBERSHIP_CACHE_TIMEOUT", default=600, cast=int),
+}
+
+# ----------------------------------------------
+# Bulk task operations
+#
+TASK_BULK_OPERATIONS = {
+    "MAX_ITEMS": config("TASK_BULK_MAX_ITEMS", default=5000, cast=int),
+    "BATCH_SIZE": config("TASK_BULK_BATCH_SIZE", default=500, cast=int),
+}
+
+# ----------------------------------------------
+# Cascading project deletion
+#
+PROJECT_DELETION = {
+    "BATCH_SIZE": config("PROJECT_DELETION_BATCH_SIZE", default=1000, cast=int),
+    # Run the cascade in a background thread right after the request commits,
+    # otherwise only the "runprojectdeletions" command processes the jobs
+    "RUN_IN_BACKGROUND": config("PROJECT_DELETION_RUN_IN_BACKGROUND", default=True, cast=bool),
+    # Seconds without progress after which a running job may be taken over
+    "STALE_AFTER": config("PROJECT_DELETION_STALE_AFTER", default=300, cast=int),
+    # Runs of the background thread failing on a locked database are retried,
+    # after RETRY_BACKOFF seconds doubled on every attempt
+    "RETRIES": config("PROJECT_DELETION_RETRIES", default=5, cast=int),
+    "RETRY_BACKOFF": config("PROJECT_DELETION_RETRY_BACKOFF", default=0.5, cast=float),
+}
+
+# ----------------------------------------------
+# Task archival and purge retention
+#
+TASK_ARCHIVE = {
+    # Done tasks untouched for this many days move to the archive tables
+    "DONE_AFTER_DAYS": config("TASK_ARCHIVE_DONE_AFTER_DAYS", default=90, cast=int),
+    # Soft deleted tasks and assignments older than this are removed for good
+    "PURGE_DELETED_AFTER_DAYS": config("TASK_ARCHIVE_PURGE_DELETED_AFTER_DAYS", default=30, cast=int),
+    "BATCH_SIZE": config("TASK_ARCHIVE_BATCH_SIZE", default=500, cast=int),
+}
+
+# ----------------------------------------------
+# User typeahead lookup
+#
+USER_LOOKUP = {
+    "LIMIT": config("USER_LOOKUP_LIMIT", default=10, cast=int),
+    "MAX_LIMIT": config("USER_LOOKUP_MAX_LIMIT", default=50, cast=int),
+    # Best ranked index matches joined with the users table, bounds the cost of very short queries
+    "CANDIDATES": config("USER_LOOKUP_CANDIDATES", default=1000, cast=int),
+}
+
+# ----------------------------------------------
+# Password hashing of the async login
+#
+PASSWORD_HASHING = {
+    # Hashes running at once per process, further logins wait in the queue
+    "MAX_WORKERS": config("PASSWORD_HASHING_MAX_WORKERS", default=4, cast=int),
+}
+
+# ----------------------------------------------
+# JWT authentication caches (per process)
+#
+JWT_AUTH_CACHE = {
+    # Verified tokens, each kept until its "exp"
+    "TOKEN_MAX_ENTRIES": config("JWT_AUTH_CACHE_TOKEN_MAX_ENTRIES", default=10000, cast=int),
+    "USER_MAX_ENTRIES": config("JWT_AUTH_CACHE_USER_MAX_ENTRIES", default=1000, cast=int),
+    # Bounds how long other processes keep a changed user
+    "USER_TIMEOUT": config("JWT_AUTH_CACHE_USER_TIMEOUT", default=60, cast=int),
+    # Issue access tokens with email/full_name so requests need no user query.
+    # Opt-in: such a token keeps the identity of login time and is accepted
+    # for a deactivated or deleted user until it expires (ACCESS_TOKEN_LIFETIME)
+    "EMBED_IDENTITY_CLAIMS": config("JWT_AUTH_EMBED_IDENTITY_CLAIMS", default=False, cast=bool),
+}
+
+# ----------------------------------------------
+# Access token revocation (per worker filter over RevokedToken)
+#
+TOKEN_REVOCATION = {
+    # 8 KiB filter, about 2% false positives with 5000 live revocations
+    "BLOOM_BITS": config("TOKEN_REVOCATION_BLOOM_BITS", default=65536, cast=int),
+    "BLOOM_HASHES": config("TOKEN_REVOCATION_BLOOM_HASHES", default=4, cast=int),
+    # Seconds before a revocation made in another worker applies
+    "REFRESH_INTERVAL": config("TOKEN_REVOCATION_REFRESH_INTERVAL", default=1.0, cast=float),
+}
+
+# ----------------------------------------------
+# SQLite tuning (applied where a database sets "PRAGMAS")
+#
+SQLITE_PRAGMAS = {
+    # Milliseconds a connection waits for a lock before "database is locked"
+    "busy_timeout": config("SQLITE_BUSY_TIMEOUT", default=5000, cast=int),
+    # Readers no longer block the writer and the other way round
+    "journal_mode": config("SQLITE_JOURNAL_MODE", default="WAL"),
+    # Durable across crashes in WAL mode, fsync on checkpoints only
+    "synchronous": config("SQLITE_SYNCHRONOUS", default="NORMAL"),
+    # Bytes of the file read through mmap
+    "mmap_size": config("SQLITE_MMAP_SIZE", default=256 * 1024 * 1024, cast=int),
+    # Negative values are KiB, per connection
+    "cache_size": config("SQLITE_CACHE_SIZE", default=-64000, cast=int),
+    "temp_store": config("SQLITE_TEMP_STORE", default="MEMORY"),
+}
+SQLITE_CONNECTIONS = {
+    # Seconds a connection is reused across requests, 0 reconnects per request
+    "CONN_MAX_AGE": config("SQLITE_CONN_MAX_AGE", default=600, cast=int),
+    "CONN_HEALTH_CHECKS": config("SQLITE_CONN_HEALTH_CHECKS", default=True, cast=bool),
+}
+
+# ----------------------------------------------
+# Read replicas (DATABASES entries with "REPLICA": True)
+#
+DATABASE_REPLICAS = {
+    # SQLite files of the replicas, a copy of the primary works, see syncreplicas
+    "NAMES": config("DATABASE_REPLICA_NAMES", default="", cast=Csv()),
+    # Seconds a client reads from the primary after a write
+    "STICKY_SECONDS": config("DATABASE_REPLICAS_STICKY_SECONDS", default=5, cast=int),
+    "COOKIE_NAME": "primary_reads_until",
+}
+
+# ----------------------------------------------
+# Project sharding (DATABASES entries with "SHARD": True)
+#
+PROJECT_SHARDING = {
+    # SQLite files of the shards besides default, none disables sharding
+    "NAMES": config("PROJECT_SHARD_NAMES", default="", cast=Csv()),
+    # Ids reserved per process and model at once
+    "ID_BLOCK_SIZE": config("PROJECT_SHARDING_ID_BLOCK_SIZE", default=100, cast=int),
+    # Seconds a process trusts a cached shard map entry
+    "MAP_CACHE_TIMEOUT": config("PROJECT_SHARDING_MAP_CACHE_TIMEOUT", default=5.0, cast=float),
+    "MAP_CACHE_MAX_ENTRIES": config("PROJECT_SHARDING_MAP_CACHE_MAX_ENTRIES", default=10000, cast=int),
+    # Rows copied or deleted per transaction by rebalanceproject
+    "REBALANCE_BATCH_SIZE": config("PROJECT_SHARDING_REBALANCE_BATCH_SIZE", default=500, cast=int),
+}
+
+# ----------------------------------------------
+# Startup budget, checked by the checkstartup command
+#
+STARTUP_BUDGET = {
+    # Import time of a worker until it can serve its first request
+    "MAX_IMPORT_MS": config("STARTUP_MAX_IMPORT_MS", default=800, cast=int),
+    # Mean cost of the middleware chain per request
+    "MAX_MIDDLEWARE_US": config("STARTUP_MAX_MIDDLEWARE_US", default=500, cast=int),
+    "MIDDLEWARE_REQUESTS": 500,
 }
 
 # ----------------------------------------------
@@ -72,6 +242,15 @@ SPECTACULAR_SETTINGS = {
     "SERVE_INCLUDE_SCHEMA": False,
 }
 
+# ----------------------------------------------
+# OpenAPI schema artifact, written by the buildschema command
+#
+OPENAPI_SCHEMA = {
+    # Inside OPENAPI_SCHEMA_DIR, one file per API version
+    "FILENAME": f"schema-{SPECTACULAR_SETTINGS['VERSION']}.json",
+    "CACHE_MAX_AGE": config("OPENAPI_SCHEMA_CACHE_MAX_AGE", default=3600, cast=int),
+}
+
 # ----------------------------------------------
 # Debug Toolbar
 #
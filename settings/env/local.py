@@ -8,10 +8,41 @@ INTERNAL_IPS = [
     "127.0.0.1",
 ]
 
+# Development tools, production does not import them
+INSTALLED_APPS = INSTALLED_APPS + DEV_TOOLS_APPS
+MIDDLEWARE = MIDDLEWARE + [
+    'debug_toolbar.middleware.DebugToolbarMiddleware',
+]
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+}
+
 
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': 'db.sqlite3',
     },
-}
\ No newline at end of file
+}
+
+# Read replicas, routed by apps.abstracts.replicas.ReplicaRouter
+DATABASES.update({
+    f"replica_{index}": {
+        **DATABASES["default"],
+        'NAME': name,
+        'REPLICA': True,
+        'TEST': {'MIRROR': 'default'},
+    }
+    for index, name in enumerate(DATABASE_REPLICAS["NAMES"], start=1)
+})
+
+# Project shards, routed by apps.tasks.sharding.ProjectShardRouter
+DATABASES.update({
+    f"shard_{index}": {
+        **DATABASES["default"],
+        'NAME': name,
+        'SHARD': True,
+    }
+    for index, name in enumerate(PROJECT_SHARDING["NAMES"], start=1)
+})
@@ -9,5 +9,30 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': 'db.sqlite3',
+        'CONN_MAX_AGE': SQLITE_CONNECTIONS["CONN_MAX_AGE"],
+        'CONN_HEALTH_CHECKS': SQLITE_CONNECTIONS["CONN_HEALTH_CHECKS"],
+        # Applied on connect by apps.abstracts.sqlite.apply_sqlite_pragmas
+        'PRAGMAS': SQLITE_PRAGMAS,
     },
-}
\ No newline at end of file
+}
+
+# Read replicas, routed by apps.abstracts.replicas.ReplicaRouter
+DATABASES.update({
+    f"replica_{index}": {
+        **DATABASES["default"],
+        'NAME': name,
+        'REPLICA': True,
+        'TEST': {'MIRROR': 'default'},
+    }
+    for index, name in enumerate(DATABASE_REPLICAS["NAMES"], start=1)
+})
+
+# Project shards, routed by apps.tasks.sharding.ProjectShardRouter
+DATABASES.update({
+    f"shard_{index}": {
+        **DATABASES["default"],
+        'NAME': name,
+        'SHARD': True,
+    }
+    for index, name in enumerate(PROJECT_SHARDING["NAMES"], start=1)
+})
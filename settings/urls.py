@@ -4,20 +4,16 @@ from rest_framework_simplejwt.views import (
     TokenRefreshView,
     TokenVerifyView,
 )
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularSwaggerView,
-    SpectacularRedocView,
-)
-from debug_toolbar.toolbar import debug_toolbar_urls
 
 # Django modules
+from django.apps import apps
 from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
 # Project modules
+from apps.abstracts.views import openapi_schema_view
 from apps.tasks.views import hello_view
 
 urlpatterns = [
@@ -28,9 +24,24 @@ urlpatterns = [
     path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('api/token/verify/', TokenVerifyView.as_view(), name='token_verify'),
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
-    path('api/schema/swagger-ui/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
-    path('api/schema/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
-]+ debug_toolbar_urls()
+    path('api/schema/', openapi_schema_view, name='schema'),
+]
+
+# Development tools, imported only by the settings installing them
+if apps.is_installed("drf_spectacular"):
+    from drf_spectacular.views import (
+        SpectacularSwaggerView,
+        SpectacularRedocView,
+    )
+
+    urlpatterns += [
+        path('api/schema/swagger-ui/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
+        path('api/schema/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
+    ]
+
+if apps.is_installed("debug_toolbar"):
+    from debug_toolbar.toolbar import debug_toolbar_urls
+
+    urlpatterns += debug_toolbar_urls()
 
-urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
\ No newline at end of file
+urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)